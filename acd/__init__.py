@@ -4,75 +4,199 @@ import sys
 _cache = {}
 
 __all__ = [
+    'ADT_PATTERN',
     'ADT_REGEX',
     'AtaNumbering',
+    'BREX_CACHE_DIR',
     'BrexChecker',
     'BrexNotFound',
     'CGM2CLEARCGM',
     'CGM2SVG',
+    'CONVERSION_TIMEOUT',
     'COUNTRY_IDS',
+    'CmmDocument',
     'ConsumablesList',
     'ConsumablesValidator',
+    'ConversionError',
+    'ConversionTimeout',
     'CsnChecker',
     'DELAY_DICT',
+    'DELIVERY_LIST_ITEM_PATTERN',
     'DELIVERY_LIST_ITEM_REGEX',
+    'DM_ADDRESS_PATTERN',
     'DM_ADDRESS_REGEX',
+    'DM_REF_PATTERN',
     'DM_REF_REGEX',
+    'DOCUMENT_CACHE_SIZE',
+    'DOCX_OPERATIONS',
+    'DOCX_PART_REGEX',
     'DictError',
+    'DocxPackage',
     'ENCODINGS',
+    'ENTITIES_PATH',
     'FCChecker',
     'FILEPATH',
+    'FILE_HASH_CHUNK_SIZE',
     'FUNC_DICT',
     'GREEK_CHARS',
     'GraphicRefChecker',
     'IMG_EXT',
     'INKSCAPE',
     'IPLChecker',
+    'IPLNOM_PATTERN',
     'IPLNOM_REGEX',
+    'IPL_INDEX_CACHE_SIZE',
+    'IPL_ITEM_TAGS',
+    'ITEMDATA_PATTERN',
     'ITEMDATA_REGEX',
+    'ITEMNBR_PATTERN',
     'ITEMNBR_REGEX',
+    'ITEMNUMBER_VALUES_PATTERN',
     'ITEMNUMBER_VALUES_REGEX',
+    'IplIndex',
+    'IplItem',
+    'KWD_PATTERN',
     'KWD_REGEX',
     'LINE_TYPES',
+    'LibreOfficeConverter',
+    'LineIndex',
+    'MFR_PATTERN',
     'MFR_REGEX',
+    'MsWordConverter',
+    'NO_ITEMNUMBER_VALUES_PATTERN',
     'NO_ITEMNUMBER_VALUES_REGEX',
     'NS_DICT',
     'NoBrexDefined',
     'NoExcelSet',
     'NoOriginalTableFound',
     'NoXmlSet',
+    'OCR_BATCH_SIZE',
+    'OCR_CHECKPOINT_SOURCE',
+    'OCR_CHECKPOINT_SUFFIX',
+    'OCR_DPI',
     'OLD_TO_NEW',
+    'OR_ITEMNUMBER_VALUES_PATTERN',
     'OR_ITEMNUMBER_VALUES_REGEX',
     'PAGEBLOCKS',
+    'PAGE_NUMBER_PATTERN',
+    'PDF_CHUNK_SIZE',
+    'PDF_LINE_MAX_HEIGHT',
+    'PDF_PAGE_ENGINES',
+    'PDF_PARALLEL_MIN_PAGES',
+    'PDF_SCAN_COLUMNS',
+    'PDF_SCAN_ENGINES',
+    'PDF_TEXT_CACHE_DIR',
+    'PDF_TEXT_CHECK_PAGES',
+    'PNR_PATTERN',
     'PNR_REGEX',
     'POPPLER_PATH',
+    'PdfPages',
     'Punctuation',
+    'RASTER_BATCH_SIZE',
+    'RASTER_DPI',
+    'RASTER_FORMATS',
+    'RESULT_STORE_PATH',
+    'ROW_ARRAY_MODES',
+    'ROW_IMAGE_EXTENSIONS',
+    'ROW_MATCH_CANDIDATE',
     'RefChecker',
     'RepairSteps',
+    'ResultStore',
+    'S1000DRepository',
+    'S1000D_ADDRESS_TAGS',
+    'S1000D_CODE_TAGS',
+    'S1000D_OLD_CODE_TAGS',
+    'S1000D_REF_TAGS',
+    'S1000D_VERSION_PATTERN',
     'S1000D_VERSION_REGEX',
+    'SCHEMA_CACHE_DIR',
+    'SCHEMA_CACHE_SIZE',
+    'SMG_ACTOR_NAME_PATTERN',
+    'SMG_ACTOR_NAME_REGEX',
+    'SOFFICE_PATHS',
+    'STARTUP_TIMEOUT',
+    'STE_DICT_COLUMNS',
+    'STE_DICT_ROW_MARKER',
+    'STE_OCR_CONFIG',
+    'STE_ROW_TEMPLATES',
+    'STP_PRODUCT_PATTERN',
+    'STP_PRODUCT_REGEX',
     'SVG_ELEMENT_REGEX',
     'SVG_HEIGHT_REGEX',
     'SVG_WIDTH_REGEX',
+    'SchemaCatalogResolver',
     'TIFF_COMPRESSION',
+    'TORQUE_VALUES_PATTERN',
     'TORQUE_VALUES_REGEX',
     'TorqueValuesValidator',
     'UiLoader',
     'UnitTable',
+    'UnknownDocxOperation',
     'UnrecognizedUnit',
     'VENDOR_EXCEPTIONS',
     'VER_REGEX_1',
     'VendorList',
+    'WORD_CONVERTERS',
     'WORD_EXTENSIONS',
     'WORD_NS',
+    'WordConverter',
     'Worker',
     'WorkerSignals',
+    'XML_ENTITIES',
     'XmlSchemaValidator',
     '__check_line_widths',
+    '_add_iplnom_to_smg_file',
+    '_add_iplnom_to_smg_worker',
+    '_add_iplnom_to_stp_file',
+    '_add_iplnom_to_stp_worker',
+    '_adjust_column_widths_xml',
+    '_apply_docx_operation',
+    '_check_ddn',
+    '_check_references',
+    '_checkpoint_path',
+    '_compiled',
+    '_copy_zip_entry',
+    '_element_text',
+    '_export_docx_reports',
+    '_extract_page_range',
+    '_extract_table_page',
     '_filter_widgets',
+    '_init_brex_worker',
+    '_init_iplnom_worker',
+    '_init_schema_worker',
+    '_init_table_worker',
     '_ipl_to_dict_excel',
+    '_kill_process_group',
+    '_load_row_template',
+    '_ocr_cell',
+    '_ocr_pdf_batch',
+    '_ocr_text_batch',
+    '_page_batches',
+    '_page_count',
+    '_page_ranges',
+    '_pdf2raster_file',
+    '_pdf_page_count',
+    '_prepare_checkpoints',
+    '_read_document',
+    '_read_smg_xml',
+    '_ref_from_element',
+    '_run_batches',
+    '_scan_pdf_fitz',
+    '_scan_pdf_pikepdf',
+    '_scan_pdf_pypdf',
+    '_ste_row_cells',
+    '_to_markup',
+    '_validate_brex_worker',
+    '_validate_schema_worker',
+    '_white_run_ends',
+    '_write_pdf_scan',
     'add_filename_version',
     'add_iplnom_to_smg',
+    'add_iplnom_to_smg_content',
+    'add_iplnom_to_smgs',
     'add_iplnom_to_stp',
+    'add_iplnom_to_stp_content',
+    'add_iplnom_to_stps',
     'add_leading',
     'adjust_column_widths',
     'baselineReportFilter',
@@ -104,10 +228,12 @@ __all__ = [
     'compress_img',
     'cons_and_teds_checker',
     'convert_image_to_pdf',
+    'convert_word_files',
     'copy_files',
     'copy_pdf_column',
     'count_lines_of_functions',
     'crop_image',
+    'default_backend',
     'delete_filename_version',
     'delete_first_line',
     'docx_content_replace',
@@ -116,10 +242,15 @@ __all__ = [
     'download_excel',
     'driver',
     'estimate_illustration',
+    'extract_pdf_table',
     'extract_rows_from_page',
+    'extract_rows_from_pages',
+    'extract_s1000d_info',
     'fill',
     'find_characters',
     'find_document_by_reference',
+    'find_ipl_entry',
+    'find_soffice',
     'format_excel',
     'fourDigits',
     'getContent',
@@ -128,26 +259,37 @@ __all__ = [
     'get_average_color',
     'get_brex_ref',
     'get_chrome_driver_version',
+    'get_compiled_schema',
     'get_ddn',
     'get_dm_code_from_filename',
     'get_dm_code_from_xml',
     'get_dm_codes_from_dir',
+    'get_entities',
     'get_excel_sheet_names',
     'get_extensions',
+    'get_file_hash',
     'get_file_size',
     'get_font_types',
     'get_footer_type',
+    'get_horizontal_lines',
+    'get_local_schema',
     'get_manual_series',
     'get_object_attributes',
     'get_object_methods',
     'get_ocr_pdf_content',
+    'get_pattern',
     'get_pdf_content',
     'get_pdf_metadata',
+    'get_pdf_pages',
+    'get_rect_text',
     'get_references',
+    'get_regex',
     'get_regex_string',
     'get_s1000d_refs',
     'get_s1000d_version',
     'get_schema_from_xml',
+    'get_schema_hash',
+    'get_selector',
     'get_svg_data',
     'get_table_column_widths',
     'get_template_version',
@@ -162,14 +304,18 @@ __all__ = [
     'include_search_bar',
     'increase_filename_version',
     'increase_issue_number',
+    'inject_entities',
     'ipl_to_dict',
     'is_fullpage_illu',
+    'iter_ipl_items',
+    'iter_pdf_pages',
     'linePrepend',
     'linearize_xml',
     'list_files',
     'list_files2',
     'list_files3',
     'load_ui',
+    'locate_rows',
     'make_library',
     'merge_pdfs',
     'negative',
@@ -185,6 +331,8 @@ __all__ = [
     'prepare_estimation',
     'preprocess_svg',
     'prettyPrint',
+    'process_docx',
+    'process_docx_folder',
     'raster2pdf',
     'rbg2hex',
     'read_description',
@@ -199,6 +347,10 @@ __all__ = [
     'replace_media',
     'replace_special_characters',
     'resize_img',
+    'scan_pdf',
+    'scan_pdfs',
+    'search_group',
+    'search_groups',
     'service',
     'set_inwork',
     'set_xml_attribute',
@@ -207,6 +359,7 @@ __all__ = [
     'simple_pretty_print',
     'startTime',
     'ste_dict_rows',
+    'ste_dictionary',
     'string_similarity',
     'stroke',
     'strokeWidth',
@@ -225,6 +378,7 @@ __all__ = [
     'update_footer_table_widths',
     'validate_ddn',
     'validate_references',
+    'validate_repository',
     'validate_word',
     'word2pdf',
     'word_frequency',
@@ -238,75 +392,199 @@ def __getattr__(name):
     if name in _cache:
         return _cache[name]
     modules = {
+        'ADT_PATTERN': 'constants',
         'ADT_REGEX': 'constants',
         'AtaNumbering': 'ataispec2200',
+        'BREX_CACHE_DIR': 'brex_checker',
         'BrexChecker': 'brex_checker',
         'BrexNotFound': 'brex_checker',
         'CGM2CLEARCGM': 'cgm2clearcgm',
         'CGM2SVG': 'cgm2svg',
+        'CONVERSION_TIMEOUT': 'word_converters',
         'COUNTRY_IDS': 'vendor_list',
+        'CmmDocument': 'cmm_document',
         'ConsumablesList': 'consTableValidator',
         'ConsumablesValidator': 'ataispec2200',
+        'ConversionError': 'word_converters',
+        'ConversionTimeout': 'word_converters',
         'CsnChecker': 'reference_checker',
         'DELAY_DICT': 'extract_rows',
+        'DELIVERY_LIST_ITEM_PATTERN': 'constants',
         'DELIVERY_LIST_ITEM_REGEX': 'constants',
+        'DM_ADDRESS_PATTERN': 'constants',
         'DM_ADDRESS_REGEX': 'constants',
+        'DM_REF_PATTERN': 'constants',
         'DM_REF_REGEX': 'constants',
+        'DOCUMENT_CACHE_SIZE': 'cmm_document',
+        'DOCX_OPERATIONS': 'docx_',
+        'DOCX_PART_REGEX': 'docx_',
         'DictError': 'consTableValidator',
+        'DocxPackage': 'docx_',
         'ENCODINGS': 'txt',
+        'ENTITIES_PATH': 'cmm_document',
         'FCChecker': 'fits_and_clearences_checker',
         'FILEPATH': 'reference_checker',
+        'FILE_HASH_CHUNK_SIZE': 'file_info',
         'FUNC_DICT': 'constants',
         'GREEK_CHARS': 'txt',
         'GraphicRefChecker': 'reference_checker',
         'IMG_EXT': 'constants',
         'INKSCAPE': 'svg2pdf',
         'IPLChecker': 'procedure_checker',
+        'IPLNOM_PATTERN': 'constants',
         'IPLNOM_REGEX': 'constants',
+        'IPL_INDEX_CACHE_SIZE': 'ipl',
+        'IPL_ITEM_TAGS': 'ipl',
+        'ITEMDATA_PATTERN': 'constants',
         'ITEMDATA_REGEX': 'constants',
+        'ITEMNBR_PATTERN': 'constants',
         'ITEMNBR_REGEX': 'constants',
+        'ITEMNUMBER_VALUES_PATTERN': 'constants',
         'ITEMNUMBER_VALUES_REGEX': 'constants',
+        'IplIndex': 'ipl',
+        'IplItem': 'ipl',
+        'KWD_PATTERN': 'constants',
         'KWD_REGEX': 'constants',
         'LINE_TYPES': 'clearcgm2svg',
+        'LibreOfficeConverter': 'word_converters',
+        'LineIndex': 'brex_checker',
+        'MFR_PATTERN': 'constants',
         'MFR_REGEX': 'constants',
+        'MsWordConverter': 'word_converters',
+        'NO_ITEMNUMBER_VALUES_PATTERN': 'constants',
         'NO_ITEMNUMBER_VALUES_REGEX': 'constants',
         'NS_DICT': 'brex_checker',
         'NoBrexDefined': 'brex_checker',
         'NoExcelSet': 'consTableValidator',
         'NoOriginalTableFound': 'consTableValidator',
         'NoXmlSet': 'ataispec2200',
+        'OCR_BATCH_SIZE': 'ocr_pdf',
+        'OCR_CHECKPOINT_SOURCE': 'ocr_pdf',
+        'OCR_CHECKPOINT_SUFFIX': 'ocr_pdf',
+        'OCR_DPI': 'ocr_pdf',
         'OLD_TO_NEW': 'constants',
+        'OR_ITEMNUMBER_VALUES_PATTERN': 'constants',
         'OR_ITEMNUMBER_VALUES_REGEX': 'constants',
         'PAGEBLOCKS': 'estimation',
+        'PAGE_NUMBER_PATTERN': 'extract_rows',
+        'PDF_CHUNK_SIZE': 'pdf',
+        'PDF_LINE_MAX_HEIGHT': 'pdf',
+        'PDF_PAGE_ENGINES': 'pdf',
+        'PDF_PARALLEL_MIN_PAGES': 'pdf',
+        'PDF_SCAN_COLUMNS': 'pdf',
+        'PDF_SCAN_ENGINES': 'pdf',
+        'PDF_TEXT_CACHE_DIR': 'pdf',
+        'PDF_TEXT_CHECK_PAGES': 'pdf',
+        'PNR_PATTERN': 'constants',
         'PNR_REGEX': 'constants',
         'POPPLER_PATH': 'pdf2raster',
+        'PdfPages': 'pdf',
         'Punctuation': 'xml_validation',
+        'RASTER_BATCH_SIZE': 'pdf2raster',
+        'RASTER_DPI': 'pdf2raster',
+        'RASTER_FORMATS': 'pdf2raster',
+        'RESULT_STORE_PATH': 'result_store',
+        'ROW_ARRAY_MODES': 'extract_rows',
+        'ROW_IMAGE_EXTENSIONS': 'extract_rows',
+        'ROW_MATCH_CANDIDATE': 'extract_rows',
         'RefChecker': 'reference_checker',
         'RepairSteps': 'repair_steps',
+        'ResultStore': 'result_store',
+        'S1000DRepository': 's1000d',
+        'S1000D_ADDRESS_TAGS': 'constants',
+        'S1000D_CODE_TAGS': 'constants',
+        'S1000D_OLD_CODE_TAGS': 'constants',
+        'S1000D_REF_TAGS': 'constants',
+        'S1000D_VERSION_PATTERN': 'constants',
         'S1000D_VERSION_REGEX': 'constants',
+        'SCHEMA_CACHE_DIR': 'xml_validation',
+        'SCHEMA_CACHE_SIZE': 'xml_validation',
+        'SMG_ACTOR_NAME_PATTERN': 'constants',
+        'SMG_ACTOR_NAME_REGEX': 'constants',
+        'SOFFICE_PATHS': 'word_converters',
+        'STARTUP_TIMEOUT': 'word_converters',
+        'STE_DICT_COLUMNS': 'constants',
+        'STE_DICT_ROW_MARKER': 'constants',
+        'STE_OCR_CONFIG': 'extract_rows',
+        'STE_ROW_TEMPLATES': 'extract_rows',
+        'STP_PRODUCT_PATTERN': 'constants',
+        'STP_PRODUCT_REGEX': 'constants',
         'SVG_ELEMENT_REGEX': 'estimation',
         'SVG_HEIGHT_REGEX': 'estimation',
         'SVG_WIDTH_REGEX': 'estimation',
+        'SchemaCatalogResolver': 'xml_validation',
         'TIFF_COMPRESSION': 'constants',
+        'TORQUE_VALUES_PATTERN': 'constants',
         'TORQUE_VALUES_REGEX': 'constants',
         'TorqueValuesValidator': 'ataispec2200',
         'UiLoader': 'utils',
         'UnitTable': 'unit_table',
+        'UnknownDocxOperation': 'docx_',
         'UnrecognizedUnit': 'unit_table',
         'VENDOR_EXCEPTIONS': 'vendor_list',
         'VER_REGEX_1': 'filename_version',
         'VendorList': 'vendor_list',
+        'WORD_CONVERTERS': 'word_converters',
         'WORD_EXTENSIONS': 'docx_',
         'WORD_NS': 'docx_',
+        'WordConverter': 'word_converters',
         'Worker': 'multi',
         'WorkerSignals': 'multi',
+        'XML_ENTITIES': 'brex_checker',
         'XmlSchemaValidator': 'xml_validation',
         '__check_line_widths': 'svg_checks',
+        '_add_iplnom_to_smg_file': 'smg',
+        '_add_iplnom_to_smg_worker': 'smg',
+        '_add_iplnom_to_stp_file': 'stp',
+        '_add_iplnom_to_stp_worker': 'stp',
+        '_adjust_column_widths_xml': 'docx_',
+        '_apply_docx_operation': 'docx_',
+        '_check_ddn': 's1000d',
+        '_check_references': 's1000d',
+        '_checkpoint_path': 'ocr_pdf',
+        '_compiled': 'patterns',
+        '_copy_zip_entry': 'docx_',
+        '_element_text': 'ipl',
+        '_export_docx_reports': 'docx_',
+        '_extract_page_range': 'pdf',
+        '_extract_table_page': 'pdf',
         '_filter_widgets': 'search_bar',
+        '_init_brex_worker': 'brex_checker',
+        '_init_iplnom_worker': 'smg',
+        '_init_schema_worker': 'xml_validation',
+        '_init_table_worker': 'pdf',
         '_ipl_to_dict_excel': 'ataispec2200',
+        '_kill_process_group': 'word_converters',
+        '_load_row_template': 'extract_rows',
+        '_ocr_cell': 'extract_rows',
+        '_ocr_pdf_batch': 'ocr_pdf',
+        '_ocr_text_batch': 'ocr_pdf',
+        '_page_batches': 'ocr_pdf',
+        '_page_count': 'ocr_pdf',
+        '_page_ranges': 'pdf2raster',
+        '_pdf2raster_file': 'pdf2raster',
+        '_pdf_page_count': 'pdf',
+        '_prepare_checkpoints': 'ocr_pdf',
+        '_read_document': 's1000d',
+        '_read_smg_xml': 'smg',
+        '_ref_from_element': 's1000d',
+        '_run_batches': 'ocr_pdf',
+        '_scan_pdf_fitz': 'pdf',
+        '_scan_pdf_pikepdf': 'pdf',
+        '_scan_pdf_pypdf': 'pdf',
+        '_ste_row_cells': 'extract_rows',
+        '_to_markup': 'ipl',
+        '_validate_brex_worker': 'brex_checker',
+        '_validate_schema_worker': 'xml_validation',
+        '_white_run_ends': 'extract_rows',
+        '_write_pdf_scan': 'pdf',
         'add_filename_version': 'filename_version',
         'add_iplnom_to_smg': 'smg',
+        'add_iplnom_to_smg_content': 'smg',
+        'add_iplnom_to_smgs': 'smg',
         'add_iplnom_to_stp': 'stp',
+        'add_iplnom_to_stp_content': 'stp',
+        'add_iplnom_to_stps': 'stp',
         'add_leading': 'txt',
         'adjust_column_widths': 'docx_',
         'baselineReportFilter': 'illustrations_checker',
@@ -338,10 +616,12 @@ def __getattr__(name):
         'compress_img': 'graphics',
         'cons_and_teds_checker': 'ataispec2200',
         'convert_image_to_pdf': 'raster2pdf',
+        'convert_word_files': 'word_converters',
         'copy_files': 'copying',
         'copy_pdf_column': 'extract_rows',
         'count_lines_of_functions': 'python_func',
         'crop_image': 'graphics',
+        'default_backend': 'word_converters',
         'delete_filename_version': 'filename_version',
         'delete_first_line': 'xml_processing',
         'docx_content_replace': 'docx_',
@@ -350,10 +630,15 @@ def __getattr__(name):
         'download_excel': 'excel_',
         'driver': 'get_inspect_element_html',
         'estimate_illustration': 'estimation',
+        'extract_pdf_table': 'pdf',
         'extract_rows_from_page': 'extract_rows',
+        'extract_rows_from_pages': 'extract_rows',
+        'extract_s1000d_info': 's1000d',
         'fill': 'clearcgm2svg',
         'find_characters': 'txt',
         'find_document_by_reference': 's1000d',
+        'find_ipl_entry': 'ipl',
+        'find_soffice': 'word_converters',
         'format_excel': 'excel_',
         'fourDigits': 'clearcgm2svg',
         'getContent': 'clearcgm2svg',
@@ -362,26 +647,37 @@ def __getattr__(name):
         'get_average_color': 'graphics',
         'get_brex_ref': 's1000d',
         'get_chrome_driver_version': 'vendor_list',
+        'get_compiled_schema': 'xml_validation',
         'get_ddn': 's1000d',
         'get_dm_code_from_filename': 's1000d',
         'get_dm_code_from_xml': 's1000d',
         'get_dm_codes_from_dir': 's1000d',
+        'get_entities': 'cmm_document',
         'get_excel_sheet_names': 'excel_',
         'get_extensions': 'filelist',
+        'get_file_hash': 'file_info',
         'get_file_size': 'file_info',
         'get_font_types': 'clearcgm2svg',
         'get_footer_type': 'docx_',
+        'get_horizontal_lines': 'pdf',
+        'get_local_schema': 'xml_validation',
         'get_manual_series': 'make_library',
         'get_object_attributes': 'python_func',
         'get_object_methods': 'python_func',
         'get_ocr_pdf_content': 'ocr_pdf',
+        'get_pattern': 'brex_checker',
         'get_pdf_content': 'pdf',
         'get_pdf_metadata': 'pdf',
+        'get_pdf_pages': 'pdf',
+        'get_rect_text': 'pdf',
         'get_references': 's1000d',
+        'get_regex': 'patterns',
         'get_regex_string': 'docx_',
         'get_s1000d_refs': 's1000d',
         'get_s1000d_version': 's1000d',
         'get_schema_from_xml': 'xml_processing',
+        'get_schema_hash': 'xml_validation',
+        'get_selector': 'brex_checker',
         'get_svg_data': 'svg_data',
         'get_table_column_widths': 'docx_',
         'get_template_version': 'docx_',
@@ -396,14 +692,18 @@ def __getattr__(name):
         'include_search_bar': 'search_bar',
         'increase_filename_version': 'filename_version',
         'increase_issue_number': 's1000d',
+        'inject_entities': 'cmm_document',
         'ipl_to_dict': 'ataispec2200',
         'is_fullpage_illu': 'estimation',
+        'iter_ipl_items': 'ipl',
+        'iter_pdf_pages': 'pdf',
         'linePrepend': 'clearcgm2svg',
         'linearize_xml': 'xml_processing',
         'list_files': 'filelist',
         'list_files2': 'filelist',
         'list_files3': 'filelist',
         'load_ui': 'utils',
+        'locate_rows': 'extract_rows',
         'make_library': 'make_library',
         'merge_pdfs': 'pdf',
         'negative': 'graphics',
@@ -419,6 +719,8 @@ def __getattr__(name):
         'prepare_estimation': 'estimation',
         'preprocess_svg': 'clearcgm2svg',
         'prettyPrint': 'clearcgm2svg',
+        'process_docx': 'docx_',
+        'process_docx_folder': 'docx_',
         'raster2pdf': 'raster2pdf',
         'rbg2hex': 'clearcgm2svg',
         'read_description': 's1000d',
@@ -433,6 +735,10 @@ def __getattr__(name):
         'replace_media': 'docx_',
         'replace_special_characters': 'xml_processing',
         'resize_img': 'graphics',
+        'scan_pdf': 'pdf',
+        'scan_pdfs': 'pdf',
+        'search_group': 'patterns',
+        'search_groups': 'patterns',
         'service': 'get_inspect_element_html',
         'set_inwork': 's1000d',
         'set_xml_attribute': 'xml_processing',
@@ -441,6 +747,7 @@ def __getattr__(name):
         'simple_pretty_print': 'python_func',
         'startTime': 'extract_rows_buildexe_global',
         'ste_dict_rows': 'extract_rows',
+        'ste_dictionary': 'extract_rows',
         'string_similarity': 'txt',
         'stroke': 'clearcgm2svg',
         'strokeWidth': 'clearcgm2svg',
@@ -459,6 +766,7 @@ def __getattr__(name):
         'update_footer_table_widths': 'docx_',
         'validate_ddn': 's1000d',
         'validate_references': 's1000d',
+        'validate_repository': 's1000d',
         'validate_word': 'txt',
         'word2pdf': 'docx_',
         'word_frequency': 'txt',
@@ -15,11 +15,18 @@ from .ataispec2200 import ipl_to_dict
 from .ataispec2200 import pgblk_9000_ted_checker
 from .batcher import batch
 from .batcher import rename_illustrations
+from .brex_checker import BREX_CACHE_DIR
 from .brex_checker import BrexChecker
 from .brex_checker import BrexNotFound
+from .brex_checker import LineIndex
 from .brex_checker import NS_DICT
 from .brex_checker import NoBrexDefined
+from .brex_checker import XML_ENTITIES
+from .brex_checker import _init_brex_worker
+from .brex_checker import _validate_brex_worker
 from .brex_checker import clean_xpath
+from .brex_checker import get_pattern
+from .brex_checker import get_selector
 from .cgm2clearcgm import CGM2CLEARCGM
 from .cgm2clearcgm import cgm2svgclear
 from .cgm2svg import CGM2SVG
@@ -43,6 +50,12 @@ from .clearcgm2svg import svgPolyline
 from .clearcgm2svg import svgText
 from .clearcgm2svg import threeDigits
 from .clearcgm2svg import twoDigits
+from .cmm_document import CmmDocument
+from .cmm_document import DOCUMENT_CACHE_SIZE
+from .cmm_document import ENTITIES_PATH
+from .cmm_document import FILEPATH
+from .cmm_document import get_entities
+from .cmm_document import inject_entities
 from .combinations import columns
 from .combinations import combinations_of_columns
 from .combinations import combinations_of_columns
@@ -52,29 +65,62 @@ from .consTableValidator import DictError
 from .consTableValidator import FILEPATH
 from .consTableValidator import NoExcelSet
 from .consTableValidator import NoOriginalTableFound
+from .constants import ADT_PATTERN
 from .constants import ADT_REGEX
+from .constants import DELIVERY_LIST_ITEM_PATTERN
 from .constants import DELIVERY_LIST_ITEM_REGEX
+from .constants import DM_ADDRESS_PATTERN
 from .constants import DM_ADDRESS_REGEX
+from .constants import DM_REF_PATTERN
 from .constants import DM_REF_REGEX
 from .constants import FUNC_DICT
 from .constants import IMG_EXT
+from .constants import IPLNOM_PATTERN
 from .constants import IPLNOM_REGEX
+from .constants import ITEMDATA_PATTERN
 from .constants import ITEMDATA_REGEX
+from .constants import ITEMNBR_PATTERN
 from .constants import ITEMNBR_REGEX
+from .constants import ITEMNUMBER_VALUES_PATTERN
 from .constants import ITEMNUMBER_VALUES_REGEX
+from .constants import KWD_PATTERN
 from .constants import KWD_REGEX
+from .constants import MFR_PATTERN
 from .constants import MFR_REGEX
+from .constants import NO_ITEMNUMBER_VALUES_PATTERN
 from .constants import NO_ITEMNUMBER_VALUES_REGEX
 from .constants import OLD_TO_NEW
+from .constants import OR_ITEMNUMBER_VALUES_PATTERN
 from .constants import OR_ITEMNUMBER_VALUES_REGEX
+from .constants import PNR_PATTERN
 from .constants import PNR_REGEX
+from .constants import S1000D_ADDRESS_TAGS
+from .constants import S1000D_CODE_TAGS
+from .constants import S1000D_OLD_CODE_TAGS
+from .constants import S1000D_REF_TAGS
+from .constants import S1000D_VERSION_PATTERN
 from .constants import S1000D_VERSION_REGEX
+from .constants import SMG_ACTOR_NAME_PATTERN
+from .constants import SMG_ACTOR_NAME_REGEX
+from .constants import STE_DICT_COLUMNS
+from .constants import STE_DICT_ROW_MARKER
+from .constants import STP_PRODUCT_PATTERN
+from .constants import STP_PRODUCT_REGEX
 from .constants import TIFF_COMPRESSION
+from .constants import TORQUE_VALUES_PATTERN
 from .constants import TORQUE_VALUES_REGEX
 from .copying import copy_files
 from .data_extraction import clean_word
+from .docx_ import DOCX_OPERATIONS
+from .docx_ import DOCX_PART_REGEX
+from .docx_ import DocxPackage
+from .docx_ import UnknownDocxOperation
 from .docx_ import WORD_EXTENSIONS
 from .docx_ import WORD_NS
+from .docx_ import _adjust_column_widths_xml
+from .docx_ import _apply_docx_operation
+from .docx_ import _copy_zip_entry
+from .docx_ import _export_docx_reports
 from .docx_ import adjust_column_widths
 from .docx_ import docx_content_replace
 from .docx_ import docx_footer_replace
@@ -83,6 +129,8 @@ from .docx_ import get_footer_type
 from .docx_ import get_regex_string
 from .docx_ import get_table_column_widths
 from .docx_ import get_template_version
+from .docx_ import process_docx
+from .docx_ import process_docx_folder
 from .docx_ import read_word_footers
 from .docx_ import replace_copyright
 from .docx_ import replace_media
@@ -100,12 +148,27 @@ from .excel_ import download_excel
 from .excel_ import format_excel
 from .excel_ import get_excel_sheet_names
 from .extract_rows import DELAY_DICT
+from .extract_rows import PAGE_NUMBER_PATTERN
+from .extract_rows import ROW_ARRAY_MODES
+from .extract_rows import ROW_IMAGE_EXTENSIONS
+from .extract_rows import ROW_MATCH_CANDIDATE
+from .extract_rows import STE_OCR_CONFIG
+from .extract_rows import STE_ROW_TEMPLATES
+from .extract_rows import _load_row_template
+from .extract_rows import _ocr_cell
+from .extract_rows import _ste_row_cells
+from .extract_rows import _white_run_ends
 from .extract_rows import copy_pdf_column
 from .extract_rows import extract_rows_from_page
+from .extract_rows import extract_rows_from_pages
+from .extract_rows import locate_rows
 from .extract_rows import pdf_page_to_img
 from .extract_rows import pdf_to_dictionary
 from .extract_rows import ste_dict_rows
+from .extract_rows import ste_dictionary
 from .extract_rows_buildexe_global import startTime
+from .file_info import FILE_HASH_CHUNK_SIZE
+from .file_info import get_file_hash
 from .file_info import get_file_size
 from .filelist import get_extensions
 from .filelist import list_files
@@ -139,18 +202,70 @@ from .illustration_checks import illu_date_check
 from .illustrations_checker import FILEPATH
 from .illustrations_checker import baselineReportFilter
 from .illustrations_checker import illustrationChecker
+from .ipl import IPL_INDEX_CACHE_SIZE
+from .ipl import IPL_ITEM_TAGS
+from .ipl import IplIndex
+from .ipl import IplItem
+from .ipl import _element_text
+from .ipl import _to_markup
+from .ipl import find_ipl_entry
+from .ipl import iter_ipl_items
 from .make_library import get_manual_series
 from .make_library import make_library
 from .multi import Worker
 from .multi import WorkerSignals
+from .ocr_pdf import OCR_BATCH_SIZE
+from .ocr_pdf import OCR_CHECKPOINT_SOURCE
+from .ocr_pdf import OCR_CHECKPOINT_SUFFIX
+from .ocr_pdf import OCR_DPI
 from .ocr_pdf import POPPLER_PATH
+from .ocr_pdf import _checkpoint_path
+from .ocr_pdf import _ocr_pdf_batch
+from .ocr_pdf import _ocr_text_batch
+from .ocr_pdf import _page_batches
+from .ocr_pdf import _page_count
+from .ocr_pdf import _prepare_checkpoints
+from .ocr_pdf import _run_batches
 from .ocr_pdf import get_ocr_pdf_content
 from .ocr_pdf import ocr_pdf
+from .patterns import _compiled
+from .patterns import get_regex
+from .patterns import search_group
+from .patterns import search_groups
+from .pdf import PDF_CHUNK_SIZE
+from .pdf import PDF_LINE_MAX_HEIGHT
+from .pdf import PDF_PAGE_ENGINES
+from .pdf import PDF_PARALLEL_MIN_PAGES
+from .pdf import PDF_SCAN_COLUMNS
+from .pdf import PDF_SCAN_ENGINES
+from .pdf import PDF_TEXT_CACHE_DIR
+from .pdf import PDF_TEXT_CHECK_PAGES
+from .pdf import PdfPages
+from .pdf import _extract_page_range
+from .pdf import _extract_table_page
+from .pdf import _init_table_worker
+from .pdf import _pdf_page_count
+from .pdf import _scan_pdf_fitz
+from .pdf import _scan_pdf_pikepdf
+from .pdf import _scan_pdf_pypdf
+from .pdf import _write_pdf_scan
+from .pdf import extract_pdf_table
+from .pdf import get_horizontal_lines
 from .pdf import get_pdf_content
 from .pdf import get_pdf_metadata
+from .pdf import get_pdf_pages
+from .pdf import get_rect_text
+from .pdf import iter_pdf_pages
 from .pdf import merge_pdfs
 from .pdf import pdf_page_count
+from .pdf import scan_pdf
+from .pdf import scan_pdfs
 from .pdf2raster import POPPLER_PATH
+from .pdf2raster import RASTER_BATCH_SIZE
+from .pdf2raster import RASTER_DPI
+from .pdf2raster import RASTER_FORMATS
+from .pdf2raster import _page_ranges
+from .pdf2raster import _pdf2raster_file
 from .pdf2raster import pdf2raster
 from .procedure_checker import FILEPATH
 from .procedure_checker import IPLChecker
@@ -168,6 +283,14 @@ from .reference_checker import RefChecker
 from .repair_steps import FILEPATH
 from .repair_steps import RepairSteps
 from .repair_steps import clean_xml_tags
+from .result_store import RESULT_STORE_PATH
+from .result_store import ResultStore
+from .s1000d import S1000DRepository
+from .s1000d import _check_ddn
+from .s1000d import _check_references
+from .s1000d import _read_document
+from .s1000d import _ref_from_element
+from .s1000d import extract_s1000d_info
 from .s1000d import find_document_by_reference
 from .s1000d import get_2and3_refs
 from .s1000d import get_4plus_refs
@@ -189,10 +312,22 @@ from .s1000d import ref_dict_to_xml
 from .s1000d import set_inwork
 from .s1000d import validate_ddn
 from .s1000d import validate_references
+from .s1000d import validate_repository
 from .search_bar import _filter_widgets
 from .search_bar import include_search_bar
+from .smg import _add_iplnom_to_smg_file
+from .smg import _add_iplnom_to_smg_worker
+from .smg import _init_iplnom_worker
+from .smg import _read_smg_xml
 from .smg import add_iplnom_to_smg
+from .smg import add_iplnom_to_smg_content
+from .smg import add_iplnom_to_smgs
+from .stp import _add_iplnom_to_stp_file
+from .stp import _add_iplnom_to_stp_worker
+from .stp import _init_iplnom_worker
 from .stp import add_iplnom_to_stp
+from .stp import add_iplnom_to_stp_content
+from .stp import add_iplnom_to_stps
 from .svg2jpg import svg2jpg
 from .svg2pdf import INKSCAPE
 from .svg2pdf import svg2pdf
@@ -226,6 +361,19 @@ from .vendor_list import VENDOR_EXCEPTIONS
 from .vendor_list import VendorList
 from .vendor_list import get_chrome_driver_version
 from .vendor_list import update_chrome_driver
+from .word_converters import CONVERSION_TIMEOUT
+from .word_converters import ConversionError
+from .word_converters import ConversionTimeout
+from .word_converters import LibreOfficeConverter
+from .word_converters import MsWordConverter
+from .word_converters import SOFFICE_PATHS
+from .word_converters import STARTUP_TIMEOUT
+from .word_converters import WORD_CONVERTERS
+from .word_converters import WordConverter
+from .word_converters import _kill_process_group
+from .word_converters import convert_word_files
+from .word_converters import default_backend
+from .word_converters import find_soffice
 from .xml_processing import delete_first_line
 from .xml_processing import get_schema_from_xml
 from .xml_processing import get_xml_attribute
@@ -235,4 +383,12 @@ from .xml_processing import replace_special_characters
 from .xml_processing import set_xml_attribute
 from .xml_processing import set_xml_tag_content
 from .xml_validation import Punctuation
+from .xml_validation import SCHEMA_CACHE_DIR
+from .xml_validation import SCHEMA_CACHE_SIZE
+from .xml_validation import SchemaCatalogResolver
 from .xml_validation import XmlSchemaValidator
+from .xml_validation import _init_schema_worker
+from .xml_validation import _validate_schema_worker
+from .xml_validation import get_compiled_schema
+from .xml_validation import get_local_schema
+from .xml_validation import get_schema_hash
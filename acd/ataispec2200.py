@@ -36,19 +36,16 @@ else:
     from PySide2.QtWidgets import QMainWindow
     from PySide2.QtCore import Signal
 
+from .cmm_document import CmmDocument
+from .cmm_document import inject_entities
 from .xml_processing import linearize_xml
 from .xml_processing import delete_first_line
-from .constants import TORQUE_VALUES_REGEX
-from .constants import ITEMNUMBER_VALUES_REGEX
-from .constants import NO_ITEMNUMBER_VALUES_REGEX
-from .constants import OR_ITEMNUMBER_VALUES_REGEX
-from .constants import ITEMDATA_REGEX
-from .constants import ITEMNBR_REGEX
-from .constants import PNR_REGEX
-from .constants import KWD_REGEX
-from .constants import ADT_REGEX
-from .constants import MFR_REGEX
-from .constants import IPLNOM_REGEX
+from .constants import TORQUE_VALUES_PATTERN
+from .constants import ITEMNUMBER_VALUES_PATTERN
+from .constants import NO_ITEMNUMBER_VALUES_PATTERN
+from .constants import OR_ITEMNUMBER_VALUES_PATTERN
+from .patterns import get_regex
+from .ipl import IplIndex
 from .xml_processing import replace_special_characters
 
 
@@ -62,6 +59,7 @@ class NoXmlSet(Exception):
 class ConsumablesValidator():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.xml_list = None
         self.main_dict = None
         self.export_path = expanduser("~/Desktop")
@@ -73,6 +71,17 @@ class ConsumablesValidator():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function with huch the user can specify a path different to the default path (desktop),
@@ -176,17 +185,20 @@ class ConsumablesValidator():
             raise NoXmlSet("No xml found to validate. Use the set_xml function to set the path of your xml \
                         before you use the validate_consumables function.".replace("                        ", ""))
 
-        with open(self.xml_path, "r", encoding="utf-8") as _:
-            xml_content = _.read()
-        xml_content = linearize_xml(xml_content)
-        xml_content = delete_first_line(xml_content)
-        xml_content = replace_special_characters(xml_content)
-        # Insert replacements for all entitys
-        with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
-            entities = _.read()
-        entities = linearize_xml(entities)
-        xml_content = sub(r"(]>.*?<cmm)", entities + r'\1', xml_content)
-        xml_content = etree.parse(StringIO(xml_content))
+        if self.document is not None:
+            xml_content = self.document.tree
+        else:
+            with open(self.xml_path, "r", encoding="utf-8") as _:
+                xml_content = _.read()
+            xml_content = linearize_xml(xml_content)
+            xml_content = delete_first_line(xml_content)
+            xml_content = replace_special_characters(xml_content)
+            # Insert replacements for all entitys
+            with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
+                entities = _.read()
+            entities = linearize_xml(entities)
+            xml_content = sub(r"(]>.*?<cmm)", entities + r'\1', xml_content)
+            xml_content = etree.parse(StringIO(xml_content))
         all_pageblocks = xml_content.xpath(r"//pgblk")
 
         main_dict = {}
@@ -322,6 +334,7 @@ class ConsumablesValidator():
 class TorqueValuesValidator():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.main_dict = None
         self.procedure_torques = None
         self.export_path = expanduser("~/Desktop")
@@ -333,6 +346,17 @@ class TorqueValuesValidator():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def _print_result(self):
         """Function checks the tables in the created dictionary for discrepancies and prints the results
@@ -420,18 +444,22 @@ class TorqueValuesValidator():
             export (bool, optional): _description_. Defaults to False.
         """
         try:
-            with open(self.xml_path, "r", encoding="utf-8") as _:
-                xml_content = _.read()
-            xml_content = linearize_xml(xml_content)
-            xml_content = delete_first_line(xml_content)
-            xml_content_backup = xml_content
-            xml_content = xml_content.replace("&nbsp;", " ")
-            with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
-                entities = _.read()
-            entities = linearize_xml(entities)
-            xml_content = sub(r"(]>.*?<cmm)", entities + r'\1', xml_content)
-            xml_content = replace_special_characters(xml_content)
-            xml_content = etree.parse(StringIO(xml_content))
+            if self.document is not None:
+                xml_content_backup = self.document.linearized
+                xml_content = self.document.tree
+            else:
+                with open(self.xml_path, "r", encoding="utf-8") as _:
+                    xml_content = _.read()
+                xml_content = linearize_xml(xml_content)
+                xml_content = delete_first_line(xml_content)
+                xml_content_backup = xml_content
+                xml_content = xml_content.replace("&nbsp;", " ")
+                with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
+                    entities = _.read()
+                entities = linearize_xml(entities)
+                xml_content = sub(r"(]>.*?<cmm)", entities + r'\1', xml_content)
+                xml_content = replace_special_characters(xml_content)
+                xml_content = etree.parse(StringIO(xml_content))
 
             pageblock_8000 = xml_content.xpath(
                 r"//pgblk[@pgblknbr = '8000']")  # Table Torques
@@ -497,11 +525,14 @@ class TorqueValuesValidator():
             xml_content_backup = xml_content_backup.replace("</csn >", "</csn>").replace(
                 "<csn >", "<csn>").replace("<csn>", "(").replace("</csn>", ")")
             xml_content_backup = replace_special_characters(xml_content_backup)
-            with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
-                entities = _.read()
-            entities = linearize_xml(entities)
-            xml_content_backup = sub(
-                r"(]>.*?<cmm)", entities + r'\1', xml_content_backup)
+            if self.document is not None:
+                xml_content_backup = inject_entities(xml_content_backup)
+            else:
+                with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
+                    entities = _.read()
+                entities = linearize_xml(entities)
+                xml_content_backup = sub(
+                    r"(]>.*?<cmm)", entities + r'\1', xml_content_backup)
             tree = etree.parse(StringIO(xml_content_backup))
             for match in tree.xpath("./pgblk"):
                 if "'pgblknbr': '15000'" in str(match.attrib):
@@ -515,59 +546,37 @@ class TorqueValuesValidator():
             prcitems_content = prcitems_content.split("\n")
 
             for elem in prcitems_content:
-                elem = sub(r"\<.*?\>", "", elem)
-                if "for pn" in elem and search(ITEMNUMBER_VALUES_REGEX, elem):
-                    for match in findall(TORQUE_VALUES_REGEX, elem):
-                        if search(ITEMNUMBER_VALUES_REGEX, elem):
-                            item_num = search(ITEMNUMBER_VALUES_REGEX, elem).group(
-                                3).replace("(", "").replace(")", "")
-                            name = search(ITEMNUMBER_VALUES_REGEX, elem).group(
-                                2).replace("(", "").replace(")", "")
-                            torque = ''.join(match)
-                            main_dict['Procedure'][(item_num, name)] = torque
-                elif search(ITEMNUMBER_VALUES_REGEX, elem) and 'or' not in search(ITEMNUMBER_VALUES_REGEX, elem).group(4):
-                    item_num = search(ITEMNUMBER_VALUES_REGEX, elem).group(
-                        3).replace("(", "").replace(")", "")
-                    name = search(ITEMNUMBER_VALUES_REGEX, elem).group(2)
+                elem = get_regex(r"\<.*?\>").sub("", elem)
+                itemnumber_match = ITEMNUMBER_VALUES_PATTERN.search(elem)
+                if "for pn" in elem and itemnumber_match:
+                    item_num = itemnumber_match.group(3).replace("(", "").replace(")", "")
+                    name = itemnumber_match.group(2).replace("(", "").replace(")", "")
+                    for match in TORQUE_VALUES_PATTERN.findall(elem):
+                        torque = ''.join(match)
+                        main_dict['Procedure'][(item_num, name)] = torque
+                elif itemnumber_match and 'or' not in itemnumber_match.group(4):
+                    item_num = itemnumber_match.group(3).replace("(", "").replace(")", "")
+                    name = itemnumber_match.group(2)
                     if name.endswith(" "):
                         name = name[:-1]
-                    torque = search(ITEMNUMBER_VALUES_REGEX, elem).group(5)
-                    torque += search(ITEMNUMBER_VALUES_REGEX, elem).group(6)
-                    torque += search(ITEMNUMBER_VALUES_REGEX, elem).group(7)
-                    torque += search(ITEMNUMBER_VALUES_REGEX, elem).group(8)
-                    torque += search(ITEMNUMBER_VALUES_REGEX, elem).group(9)
-                    torque += search(ITEMNUMBER_VALUES_REGEX, elem).group(10)
-                    torque += search(ITEMNUMBER_VALUES_REGEX, elem).group(11)
+                    torque = "".join(itemnumber_match.group(5, 6, 7, 8, 9, 10, 11))
                     main_dict['Procedure'][(item_num, name)] = torque
-                elif search(NO_ITEMNUMBER_VALUES_REGEX, elem):
-                    item_num = search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(
-                        4).replace("(", "").replace(")", "")
+                elif no_itemnumber_match := NO_ITEMNUMBER_VALUES_PATTERN.search(elem):
+                    item_num = no_itemnumber_match.group(4).replace("(", "").replace(")", "")
                     if item_num == "":
                         item_num = "-"
-                    name = search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(2)
+                    name = no_itemnumber_match.group(2)
                     if name.endswith(" "):
                         name = name[:-1]
-                    torque = search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(5)
-                    torque += search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(6)
-                    torque += search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(7)
-                    torque += search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(8)
-                    torque += search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(9)
-                    torque += search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(10)
-                    torque += search(NO_ITEMNUMBER_VALUES_REGEX, elem).group(11)
+                    torque = "".join(no_itemnumber_match.group(5, 6, 7, 8, 9, 10, 11))
                     main_dict['Procedure'][(item_num, name)] = torque
-                elif search(OR_ITEMNUMBER_VALUES_REGEX, elem):
-                    item_num = search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(3).replace("(", "").replace(
-                        ")", "") + " " + search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(5).replace("(", "").replace(")", "")
-                    name = search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(2)
+                elif or_itemnumber_match := OR_ITEMNUMBER_VALUES_PATTERN.search(elem):
+                    item_num = or_itemnumber_match.group(3).replace("(", "").replace(
+                        ")", "") + " " + or_itemnumber_match.group(5).replace("(", "").replace(")", "")
+                    name = or_itemnumber_match.group(2)
                     if name.endswith(" "):
                         name = name[:-1]
-                    torque = search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(7)
-                    torque += search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(8)
-                    torque += search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(9)
-                    torque += search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(10)
-                    torque += search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(11)
-                    torque += search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(12)
-                    torque += search(OR_ITEMNUMBER_VALUES_REGEX, elem).group(13)
+                    torque = "".join(or_itemnumber_match.group(7, 8, 9, 10, 11, 12, 13))
                     main_dict['Procedure'][(item_num, name)] = torque
 
             if export:
@@ -612,6 +621,7 @@ class TorqueValuesValidator():
 class cons_and_teds_checker():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
         self.pgblk_contents = None
 
@@ -622,6 +632,17 @@ class cons_and_teds_checker():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -637,6 +658,8 @@ class cons_and_teds_checker():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.normalized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -650,6 +673,8 @@ class cons_and_teds_checker():
         Returns:
             str: xml content with mentioned modifications.
         """
+        if self.document is not None:
+            return self.document.resolved
         xml_content = self.prepare_xml()
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
@@ -662,8 +687,10 @@ class cons_and_teds_checker():
         Returns:
             _type_: _description_
         """
-        xml_content = self.replace_entities()
-        tree = etree.fromstring(xml_content)
+        if self.document is not None:
+            tree = self.document.root
+        else:
+            tree = etree.fromstring(self.replace_entities())
         pgblks = tree.xpath("//pgblk")
         pgblk_contents = [linearize_xml(etree.tostring(
             pgblk, encoding="unicode")) for pgblk in pgblks]
@@ -902,37 +929,7 @@ def ipl_to_dict(xml: str) -> dict:
     """
     if xml.endswith(".xlsx"):
         return _ipl_to_dict_excel(xml)
-    ipl_dict = {}
-
-    with open(xml, "r", encoding="utf-8") as xml_in:
-        content = xml_in.read().replace("\n", "")
-
-    if search(ITEMDATA_REGEX, content):
-        for itemdata in findall(ITEMDATA_REGEX, content):
-            itemdata = "".join(itemdata)
-            itemnbr = ""
-            if search(ITEMNBR_REGEX, itemdata):
-                itemnbr = search(ITEMNBR_REGEX, itemdata).group(1)
-            if search(PNR_REGEX, itemdata):
-                ipl_dict[search(PNR_REGEX, itemdata).group(1)] = {"Nomenclature": "", "MFR": ""}
-                pnr = search(PNR_REGEX, itemdata).group(1)
-                if search(IPLNOM_REGEX, itemdata):
-                    if search(ADT_REGEX, itemdata):
-                        if "ASS" in search(ADT_REGEX, itemdata).group(1):
-                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(KWD_REGEX, itemdata).group(1) + " "
-                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(ADT_REGEX, itemdata).group(1)
-                        else:
-                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(ADT_REGEX, itemdata).group(1) + " "
-                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(KWD_REGEX, itemdata).group(1)
-
-                        ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"].strip()
-                    else:
-                        ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(KWD_REGEX, itemdata).group(1)
-                    if search(MFR_REGEX, itemdata):
-                        ipl_dict[pnr]["MFR"] = ipl_dict[pnr]["MFR"] + search(MFR_REGEX, itemdata).group(1)
-                ipl_dict[pnr]["Itemnbr"] = itemnbr
-
-    return ipl_dict
+    return IplIndex.load(xml).to_dict()
 
 def _ipl_to_dict_excel(excel: str) -> dict:
     """Converts an IPL Excel file to a dictionary.
@@ -968,6 +965,7 @@ def _ipl_to_dict_excel(excel: str) -> dict:
 class pgblk_9000_ted_checker():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
 
     def set_xml(self, xml_path: str):
@@ -977,6 +975,17 @@ class pgblk_9000_ted_checker():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -992,6 +1001,8 @@ class pgblk_9000_ted_checker():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.normalized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -1005,6 +1016,8 @@ class pgblk_9000_ted_checker():
         Returns:
             str: xml content with mentioned modifications.
         """
+        if self.document is not None:
+            return self.document.resolved
         xml_content = self.prepare_xml()
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
@@ -1017,8 +1030,10 @@ class pgblk_9000_ted_checker():
         Returns:
             _type_: _description_
         """
-        xml_content = self.replace_entities()
-        tree = etree.fromstring(xml_content)
+        if self.document is not None:
+            tree = self.document.root
+        else:
+            tree = etree.fromstring(self.replace_entities())
         pgblks = tree.xpath("//pgblk")
         pgblk_contents = [linearize_xml(etree.tostring(
             pgblk, encoding="unicode")) for pgblk in pgblks]
@@ -1149,6 +1164,7 @@ class pgblk_9000_ted_checker():
 class AtaNumbering():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
 
     def set_xml(self, xml_path: str):
@@ -1158,6 +1174,17 @@ class AtaNumbering():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -1168,8 +1195,11 @@ class AtaNumbering():
         self.export_path = export_path
 
     def check_key_numbers(self):
-        with open(self.xml_path, 'r', encoding="utf-8") as _:
-            xml_content = _.read()
+        if self.document is not None:
+            xml_content = self.document.content
+        else:
+            with open(self.xml_path, 'r', encoding="utf-8") as _:
+                xml_content = _.read()
 
         # get key_number
         key_number = self.xml_path.split('-')
@@ -1,26 +1,43 @@
 from datetime import datetime
+from time import perf_counter
 
 import sys
 
 from os import listdir
+from os import makedirs
 from os.path import join
 from os.path import expanduser
 from os.path import dirname
 from os.path import basename
 from os.path import isfile
 from os.path import isdir
+from os.path import abspath
+from os.path import getmtime
 
 # from re import search  # To be replaced by regex.search, see below
 
 from io import StringIO
+from xml.sax.saxutils import unescape
 from json import dump
 from json import dumps
+from json import load
+
+from hashlib import sha256
+from functools import lru_cache
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 
 import elementpath
 
 from regex import search
 from re import findall
 from regex import V1
+from regex import compile as compile_regex
+from regex import escape
+from regex import finditer
+
+from bisect import bisect_right
 
 from lxml import etree
 from tqdm import tqdm
@@ -36,11 +53,19 @@ from .xml_processing import delete_first_line
 from .s1000d import get_brex_ref
 from .s1000d import ref_dict_to_str
 from .s1000d import find_document_by_reference
+from .s1000d import S1000DRepository
+from .result_store import ResultStore
+from .file_info import get_file_hash
 
 
 NS_DICT = {'rdf': r'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
             'xsi': r'http://www.w3.org/2001/XMLSchema-instance'}
 
+BREX_CACHE_DIR = join(expanduser("~"), ".acd", "brex_rules")
+XML_ENTITIES = {"&quot;": "\"", "&apos;": "'"}  # besides &amp; &lt; &gt;, for the attribute values read from the text
+
+_BREX_RULES_CACHE = {}
+
 class BrexNotFound(Exception):
     pass
 
@@ -54,6 +79,79 @@ def clean_xpath(xpath):
         xpath = xpath.replace("  ", " ")
     return xpath
 
+@lru_cache(maxsize=4096)
+def get_selector(xpath: str) -> elementpath.Selector:
+    """Compiles an xpath of a brex rule only once per process"""
+    return elementpath.Selector(xpath, namespaces=NS_DICT)
+
+@lru_cache(maxsize=4096)
+def get_pattern(pattern: str) -> any:
+    """Compiles a brex pattern value only once per process"""
+    return compile_regex(pattern, V1)
+
+class LineIndex():
+    """Line number lookups for the content of a document, built once per document.
+    Offsets are mapped to line numbers with a binary search and every lookup is memoized,
+    so reporting many violations does not rescan the document for each of them.
+    """
+    def __init__(self, content: str):
+        self.lines = content.split("\n")
+        self._content = content
+        self._line_starts = [0] + [match.end() for match in finditer("\n", content)]
+        self._pattern_lines = {}
+        self._attribute_lines = {}
+        self._text_lines = {}
+        self._last_lines = {}
+
+    def line_of(self, offset: int) -> int:
+        """Returns the (1 based) line number of a character offset"""
+        return bisect_right(self._line_starts, offset)
+
+    def lines_matching(self, pattern: str) -> list:
+        """Returns the line numbers of all lines in which the regex pattern matches"""
+        if pattern not in self._pattern_lines:
+            line_numbers = []
+            for match in finditer(pattern, self._content):
+                line_no = self.line_of(match.start())
+                if not line_numbers or line_numbers[-1] != line_no:
+                    line_numbers.append(line_no)
+            self._pattern_lines[pattern] = line_numbers
+        return self._pattern_lines[pattern]
+
+    def lines_with_attribute(self, name: str, value: str = None) -> list:
+        """Returns the line numbers of all lines in which the attribute name has value (any value if None).
+        All values of an attribute are collected in a single pass over the document on its first lookup,
+        every further lookup is a dictionary access.
+        """
+        if name not in self._attribute_lines:
+            values = {None: []}
+            for match in finditer(rf'(?<![\w:.-]){escape(name)}\s*=\s*(["\'])(.*?)\1', self._content):
+                line_no = self.line_of(match.start())
+                for key in (unescape(match.group(2), XML_ENTITIES), None):
+                    lines = values.setdefault(key, [])
+                    if not lines or lines[-1] != line_no:
+                        lines.append(line_no)
+            self._attribute_lines[name] = values
+        return self._attribute_lines[name].get(value, [])
+
+    def lines_containing(self, text: str) -> list:
+        """Returns the line numbers of all lines containing text"""
+        if text not in self._text_lines:
+            self._text_lines[text] = self.lines_matching(escape(text))
+        return self._text_lines[text]
+
+    def last_line_containing(self, text: str, other_text: str = None) -> int:
+        """Returns the number of the last line containing text (and other_text if given) or None"""
+        key = (text, other_text)
+        if key not in self._last_lines:
+            self._last_lines[key] = None
+            for line_no in reversed(self.lines_containing(text)):
+                if other_text is None or other_text in self.lines[line_no - 1]:
+                    self._last_lines[key] = line_no
+                    break
+        return self._last_lines[key]
+
+
 class BrexChecker():
     def __init__(self, saxon: bool = False):
         """_summary_
@@ -69,6 +167,16 @@ class BrexChecker():
 
         self._brex_list = (None, None)
         self._brex_dir_path = (None, None)
+        self._rules = {}
+        self._rule_cache_dir = BREX_CACHE_DIR
+        self._rule_timings = {}
+        self._line_index = None
+        self._result_store = None
+        self._changed_only = False
+
+        self._saxon_proc = None
+        self._saxon_xpath = None
+        self._saxon_xml_path = None
     
     def set_xml_dir(self, dir_path: str) -> None:
         """_summary_
@@ -86,52 +194,77 @@ class BrexChecker():
         with open(xml, "r", encoding="utf-8") as f:
             self._xml_content = f.read()
         self._xml_path = xml
+        self._saxon_xml_path = None  # parse again, the file may have changed since it was last checked
         if self._brex_dir_path[0] is None and self._brex_dir_path[1] is not True:
             self._brex_dir_path = (dirname(xml), False)
 
+    def _find_brex_chain(self, xml: str) -> list:
+        """Follows the brex references starting from xml until a brex references itself
+        or a referenced brex cannot be found in the brex directory.
+
+        Args:
+            xml (str): xml file path
+
+        Returns:
+            list: brex file paths, the directly referenced brex first
+        """
+        brex_chain = []
+        while True:
+            brex_ref = ref_dict_to_str(self._get_brex_ref(xml))
+            if brex_ref in xml:
+                break
+            xml = find_document_by_reference(brex_ref, self._brex_dir_path[0])
+            if xml is None:
+                break
+            brex_chain.append(xml)
+        return brex_chain
+
+    def _get_brex_ref(self, xml: str) -> dict:
+        """Returns the brex reference of xml, from the repository index if xml is indexed and unchanged"""
+        repository = self._brex_dir_path[0]
+        if isinstance(repository, S1000DRepository):
+            try:
+                document = repository.get_document(xml)
+            except KeyError:
+                document = None
+            if document is not None and document["version"] is not None and document["mtime"] == getmtime(xml):
+                return document["brex_ref"]
+        return get_brex_ref(xml)
+
+    def _brex_dir(self) -> str:
+        if isinstance(self._brex_dir_path[0], S1000DRepository):
+            return self._brex_dir_path[0].directory
+        return self._brex_dir_path[0]
+
     def _init_brex_list(self):
         if self._brex_list[0] is None and self._brex_list[1] in (None, True):
-            self._brex_list = ([], True)
-            xml = self._xml_path
-            while True:
-                if ref_dict_to_str(get_brex_ref(xml)) in xml:
-                    break
-                brex_ref = ref_dict_to_str(get_brex_ref(xml))
-                xml = find_document_by_reference(brex_ref, self._brex_dir_path[0])
-                if xml is None:
-                    break
-                self._brex_list[0].append(xml)
+            self._brex_list = (self._find_brex_chain(self._xml_path), True)
         elif self._brex_list[0] is None and self._brex_list[1] is not True:
-            self._brex_list = ([], False)
-            xml = self._xml_path
-            while True:
-                if ref_dict_to_str(get_brex_ref(xml)) in xml:
-                    break
-                brex_ref = ref_dict_to_str(get_brex_ref(xml))
-                xml = find_document_by_reference(brex_ref, self._brex_dir_path[0])
-                if xml is None:
-                    break
-                self._brex_list[0].append(xml)
+            self._brex_list = (self._find_brex_chain(self._xml_path), False)
         if len(self._brex_list[0]) == 0:
             raise NoBrexDefined(f"Brex files couldn't be found\n\
                     Please use set_brex_path method to input the directory containing ALL brex data modules or \
                     use override_brex_list if the brex data modules are in different directories.\
-                    expected brex: {ref_dict_to_str(get_brex_ref(self._xml_path))}".replace("                ", ""))
+                    expected brex: {ref_dict_to_str(self._get_brex_ref(self._xml_path))}".replace("                ", ""))
         else:
             for brex in self._brex_list[0]:
                 if not isfile(brex):
-                    raise BrexNotFound(f"Referenced Brex: {brex} is not in {self._brex_dir_path[0]}.\n\
+                    raise BrexNotFound(f"Referenced Brex: {brex} is not in {self._brex_dir()}.\n\
                     Please use set_brex_path method to input the directory containing ALL brex data modules or \
                     use override_brex_list if the brex data modules are in different directories.".replace("                ", ""))
 
-    def set_brex_path(self, brex_path: str):
+    def set_brex_path(self, brex_path: any):
         """Function with which the user can set a path where the brex files are
         located in case they are located in another directory than the xml.
         Function call can be omitted when the Brex has the same directory, the xml has.
+        An S1000DRepository of the brex directory resolves the brex chains with index lookups
+        instead of walking the directory for every chain link of every xml.
         Args:
-            brex (str): brex file path
+            brex_path (any): brex directory path or S1000DRepository
         """
-        if isdir(brex_path):
+        if isinstance(brex_path, S1000DRepository):
+            self._brex_dir_path = (brex_path, True)
+        elif isdir(brex_path):
             self._brex_dir_path = (brex_path, True)
         else:
             raise BrexNotFound(f"The given path {brex_path} seems to be leading to a file. \
@@ -222,11 +355,138 @@ class BrexChecker():
                 }
             )
         if debug:
-            with open(join(expanduser("~/Desktop"), f'brex_{basename(brex)}.json'), 'w', encoding="utf-8") as _:
-                for elem in allowed_object_flag_dict:
-                    _.write(dumps(elem, indent=4, ensure_ascii=False))
+            self._dump_rules(brex, allowed_object_flag_dict)
         return allowed_object_flag_dict
 
+    @staticmethod
+    def _dump_rules(brex: str, rules: list):
+        """Writes the rules of a brex to brex_<name>.json on the Desktop"""
+        with open(join(expanduser("~/Desktop"), f'brex_{basename(brex)}.json'), 'w', encoding="utf-8") as _:
+            for elem in rules:
+                _.write(dumps(elem, indent=4, ensure_ascii=False))
+
+    def set_rule_cache_dir(self, cache_dir: str):
+        """Function with which the user can set the directory where the parsed brex rules are cached.
+        Set it to None to disable the cache on disk.
+
+        Args:
+            cache_dir (str): cache directory
+        """
+        self._rule_cache_dir = cache_dir
+
+    def set_result_store(self, result_store: ResultStore, changed_only: bool = False):
+        """Function with which the user can set a ResultStore, so that xmls which did not change
+        since they were last checked against the same brexes are not checked again.
+
+        Args:
+            result_store (ResultStore): result store, None to disable it
+            changed_only (bool, optional): If True, unchanged xmls are left out of the results of a directory,
+                otherwise their stored results are returned. Defaults to False.
+        """
+        self._result_store = result_store
+        self._changed_only = changed_only
+
+    def _rules_hash(self, brex_list: list) -> str:
+        """Hash of the brexes an xml is checked against, used as key in the result store"""
+        return ResultStore.rules_hash(self._saxon, *[self._result_store.content_hash(brex) for brex in brex_list])
+
+    def _get_stored_result(self, xml: str, brex_list: list) -> dict:
+        if self._result_store is None:
+            return None
+        stored = self._result_store.get("brex", xml, self._rules_hash(brex_list))
+        return None if stored is None else stored["result"]
+
+    def _store_result(self, xml: str, brex_list: list, result: dict):
+        if self._result_store is not None:
+            self._result_store.put("brex", xml, self._rules_hash(brex_list), result)
+
+    def _get_rules(self, brex: str, debug: bool = False) -> list:
+        """Returns the rules of a brex. The rules are cached in memory (for all checkers of the process)
+        and on disk, keyed by the brex path and validated by its modification time and sha256,
+        so a brex is only parsed again when its content changes.
+        The xpaths and patterns of the rules are compiled when a rule is checked (see get_selector),
+        a rule which can not be compiled does not stop the other rules from loading.
+
+        Args:
+            brex (str): brex_path
+
+        Returns:
+            list: rule dictionaries, see _show_rules
+        """
+        if brex in self._rules:
+            if debug:
+                self._dump_rules(brex, self._rules[brex])
+            return self._rules[brex]
+        mtime = getmtime(brex)
+        key = (abspath(brex), mtime)
+        if key not in _BREX_RULES_CACHE:
+            brex_sha256 = get_file_hash(brex)
+            rules = None
+            cache_file = None
+            if self._rule_cache_dir is not None:
+                cache_file = join(self._rule_cache_dir, f"{sha256(abspath(brex).encode('utf-8')).hexdigest()}.json")
+                if isfile(cache_file):
+                    with open(cache_file, "r", encoding="utf-8") as _:
+                        cached = load(_)
+                    if cached.get("sha256") == brex_sha256:
+                        rules = cached["rules"]
+            if rules is None:
+                rules = self._show_rules(brex, debug=debug)
+                if cache_file is not None:
+                    makedirs(self._rule_cache_dir, exist_ok=True)
+                    with open(cache_file, "w", encoding="utf-8") as _:
+                        dump({"path": abspath(brex), "mtime": mtime, "sha256": brex_sha256, "rules": rules}, _, ensure_ascii=False)
+            elif debug:
+                self._dump_rules(brex, rules)
+            _BREX_RULES_CACHE[key] = rules
+        elif debug:
+            self._dump_rules(brex, _BREX_RULES_CACHE[key])
+        self._rules[brex] = _BREX_RULES_CACHE[key]
+        return self._rules[brex]
+
+    def _get_saxon_xpath(self) -> any:
+        """Returns the saxon xpath processor of this checker with the current xml as context.
+        The processor (with the namespaces declared and compiled xpaths cached) is created once per checker,
+        the xml is parsed only once per document and shared by all rules.
+        """
+        if self._saxon_proc is None:
+            self._saxon_proc = PySaxonProcessor(license=False)
+            self._saxon_xpath = self._saxon_proc.new_xpath_processor()
+            self._saxon_xpath.set_caching(True)
+            for prefix, uri in NS_DICT.items():
+                self._saxon_xpath.declare_namespace(prefix, uri)
+        if self._saxon_xml_path != self._xml_path:
+            node = self._saxon_proc.parse_xml(xml_file_name=self._xml_path)
+            self._saxon_xpath.set_context(xdm_item=node)
+            self._saxon_xml_path = self._xml_path
+        return self._saxon_xpath
+
+    def _add_rule_timing(self, value: dict, seconds: float):
+        key = f"{value['Brex']}|{value['ObjectFlag']}|{value['xpath']}"
+        if key not in self._rule_timings:
+            self._rule_timings[key] = {
+                'Brex': value['Brex'],
+                'ObjectFlag': value['ObjectFlag'],
+                'Xpath': value['xpath'],
+                'Calls': 0,
+                'Seconds': 0.0
+            }
+        self._rule_timings[key]['Calls'] += 1
+        self._rule_timings[key]['Seconds'] += seconds
+
+    def get_rule_timings(self, top: int = None) -> list:
+        """Returns how long each brex rule took, summed over all documents checked by this checker,
+        the most expensive rules first.
+
+        Args:
+            top (int, optional): Only return the top most expensive rules. Defaults to None (all rules).
+
+        Returns:
+            list: dictionaries with Brex, ObjectFlag, Xpath, Calls and Seconds
+        """
+        timings = sorted(self._rule_timings.values(), key=lambda timing: timing['Seconds'], reverse=True)
+        return timings[:top] if top is not None else timings
+
     def regex_builder(self, attribute_name: str, attribute_value: str, xpath):
         """If case since there might be cases where attribute_name has no attribute_value
         Args:
@@ -244,39 +504,33 @@ class BrexChecker():
     def _check_object_flag_0(self, schema: str, brex_violations: dict, root: any, value: any, error_0: int):
         if value['contextRules'] == schema or value['contextRules'] == "":
             if self._saxon:
-                with PySaxonProcessor(license=False) as proc:
-                    xp = proc.new_xpath_processor()
-                    for prefix, uri in NS_DICT.items():
-                        xp.declare_namespace(prefix, uri)
-                    node = proc.parse_xml(xml_file_name=self._xml_path)
-                    xp.set_context(xdm_item=node)
-                    items = xp.evaluate(clean_xpath(value['xpath']))
-                    if items is not None:
-                        for item in items:
-                            if isinstance(item, PyXdmNode):
-                                match_found = search(r'(\[@)(.+?)([^a-z0-9A-Z])', clean_xpath(value['xpath']))
-                                if match_found:
-                                    attribute_name = match_found.group(2)
-                                    attribute_value = item.get_attribute_value(attribute_name)
-                                else:
-                                    attribute_name = ""
-                                    attribute_value = ""
-                                list_xml_content = self._xml_content.split("\n")
+                items = self._get_saxon_xpath().evaluate(clean_xpath(value['xpath']))
+                if items is not None:
+                    for item in items:
+                        if isinstance(item, PyXdmNode):
+                            match_found = search(r'(\[@)(.+?)([^a-z0-9A-Z])', clean_xpath(value['xpath']))
+                            if match_found:
+                                attribute_name = match_found.group(2)
+                                attribute_value = item.get_attribute_value(attribute_name)
+                            else:
+                                attribute_name = ""
+                                attribute_value = ""
+                            if attribute_name:
+                                line_numbers = self._line_index.lines_with_attribute(attribute_name, attribute_value)
+                            else:
                                 build_regex = self.regex_builder(attribute_name, attribute_value, clean_xpath(value['xpath']))
-                                for element in list_xml_content:
-                                    match_found_in_list = search(build_regex, element)
-                                    if match_found_in_list:
-                                        brex_violations[value["Brex"]]['0'] |= {error_0: {
-                                            'Line': list_xml_content.index(element) + 1,
-                                            'Description': value["objectUse"],
-                                            'Xpath': value['xpath']}
-                                        }
-                                        error_0 += 1
-                    proc.exception_clear()
+                                line_numbers = self._line_index.lines_matching(build_regex)
+                            for line_no in line_numbers:
+                                brex_violations[value["Brex"]]['0'] |= {error_0: {
+                                    'Line': line_no,
+                                    'Description': value["objectUse"],
+                                    'Xpath': value['xpath']}
+                                }
+                                error_0 += 1
             else:
-                selector = elementpath.Selector(value['xpath'], namespaces=NS_DICT)
-                if type(selector.select(root)) is not bool:
-                    for element in selector.select(root):
+                selected = get_selector(value['xpath']).select(root)
+                if type(selected) is not bool:
+                    for element in selected:
                         if ' and ' in value['xpath']:
                             line_no = "(Origin traced back to multiple lines -> Interpret XPath)"
                         else:
@@ -285,10 +539,7 @@ class BrexChecker():
                             except AttributeError:
                                 if search(r'(/@)([a-zA-Z]+)', value['xpath'], V1):
                                     attrib_name = search(r'(/@)([a-zA-Z]+)', value['xpath'], V1).group(2)
-                                    split_xml = self._xml_content.split("\n")
-                                    for ind, elem in enumerate(split_xml):
-                                        if attrib_name in elem:
-                                            line_no = ind + 1
+                                    line_no = self._line_index.last_line_containing(attrib_name) or "x"
                                 else:
                                     line_no = "x"
                         brex_violations[value["Brex"]]['0'] |= {error_0: {
@@ -301,8 +552,8 @@ class BrexChecker():
 
     def _check_object_flag_1(self, schema: str, brex_violations: dict, root: any, value: any, error_1: int):
         if value['contextRules'] == schema or value['contextRules'] == "":
-            selector = elementpath.Selector(value['xpath'], namespaces=NS_DICT)
-            if not selector.select(root) or selector.select(root) == []:
+            selected = get_selector(value['xpath']).select(root)
+            if not selected or selected == []:
                 brex_violations[value["Brex"]]['1'] |= {error_1: {
                             'Description': value["objectUse"],
                             'Xpath': value['xpath']}
@@ -312,18 +563,18 @@ class BrexChecker():
 
     def _check_object_flag_2(self, schema: str, brex_violations: dict, root: any, value: any, error_2: int):
         if ('values_allowed' in value or 'regex_allowed' in value) and (value['contextRules'] == schema or value['contextRules'] == ""):
-            selector = elementpath.Selector(value['xpath'], namespaces=NS_DICT)
-            if type(selector.select(root)) is not bool:
-                for element in selector.select(root):
+            selected = get_selector(value['xpath']).select(root)
+            if type(selected) is not bool:
+                for element in selected:
                     valid_elem = False
                     if element not in value["values_allowed"]:
                         if len(value["regex_allowed"]) > 0:
                             try:
-                                if any([bool(search(regex, element, V1)) for regex in value["regex_allowed"]]):
+                                if any([bool(get_pattern(regex).search(element)) for regex in value["regex_allowed"]]):
                                     valid_elem = True
                             except TypeError:
                                 regex2 = search(r"(@)([a-zA-Z]+)(^[a-zA-Z])", value['xpath'], V1)
-                                if any([bool(search(regex, element.attrib[regex2.group(2)], V1)) for regex in value["regex_allowed"]]):
+                                if any([bool(get_pattern(regex).search(element.attrib[regex2.group(2)])) for regex in value["regex_allowed"]]):
                                     valid_elem = True
                     else:
                         valid_elem = True
@@ -336,10 +587,7 @@ class BrexChecker():
                             except AttributeError:
                                 if search(r'(/@)([a-zA-Z]+)', value['xpath'], V1) is not None:
                                     attrib_name = search(r'(/@)([a-zA-Z]+)', value['xpath'], V1).group(2)
-                                    split_xml = self._xml_content.split("\n")
-                                    for ind, elem in enumerate(split_xml):
-                                        if attrib_name in elem and element in elem:
-                                            line_no = ind + 1
+                                    line_no = self._line_index.last_line_containing(attrib_name, str(element)) or "x"
                                 else:
                                     line_no = "x"
                         brex_violations[value["Brex"]]['2'] |= {error_2: {
@@ -373,9 +621,10 @@ class BrexChecker():
                 '2': {}
             }
         root = etree.parse(self._xml_path)
+        self._line_index = LineIndex(self._xml_content)
         all_content_rules = []
         for brex in self._brex_list[0]:
-            content_rules = self._show_rules(brex, debug=debug)
+            content_rules = self._get_rules(brex, debug=debug)
             all_content_rules += content_rules
 
         if debug:
@@ -385,6 +634,7 @@ class BrexChecker():
         error_0, error_1, error_2 = 1, 1, 1
         container = tqdm(all_content_rules) if include_tqdm else all_content_rules
         for value in container:
+            start = perf_counter()
             if value["ObjectFlag"] == '0':
                 if schema != "http://www.s1000d.org/S1000D_4-2/xml_schema_flat/ddn.xsd":
                     brex_violations_dict |= self._check_object_flag_0(schema, brex_violations_dict, root, value, error_0)
@@ -395,6 +645,7 @@ class BrexChecker():
                 if value["values_allowed"] != [] or value["regex_allowed"] != []:
                     if schema != "http://www.s1000d.org/S1000D_4-2/xml_schema_flat/ddn.xsd":
                         brex_violations_dict |= self._check_object_flag_2(schema, brex_violations_dict, root, value, error_2)
+            self._add_rule_timing(value, perf_counter() - start)
         return brex_violations_dict
 
     def _append_summary(self, object_flag_dict: dict) -> dict:
@@ -415,6 +666,12 @@ class BrexChecker():
             error_count += values_length
         return f"{error_count} Errors"
     
+    def _reset_brex(self):
+        """Forgets the brex chain of the last xml and the brex directory, unless it was set with set_brex_path"""
+        self._brex_list = (None, None)
+        if self._brex_dir_path[1] is not True:
+            self._brex_dir_path = (None, None)
+
     def validate(self, debug: bool = False, include_tqdm: bool = False) -> dict:
         """Check xml against all brexes and dump the results into a JSon file
         """
@@ -424,26 +681,151 @@ class BrexChecker():
                     _.write("{")
             files = [_ for _ in listdir(self._xml_dir) if ".xml" in _.lower() and "-022a-" not in _.lower() ]
             container = tqdm(files) if include_tqdm else files
+            result = {}
             for _xml in container:
                 self.set_xml(join(self._xml_dir, _xml))
                 self._init_brex_list()
-                result = self._check_rules(debug=debug, include_tqdm=include_tqdm)
-                summary = self._append_summary(result)
+                stored = self._get_stored_result(self._xml_path, self._brex_list[0])
+                if stored is not None and self._changed_only:
+                    self._reset_brex()
+                    continue
+                if stored is not None:
+                    summary = stored.pop("Summary")
+                    result = stored
+                else:
+                    result = self._check_rules(debug=debug, include_tqdm=include_tqdm)
+                    summary = self._append_summary(result)
+                    self._store_result(self._xml_path, self._brex_list[0], result | {"Summary": summary})
                 if debug:
                     with open(join(expanduser("~/Desktop"), f'Errors_{basename(self._xml_dir)}.json'), 'a', encoding="utf-8") as _:
                         dump({_xml: result, "Summary": summary}, _, indent=4)
-                self._brex_list = (None, None)
-                self._brex_dir_path = (None, None)
+                self._reset_brex()
             if debug:
                 with open(join(expanduser("~/Desktop"), f'Errors_{basename(self._xml_dir)}.json'), 'a', encoding="utf-8") as _:
                     _.write("}")
         else:
             self._init_brex_list()
-            result = self._check_rules(debug=debug)
-            summary = self._append_summary(result)
-            result["Summary"] = summary
+            result = self._get_stored_result(self._xml_path, self._brex_list[0])
+            if result is None:
+                result = self._check_rules(debug=debug)
+                summary = self._append_summary(result)
+                result["Summary"] = summary
+                self._store_result(self._xml_path, self._brex_list[0], result)
             if debug:
                 with open(join(expanduser("~/Desktop"), f'Errors_{basename(self._xml_path)}.json'), 'w', encoding="utf-8") as _:
                     dump(result, _, indent=4)
         return result
 
+    def validate_parallel(self, workers: int = None, debug: bool = False, include_tqdm: bool = False, callback: callable = None) -> dict:
+        """Check all xmls of the directory set with set_xml_dir (or the single xml set with set_xml)
+        against their brexes, distributing the data modules over a pool of processes.
+
+        The brex chains are resolved and the brex rules are parsed only once in the main process
+        and shared with every worker. If a result store is set (see set_result_store),
+        only the xmls which changed since they were last checked are sent to the workers.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            debug (bool, optional): Dump the results into a JSon file on the Desktop. Defaults to False.
+            include_tqdm (bool, optional): Show a progress bar. Defaults to False.
+            callback (callable, optional): Called with (xml filename, result) as soon as
+                a data module is finished. Defaults to None.
+
+        Returns:
+            dict: {xml filename: result}, each result has the same structure as the one returned by validate
+        """
+        if self._xml_dir:
+            files = [join(self._xml_dir, _) for _ in listdir(self._xml_dir) if ".xml" in _.lower() and "-022a-" not in _.lower()]
+        else:
+            files = [self._xml_path]
+        brex_dir_path = self._brex_dir_path
+        overridden_brex_list = self._brex_list[0] if self._brex_list[1] is True else None
+
+        brex_lists = {}
+        brex_chains = {}
+        for xml in files:
+            if overridden_brex_list is not None:
+                brex_lists[xml] = overridden_brex_list
+                continue
+            if brex_dir_path[1] is not True:
+                self._brex_dir_path = (dirname(xml), False)
+            brex_ref = ref_dict_to_str(self._get_brex_ref(xml))
+            if (brex_ref, self._brex_dir_path[0]) not in brex_chains:
+                self._xml_path = xml
+                self._brex_list = (None, None)
+                self._init_brex_list()
+                brex_chains[(brex_ref, self._brex_dir_path[0])] = self._brex_list[0]
+            brex_lists[xml] = brex_chains[(brex_ref, self._brex_dir_path[0])]
+        self._brex_dir_path = brex_dir_path
+        if overridden_brex_list is None:
+            self._brex_list = (None, None)
+
+        rules = {}
+        for brex_list in brex_lists.values():
+            for brex in brex_list:
+                rules[brex] = self._get_rules(brex, debug=debug)
+
+        if self._xml_dir:
+            json_path = join(expanduser("~/Desktop"), f'Errors_{basename(self._xml_dir)}.json')
+        else:
+            json_path = join(expanduser("~/Desktop"), f'Errors_{basename(self._xml_path)}.json')
+        if debug:
+            with open(json_path, 'w', encoding="utf-8") as _:
+                _.write("{")
+
+        results = {}
+
+        def add_result(xml: str, result: dict):
+            if debug:
+                with open(json_path, 'a', encoding="utf-8") as _:
+                    _.write(("" if len(results) == 0 else ",") + f"{dumps(basename(xml))}: {dumps(result, indent=4)}")
+            results[basename(xml)] = result
+            if callback is not None:
+                callback(basename(xml), result)
+
+        to_check = []
+        for xml in files:
+            stored = self._get_stored_result(xml, brex_lists[xml])
+            if stored is None:
+                to_check.append(xml)
+            elif not self._changed_only:
+                add_result(xml, stored)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_brex_worker, initargs=(self._saxon, rules, brex_dir_path)) as executor:
+            futures = [executor.submit(_validate_brex_worker, xml, brex_lists[xml]) for xml in to_check]
+            container = tqdm(as_completed(futures), total=len(futures)) if include_tqdm else as_completed(futures)
+            for future in container:
+                xml, result, rule_timings = future.result()
+                for timing in rule_timings.values():
+                    self._add_rule_timing({'Brex': timing['Brex'], 'ObjectFlag': timing['ObjectFlag'], 'xpath': timing['Xpath']}, timing['Seconds'])
+                self._store_result(xml, brex_lists[xml], result)
+                add_result(xml, result)
+
+        if debug:
+            with open(json_path, 'a', encoding="utf-8") as _:
+                _.write("}")
+        return results
+
+
+_WORKER_CHECKER = None
+
+
+def _init_brex_worker(saxon: bool, rules: dict, brex_dir_path: tuple):
+    """Creates the BrexChecker of a worker process with the already parsed brex rules
+    and the brex directory or repository of the main checker.
+    """
+    global _WORKER_CHECKER
+    _WORKER_CHECKER = BrexChecker(saxon=saxon)
+    _WORKER_CHECKER._rules = rules
+    _WORKER_CHECKER._brex_dir_path = brex_dir_path
+
+
+def _validate_brex_worker(xml: str, brex_list: list) -> tuple:
+    """Checks one xml in a worker process, see BrexChecker.validate_parallel.
+    """
+    _WORKER_CHECKER.set_xml(xml)
+    _WORKER_CHECKER._brex_list = (brex_list, True)
+    _WORKER_CHECKER._rule_timings = {}
+    result = _WORKER_CHECKER._check_rules()
+    result["Summary"] = _WORKER_CHECKER._append_summary(result)
+    return xml, result, _WORKER_CHECKER._rule_timings
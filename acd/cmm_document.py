@@ -0,0 +1,149 @@
+from re import sub
+from re import DOTALL
+
+from os.path import join
+from os.path import dirname
+from os.path import abspath
+
+from copy import deepcopy
+
+from hashlib import sha256
+
+from functools import lru_cache
+
+from collections import OrderedDict
+
+from lxml import etree
+
+from .xml_processing import linearize_xml
+from .xml_processing import delete_first_line
+from .xml_processing import replace_special_characters
+
+FILEPATH = dirname(__file__)
+ENTITIES_PATH = join(FILEPATH, "3rd", "inmedISOEntities.ent")
+DOCUMENT_CACHE_SIZE = 4
+
+_DOCUMENT_CACHE = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def get_entities(linearized: bool = True) -> str:
+    """Reads the inmedISOEntities declarations once per process.
+
+    Args:
+        linearized (bool, optional): Return the declarations linearized. Defaults to True.
+
+    Returns:
+        str: entity declarations.
+    """
+    with open(ENTITIES_PATH, "r", encoding="utf-8") as _:
+        entities = _.read()
+    if linearized:
+        entities = linearize_xml(entities)
+    return entities
+
+
+def inject_entities(xml_content: str) -> str:
+    """Adds content of inmedISOEntities to the doctype of a CMM
+    to handle special characters for further lxml processing.
+
+    Args:
+        xml_content (str): xml content (linearized or not).
+
+    Returns:
+        str: xml content with the entity declarations inserted.
+    """
+    entities = get_entities("\n" not in xml_content)
+    return sub(r"(]>.*?<cmm)", lambda match: entities + match.group(1), xml_content, count=1, flags=DOTALL)
+
+
+class CmmDocument():
+    """A CMM loaded, normalized and parsed only once.
+
+    All preprocessing stages are computed lazily and kept on the instance,
+    so that several checkers can share the same text and lxml tree.
+    Use CmmDocument.load() to reuse documents with identical content.
+    """
+    def __init__(self, xml_path: str, content: str = None) -> None:
+        self.xml_path = xml_path
+        if content is None:
+            with open(xml_path, "r", encoding="utf-8") as _:
+                content = _.read()
+        self.content = content
+        self.sha256 = sha256(content.encode("utf-8")).hexdigest()
+        self._normalized = None
+        self._linearized = None
+        self._resolved = None
+        self._root = None
+
+    @classmethod
+    def load(cls, xml_path: str) -> "CmmDocument":
+        """Returns the cached document for the content of xml_path,
+        or creates and caches a new one.
+
+        Args:
+            xml_path (str): xml file path.
+
+        Returns:
+            CmmDocument: the shared document.
+        """
+        with open(xml_path, "r", encoding="utf-8") as _:
+            content = _.read()
+        key = sha256(content.encode("utf-8")).hexdigest()
+        if key in _DOCUMENT_CACHE:
+            _DOCUMENT_CACHE.move_to_end(key)
+            document = _DOCUMENT_CACHE[key]
+            document.xml_path = abspath(xml_path)
+            return document
+        document = cls(abspath(xml_path), content)
+        _DOCUMENT_CACHE[key] = document
+        while len(_DOCUMENT_CACHE) > DOCUMENT_CACHE_SIZE:
+            _DOCUMENT_CACHE.popitem(last=False)
+        return document
+
+    @staticmethod
+    def clear_cache():
+        """Drops all cached documents.
+        """
+        _DOCUMENT_CACHE.clear()
+
+    @property
+    def normalized(self) -> str:
+        """xml content with the first line removed and special characters replaced."""
+        if self._normalized is None:
+            self._normalized = replace_special_characters(delete_first_line(self.content))
+        return self._normalized
+
+    @property
+    def linearized(self) -> str:
+        """Linearized version of the normalized xml content."""
+        if self._linearized is None:
+            self._linearized = linearize_xml(self.normalized)
+        return self._linearized
+
+    @property
+    def resolved(self) -> str:
+        """Linearized xml content with the inmedISOEntities declarations inserted."""
+        if self._resolved is None:
+            self._resolved = inject_entities(self.linearized)
+        return self._resolved
+
+    @property
+    def root(self) -> etree._Element:
+        """Shared lxml root element of the resolved content. Must not be modified."""
+        if self._root is None:
+            self._root = etree.fromstring(self.resolved)
+        return self._root
+
+    @property
+    def tree(self) -> etree._ElementTree:
+        """Shared lxml element tree of the resolved content. Must not be modified."""
+        return self.root.getroottree()
+
+    def copy_root(self) -> etree._Element:
+        """Returns a private copy of the root element for checkers that modify the tree.
+
+        Returns:
+            etree._Element: deep copy of the root element.
+        """
+        return deepcopy(self.root)
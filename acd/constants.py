@@ -1,4 +1,5 @@
 """This module provides general purpose constants"""
+from re import compile as compile_regex
 
 # Imaage Constants
 FUNC_DICT = {
@@ -23,6 +24,10 @@ TIFF_COMPRESSION = ['zlib', 'jpeg', 'deflate', 'none']
 # S1000D Constants
 S1000D_VERSION_REGEX = r"(S1000D_)(\d-\d)(/)"
 DM_REF_REGEX = r"<(?:dmRef|refdm)>.*?</(?:dmRef|refdm)>"  # dmRef for Version 4+ and refdm for Version 2.3
+S1000D_REF_TAGS = ("dmRef", "refdm")  # dmRef for Version 4+ and refdm for Version 2.3
+S1000D_ADDRESS_TAGS = ("dmAddress", "pmAddress", "ddnAddress", "dmaddres", "pmaddres", "ddnaddres")
+S1000D_CODE_TAGS = ("dmCode", "pmCode", "ddnCode")  # Version 4+
+S1000D_OLD_CODE_TAGS = ("dmc", "pmc", "ddnc")  # Version 2.3
 
 DELIVERY_LIST_ITEM_REGEX = """(<deliveryListItem>
 <dispatchFileName>)(.*?)(</dispatchFileName>)(<entityControlNumber>)?(.*?)?
@@ -101,3 +106,37 @@ KWD_REGEX = r"<kwd>(.*?)</kwd>"
 ADT_REGEX = r"<adt>(.*?)</adt>"
 MFR_REGEX = r"<mfr>(.*?)</mfr>"
 IPLNOM_REGEX = r"<iplnom>(.*?)</iplnom>"
+
+SMG_ACTOR_NAME_REGEX = r'(<Actor.Name Value=")(.*?)(")'  # <Actor.Name Value="MS21902J4 |  | 81343 | DMU"/>
+STP_PRODUCT_REGEX = r"(PRODUCT\(')(.*?)(')"
+
+# STE Dictionary Constants
+STE_DICT_COLUMNS = {
+    0: ((12, 126), (130, 266), (275, 412), (415, None)),  # even pages
+    1: ((34, 148), (154, 290), (298, 432), (438, None)),  # odd pages
+}
+"""x offsets from top_x of the word, meaning, approved example and not approved example columns
+of the ASD-STE100 dictionary pages. None is bottom_x.
+"""
+STE_DICT_ROW_MARKER = (40, 54)
+"""x offsets from top_x of the short lines drawn at the start of each dictionary entry"""
+
+
+# Compiled versions of the patterns above, to be used in loops (see patterns.py)
+S1000D_VERSION_PATTERN = compile_regex(S1000D_VERSION_REGEX)
+DM_REF_PATTERN = compile_regex(DM_REF_REGEX)
+DELIVERY_LIST_ITEM_PATTERN = compile_regex(DELIVERY_LIST_ITEM_REGEX)
+DM_ADDRESS_PATTERN = compile_regex(DM_ADDRESS_REGEX)
+OR_ITEMNUMBER_VALUES_PATTERN = compile_regex(OR_ITEMNUMBER_VALUES_REGEX)
+NO_ITEMNUMBER_VALUES_PATTERN = compile_regex(NO_ITEMNUMBER_VALUES_REGEX)
+ITEMNUMBER_VALUES_PATTERN = compile_regex(ITEMNUMBER_VALUES_REGEX)
+TORQUE_VALUES_PATTERN = compile_regex(TORQUE_VALUES_REGEX)
+ITEMDATA_PATTERN = compile_regex(ITEMDATA_REGEX)
+ITEMNBR_PATTERN = compile_regex(ITEMNBR_REGEX)
+PNR_PATTERN = compile_regex(PNR_REGEX)
+KWD_PATTERN = compile_regex(KWD_REGEX)
+ADT_PATTERN = compile_regex(ADT_REGEX)
+MFR_PATTERN = compile_regex(MFR_REGEX)
+IPLNOM_PATTERN = compile_regex(IPLNOM_REGEX)
+SMG_ACTOR_NAME_PATTERN = compile_regex(SMG_ACTOR_NAME_REGEX)
+STP_PRODUCT_PATTERN = compile_regex(STP_PRODUCT_REGEX)
@@ -5,38 +5,65 @@ from platform import system
 from os import walk
 from os import mkdir
 from os import remove
-from os import rename
-from os import listdir
+from os import close
+from os import replace
 if system() == "Windows":
     from os import startfile
 from os.path import sep
 from os.path import join
 from os.path import isdir
-from os.path import exists
 from os.path import isfile
 from os.path import dirname
 from os.path import basename
+from os.path import abspath
+from os.path import splitext
 
 from subprocess import Popen
 
 from re import findall
 from re import search
+from re import fullmatch
+
+from io import BytesIO
+
+from copy import copy as copy_object
+
+from struct import unpack
+
+from tempfile import mkstemp
+
+from zipfile import ZipFile
+from zipfile import ZipInfo
+from zipfile import ZIP_DEFLATED
+from zipfile import ZIP64_LIMIT
+from zipfile import sizeFileHeader
 
 from shutil import copy
-from shutil import rmtree
 
 from traceback import format_exc
 
 from docx import Document
+from docx.oxml.parser import parse_xml
+from docx.text.paragraph import Paragraph
 
 from time import sleep
 from time import time
+from time import perf_counter
+
+from threading import Lock
+
+from json import dump
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from openpyxl import Workbook
+from openpyxl.styles import Font
+from openpyxl.styles import PatternFill
 
 from lxml import etree
 
 from traceback import format_exc
-if system() == "Windows":
-    from win32com.client import Dispatch  # Default .docx to .pdf solution
 
 from tqdm import tqdm
 
@@ -55,8 +82,8 @@ else:
 from typing import List
 from docx import Document
 
-from .archive import unarchive_file
-from .archive import zip_word_folder
+from .word_converters import CONVERSION_TIMEOUT
+from .word_converters import convert_word_files
 
 
 WORD_EXTENSIONS = [".docx", ".docm", ".doc", ".dotx", ".dotm", ".dot", ".docb"]
@@ -65,6 +92,238 @@ WORD_NS = {
     'w14': 'http://schemas.microsoft.com/office/word/2010/wordml'
 }
 
+DOCX_PART_REGEX = r"word/{where}\d*\.xml"
+DOCX_OPERATIONS = (
+    "content_replace",
+    "footer_replace",
+    "header_replace",
+    "replace_copyright",
+    "replace_media",
+    "adjust_column_widths"
+)
+
+
+def _copy_zip_entry(source: ZipFile, target: ZipFile, info: ZipInfo):
+    """Copies an entry from one zip to another without decompressing and compressing it again.
+
+    zipfile has no public API for this, so the local header and the compressed bytes are written
+    directly and the entry is registered in the target like ZipFile.write would do.
+    """
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(sizeFileHeader)
+    source.fp.seek(info.header_offset + sizeFileHeader + unpack("<H", header[26:28])[0] + unpack("<H", header[28:30])[0])
+    data = source.fp.read(info.compress_size)
+
+    new_info = copy_object(info)
+    new_info.flag_bits &= ~0x08  # the sizes are known, so no data descriptor after the data
+    new_info.header_offset = target.fp.tell()
+    target.fp.write(new_info.FileHeader(info.file_size > ZIP64_LIMIT or info.compress_size > ZIP64_LIMIT))
+    target.fp.write(data)
+    target.filelist.append(new_info)
+    target.NameToInfo[new_info.filename] = new_info
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+class DocxPackage():
+    """A Word document (docx, docm, ...) opened in memory.
+
+    Only the parts which are needed are parsed. Several edits can be made one after the other,
+    and save() writes the document once: the changed parts are compressed again,
+    all other entries are copied as they are.
+
+    Example:
+        with DocxPackage("manual.docx") as package:
+            package.replace_text("footer", "2022", "2023")
+            package.replace_copyright()
+            package.save(back_up=True)
+    """
+    def __init__(self, docx: str):
+        self.docx = docx
+        with open(docx, "rb") as _:
+            self._zip = ZipFile(BytesIO(_.read()))
+        self._trees = {}
+        self._data = {}
+        self._modified = set()
+
+    def __enter__(self) -> "DocxPackage":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self._zip.close()
+
+    def names(self) -> list:
+        return self._zip.namelist()
+
+    def parts(self, where: str) -> list:
+        """Returns the names of the parts of the headers, footers or the content
+
+        Args:
+            where (str): header, footer or content
+
+        Returns:
+            list: e.g. ["word/footer1.xml", "word/footer2.xml"]
+        """
+        if where == "content":
+            return ["word/document.xml"]
+        return sorted(
+            (name for name in self.names() if fullmatch(DOCX_PART_REGEX.format(where=where), name)),
+            key=lambda name: int("0" + "".join(filter(str.isdigit, name))))
+
+    def read(self, name: str) -> bytes:
+        """Returns the content of an entry, with the changes made so far"""
+        if name in self._trees:
+            return etree.tostring(self._trees[name][0], encoding="UTF-8", xml_declaration=True, standalone=True)
+        if name in self._data:
+            return self._data[name]
+        return self._zip.read(name)
+
+    def write(self, name: str, data: bytes):
+        """Replaces the content of an entry
+
+        Args:
+            name (str): entry name, e.g. word/media/image1.png
+            data (bytes): new content
+        """
+        self._trees.pop(name, None)
+        self._data[name] = data
+        self._modified.add(name)
+
+    def tree(self, name: str) -> etree._ElementTree:
+        """Returns the parsed XML of a part. It is parsed only once, call mark_modified() after changing it.
+
+        Args:
+            name (str): part name, e.g. word/footer1.xml
+
+        Returns:
+            etree._ElementTree: the part
+        """
+        return self._parse(name, oxml=False)
+
+    def _parse(self, name: str, oxml: bool) -> etree._ElementTree:
+        """Parses a part with lxml, or with the python-docx parser (oxml) so that the python-docx
+        classes (e.g. Paragraph) can be used on it. The python-docx elements do not support
+        xpath(namespaces=...), so a part is parsed again only if the other kind is needed.
+        """
+        if name not in self._trees or self._trees[name][1] != oxml:
+            data = self.read(name)
+            self._trees[name] = (etree.ElementTree(parse_xml(data) if oxml else etree.fromstring(data)), oxml)
+            self._data.pop(name, None)
+        return self._trees[name][0]
+
+    def mark_modified(self, name: str):
+        self._modified.add(name)
+
+    def is_modified(self) -> bool:
+        return len(self._modified) > 0
+
+    def _paragraphs(self, where: str):
+        """Yields the paragraphs which python-docx gives for the header, footer or content:
+        the paragraphs of the body and the paragraphs in the cells of the body tables.
+        """
+        for name in self.parts(where):
+            root = self._parse(name, oxml=True).getroot()
+            body = root.find("w:body", namespaces=WORD_NS) if where == "content" else root
+            for child in body:
+                if child.tag == f"{{{WORD_NS['w']}}}p":
+                    yield name, Paragraph(child, None)
+                elif child.tag == f"{{{WORD_NS['w']}}}tbl":
+                    for cell in child.iterfind("w:tr/w:tc", namespaces=WORD_NS):
+                        if cell.vMerge == "continue":  # the content is in the first cell of the merge
+                            continue
+                        for w_p in cell.iterfind("w:p", namespaces=WORD_NS):
+                            yield name, Paragraph(w_p, None)
+
+    def replace_text(self, where: str, old: str, new: str, debug: bool = False) -> int:
+        """Replaces a string in the paragraphs of all headers, footers or the content.
+        Like with python-docx, the run formatting of a changed paragraph is lost.
+
+        Args:
+            where (str): header, footer or content
+            old (str): string to replace
+            new (str): new string
+            debug (bool, optional): print debug messages. Defaults to False.
+
+        Returns:
+            int: number of replacements
+        """
+        replaced = 0
+        for name, para in self._paragraphs(where):
+            if debug:
+                print(f"{name}, para text: {para.text}")
+            if old in para.text:
+                replaced += para.text.count(old)
+                para.text = para.text.replace(old, new)
+                self.mark_modified(name)
+        return replaced
+
+    def replace_copyright(self) -> int:
+        """Replaces the string "Copyright" with the character '©' in the tables of all footers.
+        Only the text of the runs is changed, the formatting is kept.
+
+        Returns:
+            int: number of replacements
+        """
+        replaced = 0
+        for name in self.parts("footer"):
+            for w_t in self.tree(name).xpath(".//w:tbl//w:tc//w:p//w:r//w:t", namespaces=WORD_NS):
+                if w_t.text and "Copyright" in w_t.text:
+                    replaced += w_t.text.count("Copyright")
+                    w_t.text = w_t.text.replace("Copyright", "©")
+                    self.mark_modified(name)
+        return replaced
+
+    def replace_media(self, old_media_name: str, new_media_path: str) -> bool:
+        """Replaces a media file
+
+        Args:
+            old_media_name (str): name of the media file to replace
+            new_media_path (str): path + filename of the new media file
+
+        Returns:
+            bool: True if the media file exists in the document
+        """
+        name = f"word/media/{old_media_name}"
+        if name not in self.names():
+            return False
+        with open(new_media_path, "rb") as _:
+            self.write(name, _.read())
+        return True
+
+    def save(self, docx: str = None, back_up: bool = False):
+        """Writes the document once. It is written to a temporary file first,
+        which then replaces the document, so the original is never left half written.
+
+        Args:
+            docx (str, optional): path + filename to save to. Defaults to the opened document.
+            back_up (bool, optional): create a backup of the original file. Defaults to False.
+        """
+        docx = self.docx if docx is None else docx
+        if back_up:
+            copy(self.docx, f"{splitext(self.docx)[0]}_backup{splitext(self.docx)[1]}")
+        handle, temp_docx = mkstemp(suffix=splitext(docx)[1], dir=dirname(abspath(docx)))
+        close(handle)
+        try:
+            with ZipFile(temp_docx, "w", ZIP_DEFLATED) as target:
+                for info in self._zip.infolist():
+                    if info.filename in self._modified:
+                        new_info = ZipInfo(info.filename, info.date_time)
+                        new_info.compress_type = ZIP_DEFLATED
+                        new_info.external_attr = info.external_attr
+                        target.writestr(new_info, self.read(info.filename))
+                    else:
+                        _copy_zip_entry(self._zip, target, info)
+            replace(temp_docx, docx)
+        except Exception:
+            if isfile(temp_docx):
+                remove(temp_docx)
+            raise
+        self._modified.clear()
+
+
 def read_word_footers(docx: str, back_up: bool = False, debug: bool = False) -> str:
     """Read all footers in a docx file or docm file
 
@@ -78,47 +337,39 @@ def read_word_footers(docx: str, back_up: bool = False, debug: bool = False) ->
     """
     output = ""
 
-    unarchive_file(docx)
-    ext = "." + docx.split(".")[-1]
-    docx_dir = docx.replace(ext, "")
-
     try:
-        footers = 0
-        for xml in listdir(join(docx_dir, "word")):
-            if xml.startswith("footer"):
-                footers += 1
-        for footer in range(1, footers + 1, 1):
-            xml_path = join(docx_dir, "word", f"footer{footer}.xml")
-            xml_tree = etree.parse(xml_path)
-            for ind, paragraph in enumerate(xml_tree.xpath("w:p", namespaces=WORD_NS), start=1):
-                try:
-                    para_value = ""
-                    for w_r in paragraph.xpath("w:r", namespaces=WORD_NS):
-                        for w_t in w_r.xpath("w:t", namespaces=WORD_NS):
-                            try:
-                                para_value += w_t.text
-                            except IndexError:
-                                para_value += ""
-                    # print(f"Footer {footer}, paragraph {ind}: {para_value}")
-                    output += f"Footer {footer}, paragraph {ind}: {para_value}\n"
-                    if "Liebherr-Elektronik GmbH" in para_value:
-                        pass
-                except IndexError:
-                    # print(f"Footer {footer}, paragraph {ind}: No text")
-                    output += f"Footer {footer}, paragraph {ind}: No text\n"
-            for table_no, table in enumerate(xml_tree.xpath("w:tbl", namespaces=WORD_NS), start=1):
-                for row_no, row in enumerate(table.xpath("w:tr", namespaces=WORD_NS)):
-                    for cell_no, cell in enumerate(row.xpath("w:tc", namespaces=WORD_NS), start=1):
-                        cell_value = ""
-                        for paragraph in cell.xpath("w:p", namespaces=WORD_NS):
-                            for w_r in paragraph.xpath("w:r", namespaces=WORD_NS):
-                                for w_t in w_r.xpath("w:t", namespaces=WORD_NS):
-                                    try:
-                                        cell_value += w_t.text
-                                    except IndexError:
-                                        cell_value += ""
-                        # print(f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}")
-                        output += f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}\n"
+        with DocxPackage(docx) as package:
+            for footer, xml_path in enumerate(package.parts("footer"), start=1):
+                xml_tree = package.tree(xml_path)
+                for ind, paragraph in enumerate(xml_tree.xpath("w:p", namespaces=WORD_NS), start=1):
+                    try:
+                        para_value = ""
+                        for w_r in paragraph.xpath("w:r", namespaces=WORD_NS):
+                            for w_t in w_r.xpath("w:t", namespaces=WORD_NS):
+                                try:
+                                    para_value += w_t.text
+                                except IndexError:
+                                    para_value += ""
+                        # print(f"Footer {footer}, paragraph {ind}: {para_value}")
+                        output += f"Footer {footer}, paragraph {ind}: {para_value}\n"
+                        if "Liebherr-Elektronik GmbH" in para_value:
+                            pass
+                    except IndexError:
+                        # print(f"Footer {footer}, paragraph {ind}: No text")
+                        output += f"Footer {footer}, paragraph {ind}: No text\n"
+                for table_no, table in enumerate(xml_tree.xpath("w:tbl", namespaces=WORD_NS), start=1):
+                    for row_no, row in enumerate(table.xpath("w:tr", namespaces=WORD_NS)):
+                        for cell_no, cell in enumerate(row.xpath("w:tc", namespaces=WORD_NS), start=1):
+                            cell_value = ""
+                            for paragraph in cell.xpath("w:p", namespaces=WORD_NS):
+                                for w_r in paragraph.xpath("w:r", namespaces=WORD_NS):
+                                    for w_t in w_r.xpath("w:t", namespaces=WORD_NS):
+                                        try:
+                                            cell_value += w_t.text
+                                        except IndexError:
+                                            cell_value += ""
+                            # print(f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}")
+                            output += f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}\n"
     except Exception as err:
         # print(f"Error, could not read footers: {err}\n{format_exc()}")
         output = f"Error, could not read footers: {err}\n{format_exc()}"
@@ -139,49 +390,41 @@ def get_regex_string(docx: str, reg_ex: str, back_up: bool = False, debug: bool
         int: 0 if successful, 1 if not
     """
 
-    unarchive_file(docx)
-    ext = "." + docx.split(".")[-1]
-    docx_dir = docx.replace(ext, "")
-
     try:
-        footers = 0
-        for xml in listdir(join(docx_dir, "word")):
-            if xml.startswith("footer"):
-                footers += 1
-        for footer in range(1, footers + 1, 1):
-            xml_path = join(docx_dir, "word", f"footer{footer}.xml")
-            xml_tree = etree.parse(xml_path)
-            for ind, paragraph in enumerate(xml_tree.xpath(".//w:p", namespaces=WORD_NS), start=1):
-                try:
-                    para_value = ""
-                    for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
-                        for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
-                            try:
-                                para_value += w_t.text
-                            except IndexError:
-                                para_value += ""
-                    if debug:
-                        print(f"Footer {footer}, paragraph {ind}: {para_value}")
-                    if search(reg_ex, para_value):
-                        return search(reg_ex, para_value).group(0)
-                except IndexError:
-                    print(f"Footer {footer}, paragraph {ind}: No text")
-            for table_no, table in enumerate(xml_tree.xpath(".//w:tbl", namespaces=WORD_NS), start=1):
-                for row_no, row in enumerate(table.xpath(".//w:tr", namespaces=WORD_NS)):
-                    for cell_no, cell in enumerate(row.xpath(".//w:tc", namespaces=WORD_NS), start=1):
-                        cell_value = ""
-                        for paragraph in cell.xpath(".//w:p", namespaces=WORD_NS):
-                            for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
-                                for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
-                                    try:
-                                        cell_value += w_t.text
-                                    except IndexError:
-                                        cell_value += ""
+        with DocxPackage(docx) as package:
+            for footer, xml_path in enumerate(package.parts("footer"), start=1):
+                xml_tree = package.tree(xml_path)
+                for ind, paragraph in enumerate(xml_tree.xpath(".//w:p", namespaces=WORD_NS), start=1):
+                    try:
+                        para_value = ""
+                        for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
+                            for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
+                                try:
+                                    para_value += w_t.text
+                                except IndexError:
+                                    para_value += ""
                         if debug:
-                            print(f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}")
-                        # cell_value = cell_value.replace("Copyright", "©").replace("copyright", "©")
-                        if search(reg_ex, cell_value):
-                            return search(reg_ex, cell_value).group(0)
+                            print(f"Footer {footer}, paragraph {ind}: {para_value}")
+                        if search(reg_ex, para_value):
+                            return search(reg_ex, para_value).group(0)
+                    except IndexError:
+                        print(f"Footer {footer}, paragraph {ind}: No text")
+                for table_no, table in enumerate(xml_tree.xpath(".//w:tbl", namespaces=WORD_NS), start=1):
+                    for row_no, row in enumerate(table.xpath(".//w:tr", namespaces=WORD_NS)):
+                        for cell_no, cell in enumerate(row.xpath(".//w:tc", namespaces=WORD_NS), start=1):
+                            cell_value = ""
+                            for paragraph in cell.xpath(".//w:p", namespaces=WORD_NS):
+                                for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
+                                    for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
+                                        try:
+                                            cell_value += w_t.text
+                                        except IndexError:
+                                            cell_value += ""
+                            if debug:
+                                print(f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}")
+                            # cell_value = cell_value.replace("Copyright", "©").replace("copyright", "©")
+                            if search(reg_ex, cell_value):
+                                return search(reg_ex, cell_value).group(0)
     except Exception as err:
         print(f"Error, could not read footers: {err}\n{format_exc()}")
         return 1
@@ -202,59 +445,15 @@ def replace_copyright(docx: str, debug: bool = False) -> int:
         int: 0 if successful, 1 if not
     """
 
-    unarchive_file(docx)
-    ext = "." + docx.split(".")[-1]
-    docx_dir = docx.replace(ext, "")
-
     try:
-        footers = 0
-        for xml in listdir(join(docx_dir, "word")):
-            if xml.startswith("footer"):
-                footers += 1
-
-        for footer in range(1, footers + 1):
-            xml_path = join(docx_dir, "word", f"footer{footer}.xml")
-            xml_tree = etree.parse(xml_path)
-            
-            for ind, paragraph in enumerate(xml_tree.xpath(".//w:p", namespaces=WORD_NS), start=1):
-                try:
-                    para_value = ""
-                    for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
-                        for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
-                            try:
-                                para_value += w_t.text
-                            except IndexError:
-                                para_value += ""
-
-                    # Replace "Copyright" with '©' in the paragraph
-                    para_value = para_value.replace("Copyright", "©")
-                    # Clear the existing text in the paragraph
-
-                except IndexError:
-                    print(f"Footer {footer}, paragraph {ind}: No text")
-
-            for table_no, table in enumerate(xml_tree.xpath(".//w:tbl", namespaces=WORD_NS), start=1):
-                for row_no, row in enumerate(table.xpath(".//w:tr", namespaces=WORD_NS)):
-                    for cell_no, cell in enumerate(row.xpath(".//w:tc", namespaces=WORD_NS), start=1):
-                        cell_value = ""
-                        for paragraph in cell.xpath(".//w:p", namespaces=WORD_NS):
-                            for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
-                                for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
-                                    try:
-                                        if "Copyright" in w_t.text:
-                                            w_t.text = w_t.text.replace("Copyright", "©")
-                                        cell_value += w_t.text
-                                    except IndexError:
-                                        cell_value += ""
-
-                        # Replace "Copyright" with '©' in the cell
-                        print(cell_value)
-                        cell_value = cell_value.replace("Copyright", "©")
-                        print(cell_value)
-        xml_tree.write(xml_path, encoding="utf-8", pretty_print=True)
-
+        with DocxPackage(docx) as package:
+            replaced = package.replace_copyright()
+            if debug:
+                print(f"Replaced {replaced} times Copyright in {basename(docx)}")
+            if package.is_modified():
+                package.save()
     except Exception as err:
-        print(f"Error, could not read footers: {err}\n{format_exc()}")
+        print(f"Error, could not replace copyright: {err}\n{format_exc()}")
         return 1
 
     return 0
@@ -272,49 +471,41 @@ def get_template_version(docx: str, reg_ex: str, back_up: bool = False, debug: b
         int: 0 if successful, 1 if not
     """
 
-    unarchive_file(docx)
-    ext = "." + docx.split(".")[-1]
-    docx_dir = docx.replace(ext, "")
-
     try:
-        footers = 0
-        for xml in listdir(join(docx_dir, "word")):
-            if xml.startswith("footer"):
-                footers += 1
-        for footer in range(1, footers + 1, 1):
-            xml_path = join(docx_dir, "word", f"footer{footer}.xml")
-            xml_tree = etree.parse(xml_path)
-            for ind, paragraph in enumerate(xml_tree.xpath(".//w:p", namespaces=WORD_NS), start=1):
-                try:
-                    para_value = ""
-                    for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
-                        for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
-                            try:
-                                para_value += w_t.text
-                            except IndexError:
-                                para_value += ""
-                    if debug:
-                        print(f"Footer {footer}, paragraph {ind}: {para_value}")
-                    if search(reg_ex, para_value):
-                        return search(reg_ex, para_value).group(0)
-                except IndexError:
-                    print(f"Footer {footer}, paragraph {ind}: No text")
-            for table_no, table in enumerate(xml_tree.xpath(".//w:tbl", namespaces=WORD_NS), start=1):
-                for row_no, row in enumerate(table.xpath(".//w:tr", namespaces=WORD_NS)):
-                    for cell_no, cell in enumerate(row.xpath(".//w:tc", namespaces=WORD_NS), start=1):
-                        cell_value = ""
-                        for paragraph in cell.xpath(".//w:p", namespaces=WORD_NS):
-                            for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
-                                for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
-                                    try:
-                                        cell_value += w_t.text
-                                    except IndexError:
-                                        cell_value += ""
+        with DocxPackage(docx) as package:
+            for footer, xml_path in enumerate(package.parts("footer"), start=1):
+                xml_tree = package.tree(xml_path)
+                for ind, paragraph in enumerate(xml_tree.xpath(".//w:p", namespaces=WORD_NS), start=1):
+                    try:
+                        para_value = ""
+                        for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
+                            for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
+                                try:
+                                    para_value += w_t.text
+                                except IndexError:
+                                    para_value += ""
                         if debug:
-                            print(f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}")
-                        cell_value = cell_value.replace("Copyright", "©").replace("copyright", "©")
-                        if cell_no == 2 and cell_value != "":
-                            return cell_value
+                            print(f"Footer {footer}, paragraph {ind}: {para_value}")
+                        if search(reg_ex, para_value):
+                            return search(reg_ex, para_value).group(0)
+                    except IndexError:
+                        print(f"Footer {footer}, paragraph {ind}: No text")
+                for table_no, table in enumerate(xml_tree.xpath(".//w:tbl", namespaces=WORD_NS), start=1):
+                    for row_no, row in enumerate(table.xpath(".//w:tr", namespaces=WORD_NS)):
+                        for cell_no, cell in enumerate(row.xpath(".//w:tc", namespaces=WORD_NS), start=1):
+                            cell_value = ""
+                            for paragraph in cell.xpath(".//w:p", namespaces=WORD_NS):
+                                for w_r in paragraph.xpath(".//w:r", namespaces=WORD_NS):
+                                    for w_t in w_r.xpath(".//w:t", namespaces=WORD_NS):
+                                        try:
+                                            cell_value += w_t.text
+                                        except IndexError:
+                                            cell_value += ""
+                            if debug:
+                                print(f"Footer: {footer} Tabel {table_no}, row {row_no}, cell {cell_no}: {cell_value}")
+                            cell_value = cell_value.replace("Copyright", "©").replace("copyright", "©")
+                            if cell_no == 2 and cell_value != "":
+                                return cell_value
     except Exception as err:
         print(f"Error, could not read footers: {err}\n{format_exc()}")
         return 1
@@ -346,24 +537,12 @@ def docx_footer_replace(docx: str, old: str, new: str, back_up: bool = False, de
         return 1
 
     try:
-        doc = Document(docx)
-        for secn_num, section in enumerate(doc.sections, start=1):
-            for footer_para in section.footer.paragraphs:
-                if debug:
-                    print(f"Section {secn_num}, Footer para text: {footer_para.text}")
-                if old in footer_para.text:
-                    footer_para.text = footer_para.text.replace(old, new)
-            for footer_table in section.footer.tables:
-                for row in footer_table.rows:
-                    for cell in row.cells:
-                        for para in cell.paragraphs:
-                            if debug:
-                                print(f"Section {secn_num}, Footer table cell text: {para.text}")
-                            if old in para.text:
-                                para.text = para.text.replace(old, new)
+        package = DocxPackage(docx)
+        package.replace_text("footer", old, new, debug)
     except Exception as err:
         print(f"Error: {err}\n{format_exc()}")
         return 1
+
     try:
         if back_up:
             copy(docx, docx.replace(doc_type, f"_backup{doc_type}"))
@@ -372,10 +551,12 @@ def docx_footer_replace(docx: str, old: str, new: str, back_up: bool = False, de
         return 1
 
     try:
-        doc.save(docx)
+        package.save()
     except Exception as err:
         print(f"Error, could not save document: {err}\n{format_exc()}")
         return 1
+    finally:
+        package.close()
     return 0
 
 
@@ -403,27 +584,12 @@ def docx_header_replace(docx: str, old: str, new: str, back_up: bool = False, de
         return 1
 
     try:
-        doc = Document(docx)
-
-        # If something is not printed here, it might not be a header
-        for secn_num, section in enumerate(doc.sections, start=1):
-            for header_para in section.header.paragraphs:
-                if debug:
-                    print(f"Section {secn_num}, Header para text: {header_para.text}")
-                if old in header_para.text:
-                    header_para.text = header_para.text.replace(old, new)
-
-            for header_table in section.header.tables:
-                for row in header_table.rows:
-                    for cell in row.cells:
-                        for para in cell.paragraphs:
-                            if debug:
-                                print(f"Section {secn_num}, Header table cell text: {para.text}")
-                            if old in para.text:
-                                para.text = para.text.replace(old, new)
+        package = DocxPackage(docx)
+        package.replace_text("header", old, new, debug)
     except Exception as err:
         print(f"Error: {err}\n{format_exc()}")
         return 1
+
     try:
         if back_up:
             copy(docx, docx.replace(doc_type, f"_backup{doc_type}"))
@@ -432,10 +598,12 @@ def docx_header_replace(docx: str, old: str, new: str, back_up: bool = False, de
         return 1
 
     try:
-        doc.save(docx)
+        package.save()
     except Exception as err:
         print(f"Error, could not save document: {err}\n{format_exc()}")
         return 1
+    finally:
+        package.close()
     return 0
 
 
@@ -463,23 +631,12 @@ def docx_content_replace(docx: str, old: str, new: str, back_up: bool = False, d
         return 1
 
     try:
-        doc = Document(docx)
-        for para in doc.paragraphs:
-            if debug:
-                print(f"Para text: {para.text}")
-            if old in para.text:
-                para.text = para.text.replace(old, new)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for para in cell.paragraphs:
-                        if debug:
-                            print(f"Table cell text: {para.text}")
-                        if old in para.text:
-                            para.text = para.text.replace(old, new)
+        package = DocxPackage(docx)
+        package.replace_text("content", old, new, debug)
     except Exception as err:
         print(f"Error: {err}\n{format_exc()}")
         return 1
+
     try:
         if back_up:
             copy(docx, docx.replace(doc_type, f"_backup{doc_type}"))
@@ -488,10 +645,12 @@ def docx_content_replace(docx: str, old: str, new: str, back_up: bool = False, d
         return 1
 
     try:
-        doc.save(docx)
+        package.save()
     except Exception as err:
         print(f"Error, could not save document: {err}\n{format_exc()}")
         return 1
+    finally:
+        package.close()
     return 0
 
 def replace_media(docx: str, old_media_name: str, new_media_path: str, back_up: bool = False, debug: bool = False) -> int:
@@ -515,12 +674,9 @@ def replace_media(docx: str, old_media_name: str, new_media_path: str, back_up:
         print(f"Error, file is not a docx or docm file: {docx}")
         return 1
 
-    unarchive_file(docx)
-    docx_dir = docx.replace(doc_type, "")
     try:
-        if isfile(join(docx_dir, "word", "media", old_media_name)):
-            remove(join(docx_dir, "word", "media", old_media_name))
-            copy(new_media_path, join(docx_dir, "word", "media", old_media_name))
+        package = DocxPackage(docx)
+        package.replace_media(old_media_name, new_media_path)
     except Exception as err:
         print(f"Error, could not replace media: {err}\n{format_exc()}")
         return 1
@@ -531,12 +687,12 @@ def replace_media(docx: str, old_media_name: str, new_media_path: str, back_up:
         print(f"Error, could not make back-up: {err}\n{format_exc()}")
         return 1
     try:
-        zip_word_folder(docx_dir)
-        remove(docx)
-        rename(join(docx.replace(doc_type, ".zip")), docx)
+        package.save()
     except Exception as err:
-        print(f"Error, could not zip folder: {err}\n{format_exc()}")
+        print(f"Error, could not save document: {err}\n{format_exc()}")
         return 1
+    finally:
+        package.close()
     return 0
 
 def word2pdf(
@@ -546,7 +702,11 @@ def word2pdf(
         debug: bool = False,
         qt_window: QMainWindow = None,
         progress: Signal = Signal(0),
-        console: Signal = Signal("")):
+        console: Signal = Signal(""),
+        backend: str = None,
+        workers: int = 1,
+        timeout: int = CONVERSION_TIMEOUT,
+        retries: int = 1):
     """Convert word files to PDF
 
     Args:
@@ -555,6 +715,11 @@ def word2pdf(
         skip_existing (bool): skip existing files or not
         debug (bool, optional): Print debug info or not. Defaults to False.
         qt_window (QMainWindow, optional): QT Main window. Defaults to None.
+        backend (str, optional): "word" (win32com) or "libreoffice" (headless soffice).
+            Defaults to Word on Windows and LibreOffice elsewhere.
+        workers (int, optional): number of LibreOffice converter processes. Defaults to 1.
+        timeout (int, optional): seconds after which a LibreOffice conversion is killed. Defaults to CONVERSION_TIMEOUT.
+        retries (int, optional): how many times a failed file is converted again. Defaults to 1.
     """
     errors = 0
 
@@ -563,82 +728,64 @@ def word2pdf(
     for (dirpath, _, filenames) in walk(dir_name):
         list_of_files += [join(dirpath, file_).replace("\\", sep).replace("/", sep) for file_ in filenames]
 
-    progress_index = 0
-    progress_max = len(list_of_files)
+    jobs = []
+    for file_ in list_of_files:
+        ext = "." + file_.split(".")[-1].lower()
+        if ext in WORD_EXTENSIONS and "$" not in file_:
+            pdf_file = file_.replace(ext, ".pdf")
+            if isfile(pdf_file) and not skip_existing:
+                remove(pdf_file)
+            elif isfile(pdf_file) and skip_existing:
+                continue
+            jobs.append((file_, pdf_file))
+
+    progress_max = len(jobs)
     # Cosmin 14.02.2022 - Created below container because if we print a progressbar with tqdm
     # when the console is hidden for exe, the script doesn't run.
-    in_container = list_of_files if qt_window is not None else tqdm(
-        list_of_files)
+    progress_bar = tqdm(total=progress_max) if qt_window is None else None
+    converted = []
+    progress_lock = Lock()
 
     start_time = time()
 
-    for file_ in in_container:
-        ext = "." + file_.split(".")[-1].lower()
-        if qt_window is not None:
-            progress.emit(progress_index * 100 / progress_max)
-            progress_index += 1
-        try:
-            if ext in WORD_EXTENSIONS and "$" not in file_:
-                if debug:
-                    console.emit(f"Converting {file_.split(sep)[-1]}")
-                pdf_file = file_.replace(ext, ".pdf")
-
-                if isfile(pdf_file) and not skip_existing:
-                    remove(pdf_file)
-                elif isfile(pdf_file) and skip_existing:
-                    continue
-                word = Dispatch("Word.Application")
-
-                doc = word.Documents.Open(file_)
-
-                # Save as PDF - Advanced Option, with choices
-                doc.ExportAsFixedFormat(pdf_file,
-                                        17,  # ExportFormat # 17 - wdExportFormatPDF, 18 - wdExportFormatXPS
-                                        False,  # OpenAfterExport # Boolean value
-                                        0,  # OptimizeFor # 0 - wdExportOptimizeForPrint, 1 - wdExportOptimizeForOnScreen
-                                        0,  # Range # 0 - wdExportAllDocument,
-                                            # 1 - wdExportSelection,
-                                            # 2 - wdExportCurrentPage,
-                                            # 3 - wdExportFromTo
-                                        1,  # From # keep 1 as default if Range is 0
-                                        1,  # To # keep 1 as default if Range is 0
-                                        7,  # Item # 0 - wdExportDocumentContent, 7 - wdExportDocumentWithMarkup
-                                        False,  # IncludeDocProps # Boolean value
-                                        False,  # KeepIRM # Boolean value
-                                        bookmarks,  # CreateBookmarks
-                                                    # 0 - wdExportCreateNoBookmarks,
-                                                    # 1 - wdExportCreateHeadingBookmarks,
-                                                    # 2 - wdExportCreateWordBookmarks
-                                        True,  # DocStructureTags # Boolean value
-                                        True,  # BitmapMissingFonts # Boolean value
-                                        False,  # UseISO19005_1 # Boolean value
-                                        )
-
-                doc.Close()
-
-        except (OSError, RuntimeError, ValueError, NameError, AttributeError):
-            if debug:
-                if not isdir(join(qt_window.exe_path, "debug")):
-                    mkdir(join(qt_window.exe_path, "debug"))
-                errors += 1
-                if qt_window is not None:
-                    console.emit(f"There was an error while processing this file: {file_}")
-                    console.emit("The file was not saved to PDF. Please correct the issue and try again.")
-                    console.emit(f"The error message was: {format_exc()}")
-
-                if exists(join(qt_window.exe_path, "debug", "word2pdf_log.txt")):
-                    with open(join(qt_window.exe_path, "debug", "word2pdf_log.txt"), "a", encoding='utf-8') as log:
-                        log.write(f"There was an error while processing this file: {file_}\n")
-                        log.write("The file was not saved to PDF. Please correct the issue and try again.\n")
-                        log.write(f"The error message was: {format_exc()}\n\n")
-                else:
-                    with open(join(qt_window.exe_path, "debug", "word2pdf_log.txt"), "w", encoding='utf-8') as log:
-                        log.write(f"There was an error while processing this file: {file_}\n")
-                        log.write("The file was not saved to PDF. Please correct the issue and try again.\n")
-                        log.write(f"The error message was: {format_exc()}\n\n")
-                # word.Quit()
-                doc.Close()
-                continue
+    def _file_done(file_: str, error: str):
+        with progress_lock:
+            converted.append(file_)
+            if qt_window is not None:
+                progress.emit(len(converted) * 100 / progress_max)
+                if debug and error is None:
+                    console.emit(f"Converted {file_.split(sep)[-1]}")
+            else:
+                progress_bar.update(1)
+
+    results = convert_word_files(
+        jobs,
+        backend=backend,
+        workers=workers,
+        bookmarks=bookmarks,
+        timeout=timeout,
+        retries=retries,
+        callback=_file_done
+    )
+    if progress_bar is not None:
+        progress_bar.close()
+
+    for file_, error in results.items():
+        if error is None:
+            continue
+        if debug:
+            if not isdir(join(qt_window.exe_path, "debug")):
+                mkdir(join(qt_window.exe_path, "debug"))
+            errors += 1
+            if qt_window is not None:
+                console.emit(f"There was an error while processing this file: {file_}")
+                console.emit("The file was not saved to PDF. Please correct the issue and try again.")
+                console.emit(f"The error message was: {error}")
+
+            with open(join(qt_window.exe_path, "debug", "word2pdf_log.txt"), "a", encoding='utf-8') as log:
+                log.write(f"There was an error while processing this file: {file_}\n")
+                log.write("The file was not saved to PDF. Please correct the issue and try again.\n")
+                log.write(f"The error message was: {error}\n\n")
 
     if qt_window is None:
         if errors == 0:
@@ -697,6 +844,76 @@ def get_table_column_widths(docx: str, where: str) -> dict:
                     widths[f"section_{sec_num}_{where}_table"] = current_table_widths
     return widths
 
+def _adjust_column_widths_xml(package: DocxPackage, where: str, col: int = None, difference: float = None) -> int:
+    """XML method of adjust_column_widths, on a document opened in memory
+
+    Args:
+        package (DocxPackage): the document
+        where (str): where to search for the tables: header, footer or content
+        col (int, optional): column to adjust. Defaults to None.
+        difference (float, optional): see adjust_column_widths. Defaults to None.
+
+    Returns:
+        int: number of tables
+    """
+    tables = 0
+    col_width = None
+    w_attr = f"{{{WORD_NS['w']}}}w"
+    w_left = f"{{{WORD_NS['w']}}}left"
+    w_right = f"{{{WORD_NS['w']}}}right"
+    if where in ("header", "footer"):
+        for xml_path in package.parts(where):
+            xml_tree = package.tree(xml_path)
+            for table_xml in xml_tree.xpath("//w:tbl", namespaces=WORD_NS):
+                tables += 1
+                for table_grid in table_xml.xpath("w:tblGrid", namespaces=WORD_NS):
+                    for ind, column in enumerate(table_grid.xpath("w:gridCol", namespaces=WORD_NS), start=1):
+                        if int(float(column.attrib[w_attr])) >= 4800:  # Cosmin added first conversion to float, as some attrib have 4151.59999
+                            break
+                        if ind == col:
+                            if difference is not None:
+                                # delta = int((int(float(column.attrib[w_attr])) - (int(float(column.attrib[w_attr])) * difference)) / 2)
+                                delta = int((int(float(column.attrib[w_attr])) - 4800) / 2)
+                                # col_width = str(int(float(column.attrib[w_attr])) * difference)
+                                col_width = "4800"
+                                column.attrib[w_attr] = col_width
+                                prev_col_width = str(int(float(table_grid.xpath(f"w:gridCol[{ind - 1}]", namespaces=WORD_NS)[0].attrib[w_attr])) + int(delta))
+                                table_grid.xpath(f"w:gridCol[{ind - 1}]", namespaces=WORD_NS)[0].attrib[w_attr] = prev_col_width
+                                next_col_width = str(int(float(table_grid.xpath(f"w:gridCol[{ind + 1}]", namespaces=WORD_NS)[0].attrib[w_attr])) + int(delta))
+                                table_grid.xpath(f"w:gridCol[{ind + 1}]", namespaces=WORD_NS)[0].attrib[w_attr] = next_col_width
+                            break
+                # if col_width is None:
+                #     break
+                for table_row in table_xml.xpath(".//w:tr", namespaces=WORD_NS):
+                    for ind, row_cell in enumerate(table_row.xpath(".//w:tc", namespaces=WORD_NS), start=1):
+                        if ind == col - 1:
+                            if col_width is not None:
+                                row_cell.xpath(".//w:tcPr/w:tcW", namespaces=WORD_NS)[0].attrib[w_attr] = prev_col_width
+                        elif ind == col:
+                            if col_width is not None:
+                                row_cell.xpath(".//w:tcPr/w:tcW", namespaces=WORD_NS)[0].attrib[w_attr] = col_width
+                            for w_p in row_cell.xpath(".//w:p", namespaces=WORD_NS):
+                                for w_r in w_p.xpath(".//w:r", namespaces=WORD_NS):
+                                    # Insert xml as child of w_r
+                                    for prefix, uri in WORD_NS.items():
+                                        etree.register_namespace(prefix, uri)
+                                    xml_elem = '<w:rPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:b w:val="0"/><w:sz w:val="22"/><w:szCs w:val="22"/></w:rPr>'
+                                    xml_elem = etree.fromstring(xml_elem)
+                                    w_r.insert(0, xml_elem)
+                        elif ind == col + 1:
+                            if col_width is not None:
+                                row_cell.xpath(".//w:tcPr/w:tcW", namespaces=WORD_NS)[0].attrib[w_attr] = next_col_width
+                            for para in row_cell.xpath(".//w:p", namespaces=WORD_NS):
+                                for para_prop in para.xpath(".//w:pPr", namespaces=WORD_NS):
+                                    for ind_prop in para_prop.xpath(".//w:ind", namespaces=WORD_NS):
+                                        ind_prop.attrib[w_left] = str(int(float(ind_prop.attrib[w_left])) + delta)
+                                        ind_prop.attrib[w_right] = "0"
+            package.mark_modified(xml_path)
+    else:
+        print("Content not implemented yet")
+    return tables
+
+
 def adjust_column_widths(
         docx: str, where: str, widths: list = None, col: int = None,
         difference: float = None, xml_method: bool = True,
@@ -725,81 +942,16 @@ def adjust_column_widths(
     """
 
     if xml_method:
-        col_width = None
-        w_attr = f"{{{WORD_NS['w']}}}w"
-        w_left = f"{{{WORD_NS['w']}}}left"
-        w_right = f"{{{WORD_NS['w']}}}right"
-        unarchive_file(docx)
         ext = "." + docx.split(".")[-1]
-        docx_dir = docx.replace(ext, "")
-        if where in ("header", "footer"):
-            for xml in listdir(join(docx_dir, "word")):
-                if xml.startswith(where):
-                    xml_path = join(docx_dir, "word", xml)
-                    xml_tree = etree.parse(xml_path)
-                    for table_xml in xml_tree.xpath("//w:tbl", namespaces=WORD_NS):
-                        for table_grid in table_xml.xpath("w:tblGrid", namespaces=WORD_NS):
-                            for ind, column in enumerate(table_grid.xpath("w:gridCol", namespaces=WORD_NS), start=1):
-                                if int(float(column.attrib[w_attr])) >= 4800:  # Cosmin added first conversion to float, as some attrib have 4151.59999
-                                    break
-                                if ind == col:
-                                    if difference is not None:
-                                        # delta = int((int(float(column.attrib[w_attr])) - (int(float(column.attrib[w_attr])) * difference)) / 2)
-                                        delta = int((int(float(column.attrib[w_attr])) - 4800) / 2)
-                                        # col_width = str(int(float(column.attrib[w_attr])) * difference)
-                                        col_width = "4800"
-                                        column.attrib[w_attr] = col_width
-                                        prev_col_width = str(int(float(table_grid.xpath(f"w:gridCol[{ind - 1}]", namespaces=WORD_NS)[0].attrib[w_attr])) + int(delta))
-                                        table_grid.xpath(f"w:gridCol[{ind - 1}]", namespaces=WORD_NS)[0].attrib[w_attr] = prev_col_width
-                                        next_col_width = str(int(float(table_grid.xpath(f"w:gridCol[{ind + 1}]", namespaces=WORD_NS)[0].attrib[w_attr])) + int(delta))
-                                        table_grid.xpath(f"w:gridCol[{ind + 1}]", namespaces=WORD_NS)[0].attrib[w_attr] = next_col_width
-                                    break
-                        # if col_width is None:
-                        #     break
-                        for table_row in table_xml.xpath(".//w:tr", namespaces=WORD_NS):
-                            for ind, row_cell in enumerate(table_row.xpath(".//w:tc", namespaces=WORD_NS), start=1):
-                                if ind == col - 1:
-                                    if col_width is not None:
-                                        row_cell.xpath(".//w:tcPr/w:tcW", namespaces=WORD_NS)[0].attrib[w_attr] = prev_col_width
-                                elif ind == col:
-                                    if col_width is not None:
-                                        row_cell.xpath(".//w:tcPr/w:tcW", namespaces=WORD_NS)[0].attrib[w_attr] = col_width
-                                    for w_p in row_cell.xpath(".//w:p", namespaces=WORD_NS):
-                                        for w_r in w_p.xpath(".//w:r", namespaces=WORD_NS):
-                                            # Insert xml as child of w_r
-                                            for prefix, uri in WORD_NS.items():
-                                                etree.register_namespace(prefix, uri)
-                                            xml_elem = '<w:rPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:b w:val="0"/><w:sz w:val="22"/><w:szCs w:val="22"/></w:rPr>'
-                                            xml_elem = etree.fromstring(xml_elem)
-                                            w_r.insert(0, xml_elem)
-                                elif ind == col + 1:
-                                    if col_width is not None:
-                                        row_cell.xpath(".//w:tcPr/w:tcW", namespaces=WORD_NS)[0].attrib[w_attr] = next_col_width
-                                    for para in row_cell.xpath(".//w:p", namespaces=WORD_NS):
-                                        for para_prop in para.xpath(".//w:pPr", namespaces=WORD_NS):
-                                            for ind_prop in para_prop.xpath(".//w:ind", namespaces=WORD_NS):
-                                                ind_prop.attrib[w_left] = str(int(float(ind_prop.attrib[w_left])) + delta)
-                                                ind_prop.attrib[w_right] = "0"
-                    xml_tree.write(xml_path, encoding="utf-8", xml_declaration=True)
-        else:
-            print("Content not implemented yet")
         try:
+            package = DocxPackage(docx)
+            _adjust_column_widths_xml(package, where, col, difference)
             if back_up:
                 copy(docx, docx.replace(ext, f"_backup{ext}"))
-            zip_word_folder(docx_dir)
-            rmtree(docx_dir)
-            deleted = False
-            while not deleted:
-                try:
-                    remove(docx)
-                    deleted = True
-                except Exception as err:
-                    print(f"Error, could not delete file: {err}\n{format_exc()}")
-                    sleep(1)
-                
-            rename(docx.replace(ext, ".zip"), docx)
+            package.save()
+            package.close()
         except Exception as err:
-            print(f"Error, could not zip folder: {err}\n{format_exc()}")
+            print(f"Error, could not adjust column widths: {err}\n{format_exc()}")
             return 1
         return 0
 
@@ -870,7 +1022,8 @@ def update_footer_table_widths(
         back_up (bool, optional): create a backup of the original file. Defaults to False.
         debug (bool, optional): print debug messages. Defaults to False.
     """
-    if get_footer_type(docx) == "old_type":
+    footer_type = get_footer_type(docx)
+    if footer_type == "old_type":
         print("Yo 1")
         adjust_column_widths(
             docx,
@@ -879,7 +1032,7 @@ def update_footer_table_widths(
             back_up=back_up,
             debug=debug
         )
-    elif get_footer_type(docx) == "new_type":
+    elif footer_type == "new_type":
         print("Yo 2")
         adjust_column_widths(
             docx,
@@ -890,3 +1043,163 @@ def update_footer_table_widths(
         )
     else:
         print("Unknown footer type")
+
+
+class UnknownDocxOperation(Exception):
+    pass
+
+
+def _apply_docx_operation(package: DocxPackage, operation: dict) -> int:
+    """Applies one operation of process_docx to an open document
+
+    Returns:
+        int: number of matches (replacements, adjusted tables, replaced media)
+    """
+    name = operation["operation"]
+    if name == "content_replace":
+        return package.replace_text("content", operation["old"], operation["new"])
+    if name == "footer_replace":
+        return package.replace_text("footer", operation["old"], operation["new"])
+    if name == "header_replace":
+        return package.replace_text("header", operation["old"], operation["new"])
+    if name == "replace_copyright":
+        return package.replace_copyright()
+    if name == "replace_media":
+        return int(package.replace_media(operation["old_media_name"], operation["new_media_path"]))
+    if name == "adjust_column_widths":
+        return _adjust_column_widths_xml(
+            package, operation["where"], operation.get("col"), operation.get("difference"))
+    raise UnknownDocxOperation(f"Unknown docx operation: {name}. Use one of {', '.join(DOCX_OPERATIONS)}")
+
+
+def process_docx(docx: str, operations: list, back_up: bool = False) -> dict:
+    """Applies several operations to a docx file or docm file, which is opened and saved only once.
+
+    The operations are dictionaries with the name of the operation and its arguments,
+    with the same meaning as in the functions of the same name:
+        {"operation": "content_replace", "old": str, "new": str}
+        {"operation": "footer_replace", "old": str, "new": str}
+        {"operation": "header_replace", "old": str, "new": str}
+        {"operation": "replace_copyright"}
+        {"operation": "replace_media", "old_media_name": str, "new_media_path": str}
+        {"operation": "adjust_column_widths", "where": str, "col": int, "difference": float}
+
+    Args:
+        docx (str): path + filename of the docx file or docm file
+        operations (list): operations to apply, in order
+        back_up (bool, optional): create a backup of the original file. Defaults to False.
+
+    Returns:
+        dict: report {"document": str, "operations": [{"operation": str, "matches": int, "seconds": float}],
+            "saved": bool, "seconds": float, "error": str or None}
+    """
+    start = perf_counter()
+    report = {"document": docx, "operations": [], "saved": False, "seconds": 0, "error": None}
+    try:
+        with DocxPackage(docx) as package:
+            for operation in operations:
+                operation_start = perf_counter()
+                matches = _apply_docx_operation(package, operation)
+                report["operations"].append({
+                    "operation": operation["operation"],
+                    "matches": matches,
+                    "seconds": round(perf_counter() - operation_start, 4)
+                })
+            if package.is_modified():
+                if back_up:
+                    copy(docx, f"{splitext(docx)[0]}_backup{splitext(docx)[1]}")
+                package.save()
+                report["saved"] = True
+    except Exception as err:
+        report["error"] = f"{err}\n{format_exc()}"
+    report["seconds"] = round(perf_counter() - start, 4)
+    return report
+
+
+def process_docx_folder(
+        dir_name: str,
+        operations: list,
+        workers: int = None,
+        back_up: bool = False,
+        export: str = None,
+        debug: bool = False,
+        qt_window: QMainWindow = None,
+        progress: Signal = Signal(0),
+        console: Signal = Signal("")) -> list:
+    """Applies several operations to all the docx and docm files of a folder and its sub-folders,
+    see process_docx. The documents are processed in parallel worker processes.
+
+    Args:
+        dir_name (str): folder path
+        operations (list): operations to apply to every document, see process_docx
+        workers (int, optional): number of worker processes, the number of CPUs if None. Defaults to None.
+        back_up (bool, optional): create a backup of the original files. Defaults to False.
+        export (str, optional): path + filename of a .json or .xlsx report. Defaults to None.
+        debug (bool, optional): print debug messages. Defaults to False.
+        qt_window (QMainWindow, optional): QT Main window. Defaults to None.
+
+    Returns:
+        list: the reports of process_docx, in the order of the documents
+    """
+    for operation in operations:
+        if operation.get("operation") not in DOCX_OPERATIONS:
+            raise UnknownDocxOperation(
+                f"Unknown docx operation: {operation.get('operation')}. Use one of {', '.join(DOCX_OPERATIONS)}")
+
+    documents = []
+    for (dirpath, _, filenames) in walk(dir_name):
+        documents += [
+            join(dirpath, file_) for file_ in sorted(filenames)
+            if splitext(file_)[1].lower() in (".docx", ".docm") and not file_.startswith("~$")
+            and not splitext(file_)[0].endswith("_backup")
+        ]
+
+    reports = {}
+    if documents:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(process_docx, docx, operations, back_up) for docx in documents]
+            for ind, future in enumerate(as_completed(futures), start=1):
+                report = future.result()
+                reports[report["document"]] = report
+                if report["error"] is not None:
+                    if qt_window is not None:
+                        console.emit(f"{basename(report['document'])}: {report['error']}")
+                    elif debug:
+                        print(f"{report['document']}: {report['error']}")
+                if qt_window is not None:
+                    progress.emit(int(ind / len(futures) * 100))
+    reports = [reports[docx] for docx in documents]
+
+    if export is not None and export.lower().endswith(".json"):
+        with open(export, "w", encoding="utf-8") as _:
+            dump(reports, _, indent=4)
+    elif export is not None:
+        _export_docx_reports(reports, operations, export)
+    if qt_window is not None:
+        progress.emit(100)
+    return reports
+
+
+def _export_docx_reports(reports: list, operations: list, excel_path: str):
+    """Writes the reports of process_docx_folder to an Excel file, one row per document
+    with the number of matches of every operation.
+    """
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Docx Operations"
+    headers = ["Document"] + [operation["operation"] for operation in operations] + ["Saved", "Seconds", "Error"]
+    for column, header in enumerate(headers, start=1):
+        sheet.cell(row=1, column=column).value = header
+        sheet.cell(row=1, column=column).font = Font(bold=True)
+    for row, report in enumerate(reports, start=2):
+        sheet.cell(row=row, column=1).value = report["document"]
+        for column, operation in enumerate(report["operations"], start=2):
+            sheet.cell(row=row, column=column).value = operation["matches"]
+        sheet.cell(row=row, column=len(operations) + 2).value = report["saved"]
+        sheet.cell(row=row, column=len(operations) + 3).value = report["seconds"]
+        if report["error"] is not None:
+            sheet.cell(row=row, column=len(operations) + 4).value = report["error"].split("\n")[0]
+            sheet.cell(row=row, column=len(operations) + 4).fill = PatternFill(
+                start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+    workbook.save(excel_path)
+
@@ -8,7 +8,6 @@ from re import findall
 
 import xlsxwriter
 
-from fitz import open as pdf_open
 from pikepdf import open as pike_open
 from pdfreader import SimplePDFViewer
 
@@ -18,6 +17,7 @@ from pandas import DataFrame
 
 from .filelist import list_files
 from .pdf import get_pdf_content
+from .pdf import get_pdf_pages
 from .txt import word_frequency
 
 def is_fullpage_illu(text: str) -> str:
@@ -132,8 +132,7 @@ def prepare_estimation(pdf: str, type: str = "Revision", ret: bool = False):
         sheet2_row = 1
     figures = []
     icns_list = []
-    for ind, page in enumerate(pdf_open(pdf)):
-        page_text = page.get_text()
+    for ind, page_text in enumerate(get_pdf_pages(pdf)):
         content_length = str(len(page_text))
         words = findall(r"[\w']+", page_text)
         word_count = str(len(words) - 13)  # 13 for header and footer
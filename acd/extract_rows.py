@@ -9,24 +9,41 @@ Or for scanned documents where the characters are a bit fuzzy and the lines are
 
 INFO: Only as example, not imported in the module.
 """
-from os import mkdir
+from os import listdir
+from os import makedirs
+from os import cpu_count
 from os.path import sep
 from os.path import join
-from os.path import isdir
 from os.path import isfile
 from os.path import expanduser
 
 from time import sleep
+from time import perf_counter
+
+from re import compile as compile_regex
 
 from math import sqrt
 
 from itertools import chain
+from itertools import repeat
+
+from functools import lru_cache
+
+from concurrent.futures import ProcessPoolExecutor
 
 from PIL import Image
 Image.MAX_IMAGE_PIXELS = None
 # https://stackoverflow.com/questions/51152059/pillow-in-python-wont-let-me-open-image-exceeds-limit
 
-from numpy import mean
+from numpy import asarray
+from numpy import flatnonzero
+from numpy import nonzero
+from numpy import array_equal
+from numpy import ndarray
+from numpy import float32
+
+from cv2 import matchTemplate
+from cv2 import TM_SQDIFF
 from tqdm import tqdm
 
 from pyautogui import click
@@ -45,6 +62,21 @@ from clipboard import copy as clipboardcopy
 
 from pytesseract import image_to_string
 
+ROW_ARRAY_MODES = ("L", "RGB", "RGBA")  # modes which Image.fromarray gives back unchanged
+ROW_IMAGE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"]
+ROW_MATCH_CANDIDATE = 1.0  # mean squared difference per channel up to which a position is compared exactly
+STE_ROW_TEMPLATES = ("blue_line.png", "black_line_intermediate_1.png", "black_line_intermediate_2.png")
+# "black_line_last.png" is not used
+PAGE_NUMBER_PATTERN = compile_regex(r"(\d+)\.\w+$")
+
+# STE_OCR_CONFIG = "--psm 6"  # v2
+# STE_OCR_CONFIG = "--psm 6 --oem 1"  # v5
+# STE_OCR_CONFIG = "--psm 6 --oem 1 -c preserve_interword_spaces=1"  # v6
+STE_OCR_CONFIG = "--psm 6 --oem 1 -c preserve_interword_spaces=1 tosp_min_sane_kn_sp=2.8 -l spa"  # v7
+# STE_OCR_CONFIG = "--psm 13 --oem 1 -c tessedit_char_whitelist=ABCDEFG0123456789"
+# STE_OCR_CONFIG = "--psm 10 --oem 3"  # v4
+# STE_OCR_CONFIG = "--psm 13 --oem 1"  # v3
+
 DELAY_DICT = {
     (0, 16): 0.5,
     (16, 27): 0.55,
@@ -280,6 +312,21 @@ def copy_pdf_column(from_xy: tuple, to_xy: tuple, delay: int = None) -> str:
     return paste_var
 
 
+def _white_run_ends(pixels: ndarray, white: int = 255) -> list:
+    """Returns the first non-white pixel row after each run of white pixel rows.
+    A pixel row is white if the mean of all its values is at least white.
+
+    Args:
+        pixels (ndarray): page image as array of shape (height, width) or (height, width, channels)
+        white (int, optional): white value. Defaults to 255.
+
+    Returns:
+        list: pixel row numbers
+    """
+    is_white = pixels.reshape(pixels.shape[0], -1).mean(axis=1) >= white
+    return (flatnonzero(is_white[:-1] & ~is_white[1:]) + 1).tolist()
+
+
 def extract_rows_from_page(
         page_img: str,
         white: int = 255,
@@ -303,49 +350,140 @@ def extract_rows_from_page(
     page_img_name = page_img.split(sep)[-1]
 
     output_folder = join(expanduser("~/Desktop"), "content_rows") if output_folder is None else output_folder
-    if not isdir(output_folder):
-        mkdir(output_folder)
+    makedirs(output_folder, exist_ok=True)
 
     page_img = Image.open(page_img)
+    pixels = asarray(page_img)
 
     if debug:
         print(f"Image size is: {page_img.size}")
 
-    width, height = page_img.size
-    white_rows = []
-    last_row_white = False
-    for h_pix in tqdm(range(0, height)):
-        row_img = page_img.crop((0, h_pix, width, h_pix + 1))
-        if mean(row_img) >= white:
-            last_row_white = True
-        elif last_row_white:
-            # Here we will make sure we keep only the last white row
-            white_rows.append(h_pix)
-            last_row_white = False
+    height = pixels.shape[0]
+    white_rows = _white_run_ends(pixels, white)
     if debug:
         print(f"white_rows: {white_rows}")
         print(f"len white_rows: {len(white_rows)}")
     for ind, white_row in enumerate(white_rows):
-        try:
-            # white_row - 2, adds a bit of space before the content row
-            row_content_img = page_img.crop((0, white_row - 2, width, white_rows[ind + 1]))
-            row_content_img.save(
-                join(output_folder, f"{page_img_name}_row_{ind}.png")
-            )
-        except IndexError:
-            row_content_img = page_img.crop((0, white_row - 2, width, height))
-            row_content_img.save(
-                join(output_folder, f"{page_img_name}_row_{ind}.png")
-            )
+        # white_row - 2, adds a bit of space before the content row
+        top = white_row - 2
+        bottom = white_rows[ind + 1] if ind + 1 < len(white_rows) else height
+        if page_img.mode in ROW_ARRAY_MODES and top >= 0:
+            # the row slice is a view of the page array, no copy of the page is made
+            row_content_img = Image.fromarray(pixels[top:bottom])
+        else:
+            # crop pads rows above the page with black
+            row_content_img = page_img.crop((0, top, page_img.width, bottom))
+        row_content_img.save(
+            join(output_folder, f"{page_img_name}_row_{ind}.png")
+        )
 
     return len(white_rows), white_rows
 
+
+def extract_rows_from_pages(
+        page_imgs: any,
+        white: int = 255,
+        output_folder: str = None,
+        workers: int = None,
+        ext_list: list = None) -> dict:
+    """Runs extract_rows_from_page for several page images in a process pool
+
+    Args:
+        page_imgs (any): list of page image filepaths or a folder with page images
+        white (int, optional): white value. Defaults to 255.
+        output_folder (str, optional): folder to save the images to, see extract_rows_from_page.
+        workers (int, optional): number of worker processes, all CPUs if None. Defaults to None.
+        ext_list (list, optional): extensions of the page images, if page_imgs is a folder.
+            Defaults to ROW_IMAGE_EXTENSIONS.
+
+    Returns:
+        dict: {page image: (number of sub-images, list of row horizontal start coordinate)}
+    """
+    if isinstance(page_imgs, str):
+        ext_list = ROW_IMAGE_EXTENSIONS if ext_list is None else ext_list
+        page_imgs = sorted(
+            join(page_imgs, file_) for file_ in listdir(page_imgs) if file_.lower().endswith(tuple(ext_list)))
+    output_folder = join(expanduser("~/Desktop"), "content_rows") if output_folder is None else output_folder
+    makedirs(output_folder, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            extract_rows_from_page,
+            page_imgs,
+            repeat(white),
+            repeat(output_folder),
+            chunksize=max(1, len(page_imgs) // ((workers or cpu_count() or 1) * 4))
+        )
+        return dict(zip(page_imgs, results))
+
+@lru_cache(maxsize=None)
+def _load_row_template(template: str) -> ndarray:
+    """Loads a line template once per process"""
+    return asarray(Image.open(template).convert("RGB"))
+
+
+def locate_rows(page_img: any, templates: tuple = None, confidence: float = None) -> list:
+    """Returns the y coordinates where one of the line templates is found on a page image.
+    Replaces pyautogui.locateAll: the templates are loaded once and matched with OpenCV on the whole page.
+
+    Args:
+        page_img (any): page image, PIL Image or filepath
+        templates (tuple, optional): filepaths of the line templates.
+            Defaults to STE_ROW_TEMPLATES in the desktop folder.
+        confidence (float, optional): minimum similarity of a match,
+            1 - mean squared difference per channel / 255 ** 2.
+            Defaults to None, only exact matches like locateAll without confidence.
+
+    Returns:
+        list: sorted y coordinates of the top of the matches, each one once
+    """
+    if templates is None:
+        templates = tuple(join(expanduser("~/Desktop"), template) for template in STE_ROW_TEMPLATES)
+    if isinstance(page_img, str):
+        page_img = Image.open(page_img)
+    page = asarray(page_img.convert("RGB"))
+    page_float = page.astype(float32)
+    positions = set()
+    for template in templates:
+        needle = _load_row_template(template)
+        height, width = needle.shape[:2]
+        if height > page.shape[0] or width > page.shape[1]:
+            continue
+        # mean squared difference per channel, not TM_SQDIFF_NORMED:
+        # the normalized difference is always 1 for the solid black line templates
+        differences = matchTemplate(page_float, needle.astype(float32), TM_SQDIFF) / needle.size
+        if confidence is not None:
+            positions.update(flatnonzero((differences <= (1 - confidence) * 255 ** 2).any(axis=1)).tolist())
+            continue
+        # OpenCV computes the difference in float32, an exact match is not exactly 0,
+        # so the candidates are compared pixel by pixel
+        for y, x in zip(*nonzero(differences <= ROW_MATCH_CANDIDATE)):
+            if y not in positions and array_equal(page[y:y + height, x:x + width], needle):
+                positions.add(int(y))
+    return sorted(positions)
+
+
+def _ste_row_cells(row_content_img: Image.Image, row_height: int, left: bool) -> dict:
+    """Crops the word, meaning, ex1 and ex2 cells of a dictionary row"""
+    width = row_content_img.width
+    if left:
+        boxes = ((9, 1, 128, row_height), (129, 1, 268, row_height), (269, 1, 410, row_height), (411, 1, width, row_height))
+    else:
+        boxes = ((25, 3, 150, row_height), (150, 3, 290, row_height), (290, 3, 435, row_height), (436, 3, width, row_height))
+    return {cell: row_content_img.crop(box) for cell, box in zip(("word", "meaning", "ex1", "ex2"), boxes)}
+
+
+def _ocr_cell(cell_img: Image.Image) -> str:
+    return image_to_string(cell_img, lang='eng', config=STE_OCR_CONFIG)
+
+
 def ste_dict_rows(
         page_img: str,
         output_folder: str = None,
         left: str = False,
         dictionary: list = None,
-        debug: bool = False) -> tuple:
+        debug: bool = False,
+        templates: tuple = None,
+        executor: ProcessPoolExecutor = None) -> tuple:
     """
     This function will try to extract all rows as separate images.
     
@@ -358,14 +496,17 @@ def ste_dict_rows(
         dictionary (list, optional): dictionary with results to be updated.
             Defaults to None.
         debug (bool, optional): If True, it will print some debug info. Defaults to False.
+        templates (tuple, optional): line templates, see locate_rows. Defaults to None.
+        executor (ProcessPoolExecutor, optional): pool to OCR the cells in. Defaults to None, OCR in this process.
 
-        
+    Returns:
+        list: dictionary, with a (word, meaning, ex1, ex2) tuple added for each row
     """
     page_img_name = page_img.split(sep)[-1]
+    dictionary = [] if dictionary is None else dictionary
 
     output_folder = join(expanduser("~/Desktop"), "content_rows") if output_folder is None else output_folder
-    if not isdir(output_folder):
-        mkdir(output_folder)
+    makedirs(output_folder, exist_ok=True)
 
     page_img2 = Image.open(page_img)
 
@@ -374,83 +515,79 @@ def ste_dict_rows(
 
     width, height = page_img2.size
 
-    positions = []
-
-    for pos in chain(
-        locateAll(join(expanduser("~/Desktop"), "blue_line.png"), page_img2),  # , confidence=0.9
-        locateAll(join(expanduser("~/Desktop"), "black_line_intermediate_1.png"), page_img2),  # , confidence=0.9
-        locateAll(join(expanduser("~/Desktop"), "black_line_intermediate_2.png"), page_img2),  # , confidence=0.9
-        # locateAll(join(expanduser("~/Desktop"), "black_line_last.png"), page_img2, confidence=0.9),
-    ):
-        positions.append(pos[1])
-    positions.sort()
- 
-    # print(f"positions: {positions}")
- 
-    # pytesseract_conf = "--psm 6"  # v2
-    # pytesseract_conf = "--psm 6 --oem 1"  # v5
-    # pytesseract_conf = "--psm 6 --oem 1 -c preserve_interword_spaces=1"  # v6
-    pytesseract_conf = "--psm 6 --oem 1 -c preserve_interword_spaces=1 tosp_min_sane_kn_sp=2.8 -l spa"  # v7
-    # pytesseract_conf = "--psm 13 --oem 1 -c tessedit_char_whitelist=ABCDEFG0123456789"
-    # pytesseract_conf = "--psm 10 --oem 3"  # v4
-    # pytesseract_conf = "--psm 13 --oem 1"  # v3
- 
+    positions = locate_rows(page_img2, templates)
+
     if debug:
         print(f"white_rows: {positions}")
         print(f"len white_rows: {len(positions)}")
-    
+
+    rows = []
     for ind, white_row in enumerate(positions):
-        try:
-            # white_row - 2, adds a bit of space before the content row
-            row_content_img = page_img2.crop((0, white_row - 2, width, positions[ind + 1]))
-            row_content_img.save(
-                join(output_folder, f"{page_img_name}_row_{ind}.png")
-            )
-            
-            row_height = positions[ind + 1] - white_row
-            
-            if left:
-                word = row_content_img.crop((9, 1, 128, row_height))
-            else:
-                word = row_content_img.crop((25, 3, 150, row_height))
-            word_text = image_to_string(word, lang='eng', config=pytesseract_conf)
-            word.save(
-                join(output_folder, f"{page_img_name}_row_{ind}_word.png")
-            )
-            if left:
-                meaning = row_content_img.crop((129, 1, 268, row_height))
-            else:
-                meaning = row_content_img.crop((150, 3, 290, row_height))
-            meaning_text = image_to_string(meaning, lang='eng', config=pytesseract_conf)
-            meaning.save(
-                join(output_folder, f"{page_img_name}_row_{ind}_meaning.png")
-            )
-            if left:
-                ex1 = row_content_img.crop((269, 1, 410, row_height))
-            else:
-                ex1 = row_content_img.crop((290, 3, 435, row_height))
-            ex1_text = image_to_string(ex1, lang='eng', config=pytesseract_conf)
-            ex1.save(
-                join(output_folder, f"{page_img_name}_row_{ind}_ex1.png")
-            )
-            if left:
-                ex2 = row_content_img.crop((411, 1, width, row_height))
-            else:
-                ex2 = row_content_img.crop((436, 3, width, row_height))
-            ex2_text = image_to_string(ex2, lang='eng', config=pytesseract_conf)
-            ex2.save(
-                join(output_folder, f"{page_img_name}_row_{ind}_ex2.png")
-            )
-            dictionary.append((word_text, meaning_text, ex1_text, ex2_text))
-            
-        except IndexError:
-            row_content_img = page_img2.crop((0, white_row - 2, width, height))
-            row_content_img.save(
-                join(output_folder, f"{page_img_name}_row_{ind}.png")
+        # white_row - 2, adds a bit of space before the content row
+        bottom = positions[ind + 1] if ind + 1 < len(positions) else height
+        row_content_img = page_img2.crop((0, white_row - 2, width, bottom))
+        row_content_img.save(
+            join(output_folder, f"{page_img_name}_row_{ind}.png")
+        )
+        if ind + 1 == len(positions):
+            break
+        cells = _ste_row_cells(row_content_img, positions[ind + 1] - white_row, left)
+        for cell, cell_img in cells.items():
+            cell_img.save(
+                join(output_folder, f"{page_img_name}_row_{ind}_{cell}.png")
             )
+        rows.append(list(cells.values()))
+
+    if executor is None:
+        texts = [_ocr_cell(cell_img) for cells in rows for cell_img in cells]
+    else:
+        texts = list(executor.map(_ocr_cell, [cell_img for cells in rows for cell_img in cells]))
+    dictionary.extend(tuple(texts[ind:ind + 4]) for ind in range(0, len(texts), 4))
     return dictionary
 
+
+def ste_dictionary(
+        page_imgs: any,
+        output_folder: str = None,
+        workers: int = None,
+        templates: tuple = None,
+        debug: bool = False) -> tuple:
+    """Runs ste_dict_rows for all page images of the dictionary, OCRing the cells in a process pool.
+    Pages with an even number in the filename (e.g. page_136.png) are left pages.
+
+    Args:
+        page_imgs (any): list of page image filepaths or a folder with page images, see pdf_page_to_img
+        output_folder (str, optional): folder to save the row images to, see ste_dict_rows.
+        workers (int, optional): number of tesseract worker processes, all CPUs if None. Defaults to None.
+        templates (tuple, optional): line templates, see locate_rows. Defaults to None.
+        debug (bool, optional): If True, it will print the time of each page. Defaults to False.
+
+    Returns:
+        tuple: (dictionary, {page image: seconds})
+    """
+    if isinstance(page_imgs, str):
+        page_imgs = [
+            join(page_imgs, file_) for file_ in listdir(page_imgs) if file_.lower().endswith(tuple(ROW_IMAGE_EXTENSIONS))]
+    page_imgs = sorted(page_imgs, key=lambda page_img: int(PAGE_NUMBER_PATTERN.search(page_img.split(sep)[-1]).group(1)))
+
+    dictionary = []
+    timings = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for page_img in tqdm(page_imgs):
+            start = perf_counter()
+            page_number = int(PAGE_NUMBER_PATTERN.search(page_img.split(sep)[-1]).group(1))
+            ste_dict_rows(
+                page_img, output_folder, left=page_number % 2 == 0, dictionary=dictionary,
+                templates=templates, executor=executor)
+            timings[page_img] = perf_counter() - start
+            if debug:
+                print(f"{page_img}: {timings[page_img]:.2f} s")
+    return dictionary, timings
+
 def pdf_to_dictionary(first_page: int, last_page: int, output_folder: str, top_x: int, top_y: int, bottom_x: int, bottom_y: int):
+    """Copies the STE dictionary rows from a PDF viewer on screen.
+    See pdf.extract_pdf_table for the same extraction from the PDF file, without screen or clipboard.
+    """
     sleep(2)
     dictionary = []
     if not isfile(join(expanduser("~/Desktop"), "pdf_dictionary_part.txt")):
@@ -3,8 +3,23 @@
 
 from os.path import getsize
 
+from hashlib import sha256
+
+FILE_HASH_CHUNK_SIZE = 1024 * 1024  # bytes read at once, the file is never loaded as a whole
+
 def get_file_size(file: str) -> int:
     """
     This function takes a file and returns the size of the file in MB.
     """
-    return getsize(file) / 1024 / 1024
\ No newline at end of file
+    return getsize(file) / 1024 / 1024
+
+def get_file_hash(file: str) -> str:
+    """
+    This function takes a file and returns the sha256 of its content,
+    read FILE_HASH_CHUNK_SIZE bytes at a time.
+    """
+    file_hash = sha256()
+    with open(file, "rb") as _:
+        for chunk in iter(lambda: _.read(FILE_HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
@@ -20,6 +20,7 @@ from math import ceil
 
 from ast import literal_eval
 
+from .cmm_document import CmmDocument
 from .xml_processing import delete_first_line
 from .xml_processing import replace_special_characters
 from .xml_processing import linearize_xml
@@ -30,6 +31,7 @@ FILEPATH = dirname(__file__)
 class FCChecker():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
         self.intermediate_row = "1"
 
@@ -40,6 +42,17 @@ class FCChecker():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -55,6 +68,8 @@ class FCChecker():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.linearized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -69,6 +84,8 @@ class FCChecker():
         Returns:
             str: xml content with mentioned modifications.
         """
+        if self.document is not None:
+            return self.document.resolved
         xml_content = self.prepare_xml()
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
@@ -0,0 +1,230 @@
+"""Streaming extraction of the IPL (illustrated parts list) items of a CMM.
+"""
+from collections import OrderedDict
+
+from re import compile as compile_regex
+
+from lxml import etree
+
+from .file_info import get_file_hash
+
+IPL_INDEX_CACHE_SIZE = 4
+IPL_ITEM_TAGS = ("pnr", "mfr", "kwd", "adt")  # read from the children of an itemdata
+
+_IPL_INDEX_CACHE = OrderedDict()
+
+_AMPERSAND_PATTERN = compile_regex(r"&(?!#?\w+;)")
+
+
+def _element_text(element: etree._Element) -> str:
+    """Text of an element and its children, unresolved entities are kept as &name;"""
+    text = element.text or ""
+    for child in element:
+        if isinstance(child, etree._Entity):
+            text += child.text
+        elif isinstance(child.tag, str):
+            text += _element_text(child)
+        text += child.tail or ""
+    return text
+
+
+def _to_markup(text: str) -> str:
+    """Escapes text for XML, the entity references kept by _element_text stay as they are"""
+    return _AMPERSAND_PATTERN.sub("&amp;", text).replace("<", "&lt;").replace(">", "&gt;")
+
+
+class IplItem():
+    """One itemdata of an IPL."""
+    __slots__ = ("itemnbr", "itemvar", "pnr", "kwd", "adt", "mfr", "has_iplnom")
+
+    def __init__(
+            self,
+            itemnbr: str = "",
+            itemvar: str = "",
+            pnr: str = None,
+            kwd: str = None,
+            adt: str = None,
+            mfr: str = None,
+            has_iplnom: bool = False):
+        self.itemnbr = itemnbr
+        self.itemvar = itemvar
+        self.pnr = pnr
+        self.kwd = kwd
+        self.adt = adt
+        self.mfr = mfr
+        self.has_iplnom = has_iplnom
+
+    @property
+    def nomenclature(self) -> str:
+        """Keyword and adjective text of the iplnom.
+        For assemblies the keyword comes first (e.g. "HOUSING ASSY"), otherwise the adjective text
+        (e.g. "HEX HEAD BOLT").
+        """
+        if self.adt is None:
+            return self.kwd or ""
+        if "ASS" in self.adt:
+            return f"{self.kwd or ''} {self.adt}".strip()
+        return f"{self.adt} {self.kwd or ''}".strip()
+
+    def __repr__(self) -> str:
+        return f"IplItem(itemnbr={self.itemnbr!r}, pnr={self.pnr!r}, nomenclature={self.nomenclature!r})"
+
+
+def iter_ipl_items(xml: any):
+    """Yields the items of an IPL in one streaming pass.
+    Every element is cleared once it was read, the itemdata and the rest of the CMM alike,
+    so the memory usage does not grow with the size of the CMM.
+
+    Args:
+        xml (any): path to the IPL XML file or file-like object
+
+    Yields:
+        IplItem: items in document order
+    """
+    context = etree.iterparse(
+        xml,
+        events=("start", "end"),
+        load_dtd=False,
+        no_network=True,
+        resolve_entities=False,
+        recover=True,
+        huge_tree=True
+    )
+    fields = None  # only collected inside an itemdata, e.g. the mfr of the vendor list is skipped
+    for event, element in context:
+        tag = element.tag
+        if event == "start":
+            if tag == "itemdata":
+                fields = {}
+            continue
+        if fields is None:
+            # outside of the itemdata nothing is needed, the finished elements are removed
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            continue
+        if tag == "itemdata":
+            yield IplItem(
+                itemnbr=element.get("itemnbr", ""),
+                itemvar=element.get("itemvar", ""),
+                pnr=fields.get("pnr"),
+                kwd=fields.get("kwd"),
+                adt=fields.get("adt"),
+                mfr=fields.get("mfr"),
+                has_iplnom="iplnom" in fields
+            )
+            fields = None
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+        elif tag == "iplnom":
+            fields.setdefault("iplnom", True)
+        elif tag in fields or tag not in IPL_ITEM_TAGS:
+            continue
+        elif tag in ("kwd", "adt") and element.getparent().tag != "iplnom":
+            continue
+        else:
+            fields[tag] = _element_text(element) if len(element) else element.text or ""
+    del context
+
+
+def find_ipl_entry(ipl_dict: dict, pnr: str) -> dict:
+    """Looks a part number up in the result of ipl_to_dict, falling back to the part number without dashes
+
+    Args:
+        ipl_dict (dict): see ataispec2200.ipl_to_dict
+        pnr (str): part number
+
+    Returns:
+        dict: {"Nomenclature": str, "MFR": str, "Itemnbr": str} or None
+    """
+    if pnr in ipl_dict:
+        return ipl_dict[pnr]
+    return ipl_dict.get(pnr.replace("-", ""))
+
+
+class IplIndex():
+    """Index of the items of an IPL by part number and by item number.
+    Use IplIndex.load() to reuse the index of files with identical content.
+    """
+    def __init__(self, items: list):
+        self.items = list(items)
+        self._by_pnr = {}
+        self._by_stripped_pnr = {}
+        self._by_itemnbr = {}
+        for item in self.items:
+            if item.pnr is None:
+                continue
+            self._by_pnr[item.pnr] = item
+            self._by_stripped_pnr[item.pnr.replace("-", "")] = item
+            self._by_itemnbr.setdefault(item.itemnbr, []).append(item)
+
+    @classmethod
+    def from_xml(cls, xml: str) -> "IplIndex":
+        return cls(iter_ipl_items(xml))
+
+    @classmethod
+    def load(cls, xml: str) -> "IplIndex":
+        """Returns the cached index for the content of xml, or creates and caches a new one.
+
+        Args:
+            xml (str): path to the IPL XML file
+
+        Returns:
+            IplIndex: the index
+        """
+        key = get_file_hash(xml)
+        if key in _IPL_INDEX_CACHE:
+            _IPL_INDEX_CACHE.move_to_end(key)
+            return _IPL_INDEX_CACHE[key]
+        _IPL_INDEX_CACHE[key] = cls.from_xml(xml)
+        while len(_IPL_INDEX_CACHE) > IPL_INDEX_CACHE_SIZE:
+            _IPL_INDEX_CACHE.popitem(last=False)
+        return _IPL_INDEX_CACHE[key]
+
+    def get(self, pnr: str) -> IplItem:
+        """Returns the item of a part number, the last one if the part number is listed more than once.
+        If there is no exact match, the part number is looked up without dashes.
+
+        Args:
+            pnr (str): part number
+
+        Returns:
+            IplItem: the item or None
+        """
+        if pnr in self._by_pnr:
+            return self._by_pnr[pnr]
+        stripped = pnr.replace("-", "")
+        return self._by_pnr.get(stripped, self._by_stripped_pnr.get(stripped))
+
+    def get_by_itemnbr(self, itemnbr: str) -> list:
+        """Returns all items with the given item number
+
+        Args:
+            itemnbr (str): item number
+
+        Returns:
+            list: items
+        """
+        return self._by_itemnbr.get(itemnbr, [])
+
+    def __contains__(self, pnr: str) -> bool:
+        return self.get(pnr) is not None
+
+    def __len__(self) -> int:
+        return len(self._by_pnr)
+
+    def to_dict(self) -> dict:
+        """Returns the index in the format of ataispec2200.ipl_to_dict.
+        Like the text in the XML, the nomenclature and MFR are XML escaped.
+
+        Returns:
+            dict: {pnr: {"Nomenclature": str, "MFR": str, "Itemnbr": str}}
+        """
+        return {
+            item.pnr: {
+                "Nomenclature": _to_markup(item.nomenclature) if item.has_iplnom else "",
+                "MFR": _to_markup(item.mfr or "") if item.has_iplnom else "",
+                "Itemnbr": item.itemnbr
+            } for item in self._by_pnr.values()
+        }
@@ -1,47 +1,192 @@
+from os import listdir
+from os import cpu_count
+from os import makedirs
+from os import replace
 from os.path import join
+from os.path import isdir
+from os.path import isfile
 from os.path import dirname
 from os.path import abspath
 
+from io import BytesIO
+
+from json import dump
+from json import load
+
+from shutil import rmtree
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+
 from pdf2image import convert_from_path
 import pytesseract
-import tempfile
 from pypdf import PdfReader, PdfWriter
-import io
-import os
+
+from .file_info import get_file_hash
 
 pytesseract.pytesseract.tesseract_cmd = join(dirname(__file__), "3rd", "Tesseract-OCR", "tesseract.exe")
 POPPLER_PATH = join(dirname(abspath(__file__)), "3rd", "bin")
 # Update here: https://github.com/oschwartz10612/poppler-windows/releases/
 
-def get_ocr_pdf_content(pdf: str) -> str:
-    images = convert_from_path(pdf, poppler_path=POPPLER_PATH)
+OCR_BATCH_SIZE = 8  # pages rasterized at once, bounds the memory used by each worker
+OCR_DPI = 200  # default of convert_from_path
+OCR_CHECKPOINT_SUFFIX = ".ocr"  # pdf_path + suffix is the default folder of the per-page checkpoints
+OCR_CHECKPOINT_SOURCE = "source.json"
+
+
+def _page_count(pdf: str) -> int:
+    return len(PdfReader(pdf).pages)
+
+
+def _page_batches(page_count: int, batch_size: int, pages: list = None) -> list:
+    """Splits the pages 1 .. page_count, or only the given pages, into (first_page, last_page) ranges
+    of at most batch_size consecutive pages.
+    """
+    pages = sorted(pages) if pages is not None else list(range(1, page_count + 1))
+    batches = []
+    for page in pages:
+        if batches and batches[-1][1] == page - 1 and page - batches[-1][0] < batch_size:
+            batches[-1] = (batches[-1][0], page)
+        else:
+            batches.append((page, page))
+    return batches
+
+
+def _checkpoint_path(checkpoint_dir: str, page: int) -> str:
+    return join(checkpoint_dir, f"{page:06d}.pdf")
+
+
+def _ocr_text_batch(pdf: str, first_page: int, last_page: int, dpi: int) -> list:
+    images = convert_from_path(
+        pdf, dpi=dpi, first_page=first_page, last_page=last_page, poppler_path=POPPLER_PATH)
+    return [pytesseract.image_to_string(image) for image in images]
+
+
+def _ocr_pdf_batch(pdf: str, first_page: int, last_page: int, dpi: int, checkpoint_dir: str) -> list:
+    """OCRs a range of pages and saves every page as a searchable one page PDF in checkpoint_dir.
+    A checkpoint is written to a temporary file first, so an interrupted run never leaves a partial page.
+    """
+    images = convert_from_path(
+        pdf, dpi=dpi, first_page=first_page, last_page=last_page, poppler_path=POPPLER_PATH)
+    pages = []
+    for page, image in enumerate(images, start=first_page):
+        checkpoint = _checkpoint_path(checkpoint_dir, page)
+        with open(checkpoint + ".tmp", "wb") as _:
+            _.write(pytesseract.image_to_pdf_or_hocr(image, extension='pdf'))
+        replace(checkpoint + ".tmp", checkpoint)
+        pages.append(page)
+    return pages
+
+
+def _run_batches(worker: callable, pdf: str, batches: list, workers: int, *args: any) -> dict:
+    """Runs worker(pdf, first_page, last_page, *args) for every batch.
+    With workers > 1 the batches run in a process pool, but at most 2 batches per worker are submitted
+    at a time, so finished results and rasterized pages do not pile up in memory.
+
+    Returns:
+        dict: {first_page: result}
+    """
+    if workers is None or workers > 1:
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            limit = 2 * (workers or cpu_count() or 1)
+            pending = {}
+            for first_page, last_page in batches:
+                if len(pending) >= limit:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[pending.pop(future)] = future.result()
+                pending[executor.submit(worker, pdf, first_page, last_page, *args)] = first_page
+            for future in pending:
+                results[pending[future]] = future.result()
+        return results
+    return {first_page: worker(pdf, first_page, last_page, *args) for first_page, last_page in batches}
+
+
+def _prepare_checkpoints(pdf_path: str, checkpoint_dir: str, dpi: int) -> list:
+    """Creates the checkpoint folder or reuses it if it belongs to the same PDF content and dpi.
+
+    Returns:
+        list: pages already OCRed
+    """
+    source = {"sha256": get_file_hash(pdf_path), "dpi": dpi}
+    source_file = join(checkpoint_dir, OCR_CHECKPOINT_SOURCE)
+    if isfile(source_file):
+        with open(source_file, "r", encoding="utf-8") as _:
+            if load(_) == source:
+                return [int(name[:-4]) for name in listdir(checkpoint_dir) if name.endswith(".pdf")]
+    if isdir(checkpoint_dir):
+        rmtree(checkpoint_dir)
+    makedirs(checkpoint_dir)
+    with open(source_file, "w", encoding="utf-8") as _:
+        dump(source, _)
+    return []
+
+
+def get_ocr_pdf_content(
+        pdf: str,
+        workers: int = 1,
+        batch_size: int = OCR_BATCH_SIZE,
+        dpi: int = OCR_DPI) -> str:
+    """Returns the OCR text of all pages of a PDF.
+    The pages are rasterized batch_size at a time, instead of the whole PDF at once.
+
+    Args:
+        pdf (str): Path to the PDF file.
+        workers (int, optional): Number of worker processes, all CPUs if None. Defaults to 1.
+        batch_size (int, optional): Pages rasterized at once. Defaults to OCR_BATCH_SIZE.
+        dpi (int, optional): Resolution of the rasterized pages. Defaults to OCR_DPI.
 
-    # Extract text using pytesseract
-    pdf_content = ""
-    for image in images:
-        text = pytesseract.image_to_string(image)
-        pdf_content += text
+    Returns:
+        str: The text of the pages, in page order.
+    """
+    results = _run_batches(_ocr_text_batch, pdf, _page_batches(_page_count(pdf), batch_size), workers, dpi)
+    return "".join("".join(results[first_page]) for first_page in sorted(results))
 
-    return pdf_content
 
-def ocr_pdf(pdf_path: str) -> None:
+def ocr_pdf(
+        pdf_path: str,
+        workers: int = 1,
+        batch_size: int = OCR_BATCH_SIZE,
+        dpi: int = OCR_DPI,
+        checkpoint_dir: str = None,
+        keep_checkpoints: bool = False) -> None:
     """
     Perform OCR on each page and overwrite the original PDF with a searchable version.
+
+    The pages are rasterized and OCRed batch_size at a time, optionally in several processes.
+    Every OCRed page is saved in checkpoint_dir, so if the run is interrupted, calling ocr_pdf again
+    only OCRs the missing pages. The checkpoints are discarded if the PDF or the dpi changed.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        workers (int, optional): Number of worker processes, all CPUs if None. Defaults to 1.
+        batch_size (int, optional): Pages rasterized at once. Defaults to OCR_BATCH_SIZE.
+        dpi (int, optional): Resolution of the rasterized pages. Defaults to OCR_DPI.
+        checkpoint_dir (str, optional): Folder for the per page checkpoints. Defaults to pdf_path + ".ocr".
+        keep_checkpoints (bool, optional): Keep checkpoint_dir after the PDF was written. Defaults to False.
     """
-    with tempfile.TemporaryDirectory() as tempdir:
-        images = convert_from_path(pdf_path, output_folder=tempdir, fmt='png', poppler_path=POPPLER_PATH)
-        writer = PdfWriter()
+    if checkpoint_dir is None:
+        checkpoint_dir = pdf_path + OCR_CHECKPOINT_SUFFIX
+    page_count = _page_count(pdf_path)
+    done = set(_prepare_checkpoints(pdf_path, checkpoint_dir, dpi))
+    missing = [page for page in range(1, page_count + 1) if page not in done]
+    _run_batches(_ocr_pdf_batch, pdf_path, _page_batches(page_count, batch_size, missing), workers, dpi, checkpoint_dir)
+
+    writer = PdfWriter()
+    for page in range(1, page_count + 1):
+        with open(_checkpoint_path(checkpoint_dir, page), "rb") as _:
+            writer.add_page(PdfReader(BytesIO(_.read())).pages[0])
 
-        for img in images:
-            ocr_bytes = pytesseract.image_to_pdf_or_hocr(img, extension='pdf')
-            ocr_reader = PdfReader(io.BytesIO(ocr_bytes))
-            writer.add_page(ocr_reader.pages[0])
+    output_path = pdf_path + ".ocr.pdf"
+    with open(output_path, "wb") as f:
+        writer.write(f)
 
-        output_path = pdf_path + ".ocr.pdf"
-        with open(output_path, "wb") as f:
-            writer.write(f)
+    replace(output_path, pdf_path)
+    if not keep_checkpoints:
+        rmtree(checkpoint_dir)
 
-        os.replace(output_path, pdf_path)
 
 if __name__ == "__main__":
     ocr_pdf(r"D:\pdf\300944_LI537_Rev2.pdf")
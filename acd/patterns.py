@@ -0,0 +1,63 @@
+"""Registry of compiled regular expressions and single-call match helpers.
+
+The re module only keeps the last 512 compiled patterns. Big checkers use more patterns than that,
+so in loops the same pattern string can be compiled again and again. get_regex() keeps every
+pattern compiled for the whole process. The constants module also has compiled versions
+(*_PATTERN) of its *_REGEX strings.
+"""
+from re import Pattern
+from re import compile as compile_regex
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_regex(pattern: str, flags: int = 0) -> Pattern:
+    """Returns the compiled pattern, compiling it only the first time
+
+    Args:
+        pattern (str): regular expression
+        flags (int, optional): re flags. Defaults to 0.
+
+    Returns:
+        Pattern: compiled pattern
+    """
+    return compile_regex(pattern, flags)
+
+
+def _compiled(pattern: any) -> Pattern:
+    return pattern if isinstance(pattern, Pattern) else get_regex(pattern)
+
+
+def search_group(pattern: any, text: str, group: any = 1, default: any = None) -> any:
+    """Searches only once and returns a group of the match, instead of
+    calling search once to test and once more to extract.
+
+    Args:
+        pattern (any): regular expression or compiled pattern
+        text (str): text to search in
+        group (any, optional): group number or name. Defaults to 1.
+        default (any, optional): returned when there is no match. Defaults to None.
+
+    Returns:
+        any: the group or default
+    """
+    match = _compiled(pattern).search(text)
+    return default if match is None else match.group(group)
+
+
+def search_groups(pattern: any, text: str, *groups: any) -> tuple:
+    """Searches only once and returns several groups of the match
+
+    Args:
+        pattern (any): regular expression or compiled pattern
+        text (str): text to search in
+        groups (any): group numbers or names, all groups if omitted
+
+    Returns:
+        tuple: the groups or None if there is no match
+    """
+    match = _compiled(pattern).search(text)
+    if match is None:
+        return None
+    return match.group(*groups) if len(groups) > 1 else (match.group(*groups),) if groups else match.groups()
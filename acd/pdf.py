@@ -2,9 +2,29 @@
 """
 import sys
 
+from os import makedirs
+from os import cpu_count
+from os import walk
+from os import replace
 from os.path import join
+from os.path import isfile
 from os.path import basename
 from os.path import dirname
+from os.path import expanduser
+from os.path import getsize
+from os.path import splitext
+
+from gzip import open as gzip_open
+
+from json import dump
+from json import load
+from json import dumps
+
+from csv import DictWriter
+
+from collections.abc import Sequence
+
+from concurrent.futures import ProcessPoolExecutor
 
 from fitz import open as pdf_open
 from pikepdf import open as pike_open
@@ -16,6 +36,22 @@ else:
 
 from pdfreader import SimplePDFViewer
 from .filelist import list_files
+from .file_info import get_file_hash
+from .constants import STE_DICT_COLUMNS
+from .constants import STE_DICT_ROW_MARKER
+
+PDF_TEXT_CACHE_DIR = join(expanduser("~"), ".acd", "pdf_text")
+PDF_PAGE_ENGINES = ("fitz", "pymupdf", "pypdf")
+PDF_CHUNK_SIZE = 50  # pages per worker task
+PDF_PARALLEL_MIN_PAGES = 100  # smaller files are extracted in the calling process
+PDF_SCAN_ENGINES = ("fitz", "pikepdf", "pypdf")  # tried in this order for every file
+PDF_TEXT_CHECK_PAGES = 5  # pages checked for a text layer
+PDF_LINE_MAX_HEIGHT = 2  # points, taller drawings are not taken as horizontal lines
+PDF_SCAN_COLUMNS = [
+    "file", "size", "pages", "has_text", "title", "author", "subject", "keywords",
+    "creator", "producer", "creation_date", "modification_date", "encrypted", "engine", "error"
+]
+
 
 def pdf_page_count(file_path, engine: str = "pypdf") -> int:
     """
@@ -48,13 +84,148 @@ def pdf_page_count(file_path, engine: str = "pypdf") -> int:
         return 0
 
 
-def get_pdf_content(file_path: str, engine: str = "fitz") -> str:
+def _pdf_page_count(file_path: str, engine: str) -> int:
+    if engine in ("fitz", "pymupdf"):
+        with pdf_open(file_path) as _:
+            return _.page_count
+    with open(file_path, 'rb') as _:
+        return len(PdfFileReader(_, strict=False).pages)
+
+
+def _extract_page_range(file_path: str, engine: str, start: int, stop: int) -> list:
+    """Returns the text of the pages start to stop - 1. Runs in the worker processes of iter_pdf_pages."""
+    if engine in ("fitz", "pymupdf"):
+        with pdf_open(file_path) as _:
+            return [_[page].get_text() for page in range(start, stop)]
+    with open(file_path, 'rb') as _:
+        pages = PdfFileReader(_, strict=False).pages
+        return [
+            str(pages[page].extract_text() if hasattr(pages[page], "extract_text") else pages[page].extractText())
+            for page in range(start, stop)
+        ]
+
+
+def iter_pdf_pages(file_path: str, engine: str = "fitz", workers: int = 1, chunk_size: int = PDF_CHUNK_SIZE):
+    """
+    Yields the text of the pages of a PDF file one after the other, so big files
+    are never held in memory as a single string.
+
+    Args:
+        file_path (str): The path to the PDF file.
+        engine (str): The engine to use. Choices: "fitz", "pymupdf", "pypdf"
+        workers (int): Number of worker processes. With more than one worker, the pages are
+                       extracted in chunks of chunk_size pages in parallel and yielded in order.
+        chunk_size (int): Pages per worker task.
+
+    Yields:
+        str: The text of each page.
+    """
+    if engine not in PDF_PAGE_ENGINES:
+        raise ValueError(f"Engine {engine} can not extract pages. Choices: {', '.join(PDF_PAGE_ENGINES)}")
+    page_count = _pdf_page_count(file_path, engine)
+    if workers == 1 or page_count < PDF_PARALLEL_MIN_PAGES:
+        if engine in ("fitz", "pymupdf"):
+            with pdf_open(file_path) as _:
+                for page in _:
+                    yield page.get_text()
+        else:
+            for start in range(0, page_count, chunk_size):
+                yield from _extract_page_range(file_path, engine, start, min(start + chunk_size, page_count))
+        return
+
+    chunks = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Only a few chunks are submitted ahead, so the memory use does not depend on the size of the file
+        ahead = 2 * (workers or cpu_count() or 1)
+        futures = [executor.submit(_extract_page_range, file_path, engine, *chunk) for chunk in chunks[:ahead]]
+        for ind in range(len(chunks)):
+            if ind + ahead < len(chunks):
+                futures.append(executor.submit(_extract_page_range, file_path, engine, *chunks[ind + ahead]))
+            yield from futures[ind].result()
+            futures[ind] = None
+
+
+class PdfPages(Sequence):
+    """
+    Text of the pages of a PDF file, as a list which is only extracted when it is first used.
+
+    The pages are extracted in parallel (see iter_pdf_pages) and cached on disk,
+    keyed by the sha256 of the file and the engine, so unchanged files are extracted only once.
+
+    Example:
+        pages = PdfPages("srm.pdf", workers=8)
+        print(len(pages), pages[10])
+    """
+    def __init__(
+            self,
+            file_path: str,
+            engine: str = "fitz",
+            workers: int = None,
+            cache_dir: str = PDF_TEXT_CACHE_DIR):
+        self.file_path = file_path
+        self.engine = "fitz" if engine == "pymupdf" else engine
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self._pages = None
+
+    def _cache_file(self) -> str:
+        return join(self.cache_dir, f"{get_file_hash(self.file_path)}_{self.engine}.json.gz")
+
+    def _load(self) -> list:
+        if self._pages is not None:
+            return self._pages
+        cache_file = self._cache_file() if self.cache_dir is not None else None
+        if cache_file is not None and isfile(cache_file):
+            with gzip_open(cache_file, "rt", encoding="utf-8") as _:
+                self._pages = load(_)
+            return self._pages
+        self._pages = list(iter_pdf_pages(self.file_path, self.engine, self.workers))
+        if cache_file is not None:
+            makedirs(self.cache_dir, exist_ok=True)
+            with gzip_open(cache_file + ".tmp", "wt", encoding="utf-8") as _:
+                dump(self._pages, _)
+            replace(cache_file + ".tmp", cache_file)
+        return self._pages
+
+    def __getitem__(self, index: any) -> any:
+        return self._load()[index]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def text(self) -> str:
+        return "".join(self._load())
+
+
+def get_pdf_pages(
+        file_path: str,
+        engine: str = "fitz",
+        workers: int = None,
+        cache_dir: str = PDF_TEXT_CACHE_DIR) -> PdfPages:
+    """
+    Returns the text of every page of a PDF file, see PdfPages.
+
+    Args:
+        file_path (str): The path to the PDF file.
+        engine (str): The engine to use. Choices: "fitz", "pymupdf", "pypdf"
+        workers (int): Number of worker processes, the number of CPUs if None.
+        cache_dir (str): Folder of the on-disk cache, no cache if None.
+
+    Returns:
+        PdfPages: The text of the pages.
+    """
+    return PdfPages(file_path, engine, workers, cache_dir)
+
+
+def get_pdf_content(file_path: str, engine: str = "fitz", workers: int = 1, cache_dir: str = None) -> str:
     """
     Returns the content of a PDF file.
 
     Args:
         file_path (str): The path to the PDF file.
         engine (str): The engine to use. Choices: "fitz", "pymupdf", "pypdf", "pdfreader", "pikepdf"
+        workers (int): Number of worker processes for fitz, see iter_pdf_pages.
+        cache_dir (str): Folder of the on-disk cache for fitz, see PdfPages. Defaults to no cache.
 
     Returns:
         list: The content of the PDF file.
@@ -65,11 +236,7 @@ def get_pdf_content(file_path: str, engine: str = "fitz") -> str:
                 pdf_content = str(PdfFileReader(_, strict=False).getPage(0).extractText())
             return pdf_content
         elif engine in ("fitz", "pymupdf"):
-            with pdf_open(file_path) as _:
-                pdf_content = ""
-                for page in _:
-                    pdf_content += page.get_text()
-            return pdf_content
+            return get_pdf_pages(file_path, engine, workers, cache_dir).text()
         elif engine == "pdfreader":
             with open(file_path, 'rb') as _:
                 viewer = SimplePDFViewer(_)
@@ -152,5 +319,284 @@ def merge_pdfs(folder: str, output_name: str, debug: bool = False) -> int:
         return 1
     return 0
 
+def _scan_pdf_fitz(file_path: str) -> dict:
+    with pdf_open(file_path) as _:
+        metadata = _.metadata or {}
+        return {
+            "pages": _.page_count,
+            "has_text": any(_[page].get_text().strip() != "" for page in range(min(_.page_count, PDF_TEXT_CHECK_PAGES))),
+            "title": metadata.get("title"),
+            "author": metadata.get("author"),
+            "subject": metadata.get("subject"),
+            "keywords": metadata.get("keywords"),
+            "creator": metadata.get("creator"),
+            "producer": metadata.get("producer"),
+            "creation_date": metadata.get("creationDate"),
+            "modification_date": metadata.get("modDate"),
+            "encrypted": _.is_encrypted,
+        }
+
+
+def _scan_pdf_pikepdf(file_path: str) -> dict:
+    with pike_open(file_path) as _:
+        docinfo = {str(key): str(value) for key, value in dict(_.docinfo).items()}
+        return {
+            "pages": len(_.pages),
+            # pikepdf does not extract text, a page with fonts is taken as a page with a text layer
+            "has_text": any(
+                "/Resources" in page and "/Font" in page.Resources for page in list(_.pages)[:PDF_TEXT_CHECK_PAGES]),
+            "title": docinfo.get("/Title"),
+            "author": docinfo.get("/Author"),
+            "subject": docinfo.get("/Subject"),
+            "keywords": docinfo.get("/Keywords"),
+            "creator": docinfo.get("/Creator"),
+            "producer": docinfo.get("/Producer"),
+            "creation_date": docinfo.get("/CreationDate"),
+            "modification_date": docinfo.get("/ModDate"),
+            "encrypted": _.is_encrypted,
+        }
+
+
+def _scan_pdf_pypdf(file_path: str) -> dict:
+    with open(file_path, 'rb') as _:
+        reader = PdfFileReader(_, strict=False)
+        pages = reader.pages
+        docinfo = reader.metadata if hasattr(reader, "metadata") else reader.getDocumentInfo()
+        docinfo = {str(key): str(value) for key, value in dict(docinfo or {}).items()}
+        return {
+            "pages": len(pages),
+            "has_text": any(
+                str(page.extract_text() if hasattr(page, "extract_text") else page.extractText()).strip() != ""
+                for page in list(pages)[:PDF_TEXT_CHECK_PAGES]),
+            "title": docinfo.get("/Title"),
+            "author": docinfo.get("/Author"),
+            "subject": docinfo.get("/Subject"),
+            "keywords": docinfo.get("/Keywords"),
+            "creator": docinfo.get("/Creator"),
+            "producer": docinfo.get("/Producer"),
+            "creation_date": docinfo.get("/CreationDate"),
+            "modification_date": docinfo.get("/ModDate"),
+            "encrypted": reader.is_encrypted if hasattr(reader, "is_encrypted") else reader.isEncrypted,
+        }
+
+
+_PDF_SCANNERS = {
+    "fitz": _scan_pdf_fitz,
+    "pikepdf": _scan_pdf_pikepdf,
+    "pypdf": _scan_pdf_pypdf,
+}
+
+
+def scan_pdf(file_path: str, engines: tuple = PDF_SCAN_ENGINES) -> dict:
+    """
+    Opens a PDF file once and collects its page count, metadata, text layer presence and size.
+    If an engine can not read the file, the next one is tried.
+
+    Args:
+        file_path (str): The path to the PDF file.
+        engines (tuple): The engines to try, in order. Choices: "fitz", "pikepdf", "pypdf"
+
+    Returns:
+        dict: One value for each of PDF_SCAN_COLUMNS. "engine" is the engine which read the file,
+              "error" the errors of all engines if none could read it.
+    """
+    row = dict.fromkeys(PDF_SCAN_COLUMNS)
+    row["file"] = file_path
+    errors = []
+    try:
+        row["size"] = getsize(file_path)
+    except OSError as err:
+        row["error"] = str(err)
+        return row
+    for engine in engines:
+        try:
+            row.update({key: value if value != "" else None for key, value in _PDF_SCANNERS[engine](file_path).items()})
+            row["engine"] = engine
+            return row
+        except Exception as err:
+            errors.append(f"{engine}: {type(err).__name__}: {err}")
+    row["error"] = "; ".join(errors)
+    return row
+
+
+def _write_pdf_scan(rows: list, output: str):
+    """Writes the rows of scan_pdfs to a .csv, .parquet or .jsonl file"""
+    ext = splitext(output)[1].lower()
+    if ext == ".csv":
+        with open(output, "w", encoding="utf-8", newline="") as _:
+            writer = DictWriter(_, fieldnames=PDF_SCAN_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+    elif ext == ".parquet":
+        from pandas import DataFrame  # only needed for parquet, together with pyarrow
+        DataFrame(rows, columns=PDF_SCAN_COLUMNS).to_parquet(output, index=False)
+    elif ext in (".jsonl", ".json"):
+        with open(output, "w", encoding="utf-8") as _:
+            for row in rows:
+                _.write(dumps(row, ensure_ascii=False) + "\n")
+    else:
+        raise ValueError(f"Unknown output format {ext}. Choices: .csv, .parquet, .jsonl")
+
+
+def scan_pdfs(
+        folder: str,
+        workers: int = None,
+        output: str = None,
+        engines: tuple = PDF_SCAN_ENGINES) -> list:
+    """
+    Scans all PDF files of a folder and its sub-folders in parallel, see scan_pdf.
+
+    Args:
+        folder (str): The folder containing the PDF files.
+        workers (int): Number of worker processes, the number of CPUs if None.
+        output (str): Optional .csv, .parquet or .jsonl file to write the result to, one row per PDF file.
+        engines (tuple): The engines to try, in order. Choices: "fitz", "pikepdf", "pypdf"
+
+    Returns:
+        list: One dict per PDF file, sorted by path.
+    """
+    pdf_files = sorted(
+        join(root, file_) for root, _, files in walk(folder) for file_ in files if file_.lower().endswith(".pdf"))
+    rows = []
+    if pdf_files:
+        chunksize = max(1, len(pdf_files) // ((workers or cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rows = list(executor.map(scan_pdf, pdf_files, [engines] * len(pdf_files), chunksize=chunksize))
+    if output is not None:
+        _write_pdf_scan(rows, output)
+    return rows
+
+def get_rect_text(words: list, rect: tuple) -> str:
+    """Returns the text of the words whose center is inside a rectangle, separated by single spaces.
+    This is the text an alt-drag selection of the rectangle copies, with its line breaks replaced by spaces.
+
+    Args:
+        words (list): words of a page, as returned by fitz Page.get_text("words")
+        rect (tuple): (x0, y0, x1, y1) in points
+
+    Returns:
+        str: the text
+    """
+    x0, y0, x1, y1 = rect
+    return " ".join(
+        word[4] for word in words if x0 <= (word[0] + word[2]) / 2 <= x1 and y0 <= (word[1] + word[3]) / 2 <= y1)
+
+
+def get_horizontal_lines(page: any, rect: tuple) -> list:
+    """Returns the y coordinates of the horizontal lines drawn on a page, which cross a rectangle
+
+    Args:
+        page (any): fitz page
+        rect (tuple): (x0, y0, x1, y1) in points
+
+    Returns:
+        list: sorted y coordinates of the top of the lines, in points
+    """
+    x0, y0, x1, y1 = rect
+    lines = set()
+    for drawing in page.get_drawings():
+        line = drawing["rect"]
+        if line.height <= PDF_LINE_MAX_HEIGHT and line.x0 <= x1 and line.x1 >= x0 and y0 <= line.y0 <= y1:
+            lines.add(round(line.y0, 1))
+    return sorted(lines)
+
+
+_WORKER_PDF = None
+
+
+def _init_table_worker(file_path: str):
+    global _WORKER_PDF
+    _WORKER_PDF = pdf_open(file_path)
+
+
+def _extract_table_page(page_number: int, area: tuple, columns: dict, row_marker: tuple, zoom: float) -> list:
+    """Extracts the rows of one page of the PDF opened by _init_table_worker, see extract_pdf_table"""
+    top_x, top_y, bottom_x, bottom_y = (value / zoom for value in area)
+    page = _WORKER_PDF[page_number - 1]
+    words = page.get_text("words")
+    positions = get_horizontal_lines(
+        page, (top_x + row_marker[0] / zoom, top_y, top_x + row_marker[1] / zoom, bottom_y))
+    # the text starts 3 pixels below a row marker and ends 1 pixel above the next one
+    return [
+        tuple(
+            get_rect_text(
+                words,
+                (
+                    top_x + start / zoom,
+                    top + 3 / zoom,
+                    bottom_x if end is None else top_x + end / zoom,
+                    bottom - 1 / zoom
+                )
+            ) for start, end in columns[page_number % 2]
+        ) for top, bottom in zip(positions, positions[1:])
+    ]
+
+
+def extract_pdf_table(
+        file_path: str,
+        first_page: int,
+        last_page: int,
+        top_x: float,
+        top_y: float,
+        bottom_x: float,
+        bottom_y: float,
+        columns: dict = STE_DICT_COLUMNS,
+        row_marker: tuple = STE_DICT_ROW_MARKER,
+        zoom: float = 1.0,
+        workers: int = None) -> list:
+    """Extracts the rows of a table from the text layer of a PDF, without a PDF viewer.
+    Headless replacement of extract_rows.pdf_to_dictionary: the same rectangles are read from the
+    word boxes of PyMuPDF instead of being selected on screen and copied through the clipboard.
+
+    Rows start at the short horizontal lines drawn between row_marker[0] and row_marker[1],
+    every column of a row is the text between two such lines and the x offsets of the column.
+
+    All coordinates are pixels of the page shown at zoom pixels per point, from the top left
+    corner of the page. At zoom 1.0 they are PDF points.
+
+    Args:
+        file_path (str): path to the PDF file
+        first_page (int): first page, starting at 1
+        last_page (int): last page, included
+        top_x (float): left of the table
+        top_y (float): top of the table
+        bottom_x (float): right of the table
+        bottom_y (float): bottom of the table
+        columns (dict, optional): {0: even page columns, 1: odd page columns}, each column
+            a (start, end) x offset from top_x, end None for bottom_x. Defaults to STE_DICT_COLUMNS.
+        row_marker (tuple, optional): (start, end) x offsets from top_x of the row lines.
+            Defaults to STE_DICT_ROW_MARKER.
+        zoom (float, optional): pixels per point of the coordinates. Defaults to 1.0.
+        workers (int, optional): number of worker processes, all CPUs if None. Defaults to None.
+
+    Returns:
+        list: one tuple of column texts per row, like pdf_to_dictionary
+            (word, meaning, approved example, not approved example) for the STE dictionary
+    """
+    pages = list(range(first_page, last_page + 1))
+    arguments = (
+        pages,
+        [(top_x, top_y, bottom_x, bottom_y)] * len(pages),
+        [columns] * len(pages),
+        [row_marker] * len(pages),
+        [zoom] * len(pages)
+    )
+    if workers == 1:
+        _init_table_worker(file_path)
+        try:
+            return [row for page_rows in map(_extract_table_page, *arguments) for row in page_rows]
+        finally:
+            _WORKER_PDF.close()
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_table_worker,
+            initargs=(file_path,)) as executor:
+        rows = executor.map(
+            _extract_table_page,
+            *arguments,
+            chunksize=max(1, len(pages) // ((workers or cpu_count() or 1) * 4))
+        )
+        return [row for page_rows in rows for row in page_rows]
+
 if __name__ == "__main__":
-    merge_pdfs(r"D:\Excel Tests", "merged.pdf")
\ No newline at end of file
+    merge_pdfs(r"D:\Excel Tests", "merged.pdf")
@@ -3,45 +3,125 @@ from os.path import isdir
 from os.path import isfile
 from os.path import dirname
 from os.path import abspath
+from os.path import splitext
+from os.path import getmtime
 
 from subprocess import check_output
 
+from concurrent.futures import ProcessPoolExecutor
+
 from pdf2image import convert_from_path
+from pdf2image import pdfinfo_from_path
 
 from .filelist import list_files
 
 POPPLER_PATH = join(dirname(abspath(__file__)), "bin")
 # Update here: https://github.com/oschwartz10612/poppler-windows/releases/
 
+RASTER_FORMATS = {
+    "jpg": "JPEG",
+    "jpeg": "JPEG",
+    "png": "PNG",
+    "tif": "TIFF",
+    "tiff": "TIFF",
+}
+RASTER_DPI = 200  # default of convert_from_path
+RASTER_BATCH_SIZE = 10  # pages rendered at once, only these are kept in memory
+
+
+def _page_ranges(pages: list, batch_size: int) -> list:
+    """Groups page numbers into (first_page, last_page) ranges of at most batch_size consecutive pages"""
+    ranges = []
+    for page in sorted(set(pages)):
+        if ranges and ranges[-1][1] == page - 1 and page - ranges[-1][0] < batch_size:
+            ranges[-1] = (ranges[-1][0], page)
+        else:
+            ranges.append((page, page))
+    return ranges
+
+
+def _pdf2raster_file(
+        pdf: str,
+        extension: str = "jpg",
+        overwrite: bool = False,
+        pages: list = None,
+        dpi: int = RASTER_DPI,
+        thread_count: int = 1) -> list:
+    """Renders the pages of one pdf file to <pdf name>_page_<page>.<extension>, see pdf2raster
+
+    Returns:
+        list: paths of the written files
+    """
+    page_count = pdfinfo_from_path(pdf, poppler_path=POPPLER_PATH)["Pages"]
+    out_name = splitext(pdf)[0] + "_page_{}." + extension
+    pages = [page for page in (pages or range(1, page_count + 1)) if 1 <= page <= page_count]
+    if not overwrite:
+        pdf_mtime = getmtime(pdf)
+        pages = [
+            page for page in pages
+            if not isfile(out_name.format(page)) or getmtime(out_name.format(page)) < pdf_mtime
+        ]
+
+    written = []
+    for first_page, last_page in _page_ranges(pages, RASTER_BATCH_SIZE):
+        images = convert_from_path(
+            pdf,
+            dpi=dpi,
+            first_page=first_page,
+            last_page=last_page,
+            thread_count=thread_count,
+            poppler_path=POPPLER_PATH
+        )
+        for page, image in enumerate(images, start=first_page):
+            image.save(out_name.format(page), RASTER_FORMATS[extension.lower()])
+            written.append(out_name.format(page))
+    return written
+
+
 def pdf2raster(
         item: str,
         extension: str = "jpg",
         overwrite: bool = False,
-        pages: list = None):
+        pages: list = None,
+        dpi: int = RASTER_DPI,
+        thread_count: int = 1,
+        workers: int = 1) -> list:
     """Converts a pdf file to raster using pdf2image
+    Only the requested pages are rendered, RASTER_BATCH_SIZE pages at a time, and saved as soon as
+    they are rendered.
 
     Args:
         item (str): path to a pdf file or a directory containing pdf files
+        extension (str, optional): output format, one of RASTER_FORMATS. Defaults to "jpg".
+        overwrite (bool, optional): render pages even if their output file is newer than the pdf file.
+            Defaults to False, outputs older than the pdf file (e.g. of a previous revision) are rendered again.
+        pages (list, optional): page numbers to render, starting at 1, the same for every pdf file.
+            Defaults to None, all pages.
+        dpi (int, optional): resolution of the output. Defaults to RASTER_DPI.
+        thread_count (int, optional): poppler threads per pdf file. Defaults to 1.
+        workers (int, optional): for a directory, the number of pdf files rendered in parallel processes,
+            all CPUs if None. Defaults to 1.
+
+    Returns:
+        list: paths of the written files
     """
+    if extension.lower() not in RASTER_FORMATS:
+        raise ValueError(f"Unknown raster format {extension}. Choices: {', '.join(RASTER_FORMATS)}")
     if isfile(item):
-        out_fname = item.split(".")[0] + f".{extension}"
-        images = convert_from_path(item, poppler_path=POPPLER_PATH)
-        if not pages:
-            pages = [i for i in range(1, len(images) + 1)]
-        for i in range(len(images)):
-            if i + 1 in pages:
-                images[i].save(out_fname.replace(f".{extension}", f"_page_{i + 1}") + f".{extension}", 'JPEG')
+        return _pdf2raster_file(item, extension, overwrite, pages, dpi, thread_count)
     elif isdir(item):
-        for pdf in list_files(item, True, ["pdf"]):
-            out_fname = pdf.split(".")[0] + f".{extension}"
-            images = convert_from_path(pdf, poppler_path=POPPLER_PATH)
-            if not pages:
-                pages = [i for i in range(1, len(images) + 1)]
-            for i in range(len(images)):
-                if i + 1 in pages:
-                    images[i].save(out_fname.replace(f".{extension}", f"_page_{i + 1}") + f".{extension}", 'JPEG')
+        pdfs = list_files(item, True, ["pdf"])
+        if workers is None or workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_pdf2raster_file, pdf, extension, overwrite, pages, dpi, thread_count)
+                    for pdf in pdfs
+                ]
+                return [file_ for future in futures for file_ in future.result()]
+        return [file_ for pdf in pdfs for file_ in _pdf2raster_file(pdf, extension, overwrite, pages, dpi, thread_count)]
     else:
         print("Please enter a valid file or directory path")
+    return []
 
-if __name__ == "__main__":  
-    pdf2raster(r"D:\HIGHLIGHTS_TEST_FOLDERS_SRM_A320\A320_P2F_SRM_GM_R03_AUG_15_23\ATA53\53-41\53-41-14_PB001_C3\A320_SRM_GM_534114_PB001_C3_IS_R03_AUG_15_23.pdf")
\ No newline at end of file
+if __name__ == "__main__":
+    pdf2raster(r"D:\HIGHLIGHTS_TEST_FOLDERS_SRM_A320\A320_P2F_SRM_GM_R03_AUG_15_23\ATA53\53-41\53-41-14_PB001_C3\A320_SRM_GM_534114_PB001_C3_IS_R03_AUG_15_23.pdf")
@@ -18,6 +18,7 @@ from openpyxl.styles import Alignment
 
 from inflect import engine
 
+from .cmm_document import CmmDocument
 from .xml_processing import delete_first_line
 from .xml_processing import replace_special_characters
 from .xml_processing import linearize_xml
@@ -28,6 +29,7 @@ FILEPATH = dirname(__file__)
 class IPLChecker():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
 
     def set_xml(self, xml_path: str):
@@ -37,6 +39,17 @@ class IPLChecker():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -52,6 +65,8 @@ class IPLChecker():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.normalized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -65,6 +80,8 @@ class IPLChecker():
         Returns:
             str: xml content with mentioned modifications.
         """
+        if self.document is not None:
+            return self.document.resolved
         xml_content = self.prepare_xml()
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
@@ -72,9 +89,10 @@ class IPLChecker():
         return xml_content
 
     def get_pgblks(self):
-        xml_content = self.replace_entities()
-
-        tree = etree.fromstring(xml_content)
+        if self.document is not None:
+            tree = self.document.root
+        else:
+            tree = etree.fromstring(self.replace_entities())
 
         pgblk3000 = tree.xpath("//pgblk[@pgblknbr='3000']")[0]
         pgblk3000_content = linearize_xml(
@@ -198,10 +216,11 @@ class IPLChecker():
         return dict_disassembly, dict_repair, dict_assembly
 
     def get_dplist(self):
-        xml_content = self.replace_entities()
-
         dict_ipl_table = {}
-        tree = etree.fromstring(xml_content)
+        if self.document is not None:
+            tree = self.document.root
+        else:
+            tree = etree.fromstring(self.replace_entities())
 
         dplist = tree.xpath("//dplist")[0]
         dplist_content = linearize_xml(
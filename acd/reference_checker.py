@@ -16,6 +16,8 @@ from openpyxl.styles import Font
 from openpyxl.styles import Alignment
 from openpyxl.styles import PatternFill
 
+from .cmm_document import CmmDocument
+from .cmm_document import inject_entities
 from .xml_processing import delete_first_line
 from .xml_processing import replace_special_characters
 from .xml_processing import linearize_xml
@@ -26,6 +28,7 @@ FILEPATH = dirname(__file__)
 class RefChecker():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
 
     def set_xml(self, xml_path: str):
@@ -35,6 +38,17 @@ class RefChecker():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -50,6 +64,9 @@ class RefChecker():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            xml_content = sub(r'\<!ENTITY M\d{3}.*?"\>', "", self.document.linearized)
+            return sub(r"(&)(M\d{3})(;)", r"~" + r"\g<2>" + r"§", xml_content)
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -68,6 +85,8 @@ class RefChecker():
             str: xml content with mentioned modifications.
         """
         xml_content = self.prepare_xml()
+        if self.document is not None:
+            return inject_entities(xml_content)
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
         xml_content = sub(r"(]>(.|\n)*?<cmm)", entities + r'\1', xml_content)
@@ -136,6 +155,7 @@ class RefChecker():
 class CsnChecker():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
 
     def set_xml(self, xml_path: str):
@@ -145,6 +165,17 @@ class CsnChecker():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -160,6 +191,8 @@ class CsnChecker():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.linearized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -174,6 +207,8 @@ class CsnChecker():
         Returns:
             str: xml content with mentioned modifications.
         """
+        if self.document is not None:
+            return self.document.resolved
         xml_content = self.prepare_xml()
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
@@ -181,9 +216,10 @@ class CsnChecker():
         return xml_content
 
     def get_item_numbers(self):
-        xml_content = self.replace_entities()
-
-        xml_content = etree.fromstring(xml_content)
+        if self.document is not None:
+            xml_content = self.document.root
+        else:
+            xml_content = etree.fromstring(self.replace_entities())
         item_numbers_list = []
         for para in xml_content.xpath('//para'):
             para_text = ''.join(para.itertext())
@@ -222,6 +258,7 @@ class CsnChecker():
 class GraphicRefChecker:
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
 
     def set_xml(self, xml_path: str):
@@ -231,6 +268,17 @@ class GraphicRefChecker:
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -246,6 +294,8 @@ class GraphicRefChecker:
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.linearized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -260,6 +310,8 @@ class GraphicRefChecker:
         Returns:
             str: xml content with mentioned modifications.
         """
+        if self.document is not None:
+            return self.document.resolved
         xml_content = self.prepare_xml()
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
@@ -275,7 +327,10 @@ class GraphicRefChecker:
 
         ref_ids_info = []
         keep_track_of_first_reference = []
-        tree = etree.fromstring(xml_content_bckp)
+        if self.document is not None:
+            tree = self.document.root
+        else:
+            tree = etree.fromstring(xml_content_bckp)
         for ind, refid in enumerate(task_refids):
             if refid in keep_track_of_first_reference:
                 pass
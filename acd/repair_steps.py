@@ -31,6 +31,7 @@ else:
     from PySide2.QtWidgets import QMainWindow
     from PySide2.QtCore import Signal
 
+from .cmm_document import CmmDocument
 from .xml_processing import delete_first_line
 from .xml_processing import replace_special_characters
 from .xml_processing import linearize_xml
@@ -56,6 +57,7 @@ def clean_xml_tags(xml_string: str) -> str:
 class RepairSteps():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
         self.intermediate_row = "1"
 
@@ -66,6 +68,17 @@ class RepairSteps():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -92,6 +105,8 @@ class RepairSteps():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.resolved
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = linearize_xml(xml_content)
@@ -112,9 +127,10 @@ class RepairSteps():
             progress: Signal = Signal(0),
             console: Signal = Signal("")):
         try:
-            xml_content = self.prepare_xml()
-
-            xml_content = etree.fromstring(xml_content)
+            if self.document is not None:
+                xml_content = self.document.copy_root()
+            else:
+                xml_content = etree.fromstring(self.prepare_xml())
             pgblk_6000 = xml_content.xpath(".//pgblk[@pgblknbr=6000]")[0]
             tables = pgblk_6000.xpath(".//table")
             tables_backup = tables
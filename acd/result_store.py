@@ -0,0 +1,124 @@
+"""Persistent store of validation results, used to skip the inputs which did not change
+since they were last checked (see BrexChecker, XmlSchemaValidator and s1000d.validate_repository).
+"""
+import sqlite3
+
+from os import makedirs
+from os.path import join
+from os.path import abspath
+from os.path import dirname
+from os.path import getmtime
+from os.path import getsize
+from os.path import expanduser
+
+from pickle import dumps
+from pickle import loads
+
+from hashlib import sha256
+
+from datetime import datetime
+
+from .file_info import get_file_hash
+
+RESULT_STORE_PATH = join(expanduser("~"), ".acd", "results.db")
+
+
+class ResultStore():
+    """SQLite store of validation results.
+
+    A result is keyed by the name of the validator, the sha256 of the checked file content
+    and a hash of everything else the result depends on (brex rules, schema, ...), see rules_hash().
+    A result is therefore reused for an unchanged file even if it was moved or renamed,
+    and it is never reused once the file or the rules changed.
+    """
+    def __init__(self, database: str = RESULT_STORE_PATH):
+        self.database = database
+        if dirname(database):
+            makedirs(dirname(database), exist_ok=True)
+        self._connection = sqlite3.connect(database)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results (validator TEXT, content_hash TEXT, rules_hash TEXT, "
+            "path TEXT, result BLOB, checked TEXT, PRIMARY KEY (validator, content_hash, rules_hash))")
+        self._connection.commit()
+        self._content_hashes = {}
+
+    @staticmethod
+    def rules_hash(*parts: any) -> str:
+        """Returns a hash of everything a result depends on besides the file content
+
+        Args:
+            parts (any): e.g. the sha256 of the brex files or the schema url
+
+        Returns:
+            str: sha256
+        """
+        return sha256("\0".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+    def content_hash(self, path: str) -> str:
+        """Returns the sha256 of the file content. It is computed once per file version (path, mtime and size).
+
+        Args:
+            path (str): file path
+
+        Returns:
+            str: sha256
+        """
+        key = (abspath(path), getmtime(path), getsize(path))
+        if key not in self._content_hashes:
+            self._content_hashes[key] = get_file_hash(path)
+        return self._content_hashes[key]
+
+    def get(self, validator: str, path: str, rules_hash: str) -> dict:
+        """Returns the stored result of a file
+
+        Args:
+            validator (str): validator name
+            path (str): file path
+            rules_hash (str): see rules_hash()
+
+        Returns:
+            dict: {"result": result, "checked": timestamp} or None if the file was not checked with these rules
+        """
+        row = self._connection.execute(
+            "SELECT result, checked FROM results WHERE validator = ? AND content_hash = ? AND rules_hash = ?",
+            (validator, self.content_hash(path), rules_hash)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"result": loads(row[0]), "checked": row[1]}
+
+    def put(self, validator: str, path: str, rules_hash: str, result: any):
+        """Stores the result of a file
+
+        Args:
+            validator (str): validator name
+            path (str): file path
+            rules_hash (str): see rules_hash()
+            result (any): picklable result
+        """
+        self._connection.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            (validator, self.content_hash(path), rules_hash, abspath(path), dumps(result), datetime.now().isoformat())
+        )
+        self._connection.commit()
+
+    def is_changed(self, validator: str, path: str, rules_hash: str) -> bool:
+        """Returns True if the file was not checked yet with its current content and these rules"""
+        return self.get(validator, path, rules_hash) is None
+
+    def clear(self, validator: str = None):
+        """Deletes all stored results, or only the ones of a validator
+
+        Args:
+            validator (str, optional): validator name. Defaults to None.
+        """
+        if validator is None:
+            self._connection.execute("DELETE FROM results")
+        else:
+            self._connection.execute("DELETE FROM results WHERE validator = ?", (validator,))
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
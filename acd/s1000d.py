@@ -4,6 +4,7 @@ See s1000d_xml_samples.xml for examples of S1000D XML
 
 from os import listdir
 from os import walk
+from os import cpu_count
 from os.path import join
 from os.path import splitext
 from os.path import isdir
@@ -12,15 +13,18 @@ from os.path import sep
 from os.path import basename
 from os.path import dirname
 from os.path import expanduser
+from os.path import getmtime
 
 import sys
+import sqlite3
 
-from re import search
-from re import findall
+from concurrent.futures import ProcessPoolExecutor
 
 from requests import get
 
 from json import dump
+from json import dumps
+from json import loads
 
 from lxml import etree
 
@@ -31,10 +35,16 @@ from .xml_processing import get_xml_attribute
 from .xml_processing import set_xml_attribute
 from .xml_processing import get_schema_from_xml
 from .xml_processing import linearize_xml
-from .constants import S1000D_VERSION_REGEX
-from .constants import DM_REF_REGEX
-from .constants import DELIVERY_LIST_ITEM_REGEX
+from .constants import S1000D_VERSION_PATTERN
+from .constants import DM_REF_PATTERN
+from .constants import S1000D_ADDRESS_TAGS
+from .constants import S1000D_CODE_TAGS
+from .constants import S1000D_OLD_CODE_TAGS
+from .constants import S1000D_REF_TAGS
+from .constants import DELIVERY_LIST_ITEM_PATTERN
 from .constants import OLD_TO_NEW
+from .result_store import ResultStore
+from .patterns import search_group
 
 def get_s1000d_version(xml: str) -> float:
     """Returns the S1000D version of the XML file
@@ -49,14 +59,129 @@ def get_s1000d_version(xml: str) -> float:
         with open(xml, "r", encoding="utf-8") as _:
             while (line := _.readline().rstrip()):
                 if "s1000d" in line:
-                    if search(S1000D_VERSION_REGEX, line):
-                        return float(search(S1000D_VERSION_REGEX, line).group(2).replace("-", "."))  # we convert 4-0 to 4.0
+                    if version := search_group(S1000D_VERSION_PATTERN, line, 2):
+                        return float(version.replace("-", "."))  # we convert 4-0 to 4.0
                     else:
                         raise Exception(f"Unknown S1000D version pattern: {line}")
-    elif search(S1000D_VERSION_REGEX, xml):
-        return float(search(S1000D_VERSION_REGEX, xml).group(2).replace("-", "."))  # we convert 4-0 to 4.0
+    elif version := search_group(S1000D_VERSION_PATTERN, xml, 2):
+        return float(version.replace("-", "."))  # we convert 4-0 to 4.0
     raise Exception(f"Could not find version for : {xml}")
 
+def _ref_from_element(ref: etree._Element) -> dict:
+    """Converts a dmRef (version 4+) or refdm (version 2.3) element to a reference dictionary
+    same as get_4plus_refs and get_2and3_refs.
+    """
+    if ref.tag == "refdm":
+        avee = ref.find(".//avee")
+        return {OLD_TO_NEW[child.tag]: child.text for child in avee} if avee is not None else {}
+
+    dm_code = ref.find(".//dmCode")
+    issue_info = ref.find(".//issueInfo")
+    tech_name = ref.find(".//techName")
+    info_name = ref.find(".//infoName")
+    issue_date = ref.find(".//issueDate")
+
+    return (dict(dm_code.attrib) if dm_code is not None else {}) | (
+        dict(issue_info.attrib) if issue_info is not None else {
+            "inWork": "",
+            "issueNumber": ""
+        }
+    ) | ({
+        "techName": tech_name.text,
+        "infoName": info_name.text if info_name is not None else None
+    } if tech_name is not None else {
+        "techName": "",
+        "infoName": ""
+    }) | (dict(issue_date.attrib) if issue_date is not None else {
+        "day": "",
+        "month": "",
+        "year": ""
+    })
+
+def extract_s1000d_info(xml: any) -> dict:
+    """Reads the S1000D version, the code and issue info of the document, the brex reference
+    and all data module references in one streaming pass.
+    Elements are cleared as soon as they were processed, so the memory usage stays flat even for huge PMs.
+
+    Args:
+        xml (any): File path to XML file or file-like object
+
+    Returns:
+        dict: version, code, issue_info, brex_ref and refs
+    """
+    info = {
+        "version": None,
+        "code": None,
+        "issue_info": None,
+        "brex_ref": None,
+        "refs": []
+    }
+    in_address = False
+    keep = 0  # depth of elements which are still needed when they end (refs and 2.3 codes)
+
+    context = etree.iterparse(
+        xml,
+        events=("start", "end"),
+        load_dtd=False,
+        no_network=True,
+        resolve_entities=False,
+        recover=True,
+        huge_tree=True
+    )
+    for event, elem in context:
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue
+        if event == "start":
+            if info["version"] is None and elem.getparent() is None:
+                docinfo = elem.getroottree().docinfo
+                for value in list(elem.attrib.values()) + [docinfo.doctype, docinfo.system_url or ""]:
+                    if match := S1000D_VERSION_PATTERN.search(value):
+                        info["version"] = float(match.group(2).replace("-", "."))  # we convert 4-0 to 4.0
+                        break
+            if tag in S1000D_ADDRESS_TAGS:
+                in_address = True
+            elif tag in S1000D_REF_TAGS or (in_address and tag in S1000D_OLD_CODE_TAGS):
+                keep += 1
+            elif in_address and keep == 0:
+                if tag in S1000D_CODE_TAGS and info["code"] is None:
+                    info["code"] = dict(elem.attrib)
+                elif tag == "issueInfo" and info["issue_info"] is None:
+                    info["issue_info"] = dict(elem.attrib)
+                elif tag == "issno" and info["issue_info"] is None:
+                    info["issue_info"] = {OLD_TO_NEW.get(key, key): value for key, value in elem.attrib.items()}
+            continue
+
+        if tag in S1000D_REF_TAGS:
+            keep -= 1
+            ref = _ref_from_element(elem)
+            info["refs"].append(ref)
+            if info["brex_ref"] is None and elem.getparent() is not None \
+                    and elem.getparent().tag in ("brexDmRef", "brex"):
+                info["brex_ref"] = ref
+        elif tag in S1000D_OLD_CODE_TAGS and in_address and keep > 0:
+            keep -= 1
+            if info["code"] is None:
+                target = elem.find("avee") if tag == "dmc" else elem
+                if target is not None:
+                    info["code"] = {OLD_TO_NEW[child.tag]: child.text for child in target if child.tag in OLD_TO_NEW}
+        elif tag in S1000D_ADDRESS_TAGS:
+            in_address = False
+
+        if keep == 0:
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    del context
+
+    if info["brex_ref"] is None:
+        for ref in info["refs"]:
+            if ref.get("infoCode") == "022":
+                info["brex_ref"] = ref
+                break
+
+    return info
+
 def get_references(directory: any, json_dump: bool = False, http_mode: bool = False) -> dict:
     """Get all data module references from inside all S1000D data modules in a directory
 
@@ -72,9 +197,9 @@ def get_references(directory: any, json_dump: bool = False, http_mode: bool = Fa
     if not http_mode:
         for document in listdir(directory):
             if splitext(document)[-1] in [".xml", ".XML"]:
-                s1000d_version = get_s1000d_version(join(directory, document))
-                if s1000d_version is not None:
-                    references[join(directory, document)] = get_s1000d_refs(join(directory, document), s1000d_version)
+                info = extract_s1000d_info(join(directory, document))
+                if info["version"] is not None:
+                    references[join(directory, document)] = info["refs"]
                 else:
                     raise Exception(f"Could not find version for {join(directory, document)}.\nPlease check the file.")
     else:
@@ -124,41 +249,38 @@ def get_4plus_refs(xml: str) -> list:
     refs = []
 
     if isfile(xml):
-        with open(xml, "r", encoding="utf-8") as _:
-            xml = _.read().replace("\n", " ").replace("> <", "><")
-    elif "www.s1000d.org" in str(xml):
+        return extract_s1000d_info(xml)["refs"]
+    if "www.s1000d.org" in str(xml):
         xml = str(xml).replace("\r\n", " ").replace("\n", " ").replace("\t", "").replace("> <", "><")
         xml = str(xml).replace(r"\r\n", " ").replace(r"\n", " ").replace(r"\t", "").replace("> <", "><")
 
-    match_found = search(DM_REF_REGEX, xml)
-    if match_found:
-        for match in findall(DM_REF_REGEX, xml):
-            try:
-                parsed_ref = etree.fromstring(match)
-            except etree.XMLSyntaxError:
-                print(f"Error parsing: {xml}")
-                print(f"Error parsing: {match}")
-
-            dm_code = dict(parsed_ref.xpath("//dmCode")[0].attrib)
-            issue_info = dict(parsed_ref.xpath("//issueInfo")[0].attrib) if parsed_ref.xpath("//issueInfo") else {
-                "inWork": "",
-                "issueNumber": ""
-            }
-            dm_title = {
-                "techName": parsed_ref.xpath("//techName")[0].text,
-                "infoName": parsed_ref.xpath("//infoName")[0].text
-            } if parsed_ref.xpath("//techName") else {
-                "techName": "",
-                "infoName": ""
-            }
-
-            issue_date = dict(parsed_ref.xpath("//issueDate")[0].attrib) if parsed_ref.xpath("//issueDate") else {
-                "day": "",
-                "month": "",
-                "year": ""
-            }
-
-            refs += [dm_code | issue_info | dm_title | issue_date]
+    for match in DM_REF_PATTERN.findall(xml):
+        try:
+            parsed_ref = etree.fromstring(match)
+        except etree.XMLSyntaxError:
+            print(f"Error parsing: {xml}")
+            print(f"Error parsing: {match}")
+
+        dm_code = dict(parsed_ref.xpath("//dmCode")[0].attrib)
+        issue_info = dict(parsed_ref.xpath("//issueInfo")[0].attrib) if parsed_ref.xpath("//issueInfo") else {
+            "inWork": "",
+            "issueNumber": ""
+        }
+        dm_title = {
+            "techName": parsed_ref.xpath("//techName")[0].text,
+            "infoName": parsed_ref.xpath("//infoName")[0].text
+        } if parsed_ref.xpath("//techName") else {
+            "techName": "",
+            "infoName": ""
+        }
+
+        issue_date = dict(parsed_ref.xpath("//issueDate")[0].attrib) if parsed_ref.xpath("//issueDate") else {
+            "day": "",
+            "month": "",
+            "year": ""
+        }
+
+        refs += [dm_code | issue_info | dm_title | issue_date]
 
     return refs
 
@@ -176,18 +298,15 @@ def get_2and3_refs(xml: str) -> list:
     refs = []
 
     if isfile(xml):
-        with open(xml, "r", encoding="utf-8") as _:
-            xml = _.read().replace("\n", " ").replace("> <", "><")
-    elif "www.s1000d.org" in str(xml):
+        return extract_s1000d_info(xml)["refs"]
+    if "www.s1000d.org" in str(xml):
         xml = str(xml).replace("\r\n", " ").replace("\n", " ").replace("\t", "").replace("> <", "><")
         xml = str(xml).replace(r"\r\n", " ").replace(r"\n", " ").replace(r"\t", "").replace("> <", "><")
 
-    match_found = search(DM_REF_REGEX, xml)
-    if match_found:
-        for match in findall(DM_REF_REGEX, xml):
-            parsed_ref = etree.fromstring(match)
-            dm_code = {OLD_TO_NEW[child.tag]: child.text for child in parsed_ref.xpath("//avee")[0]}
-            refs += [dm_code]
+    for match in DM_REF_PATTERN.findall(xml):
+        parsed_ref = etree.fromstring(match)
+        dm_code = {OLD_TO_NEW[child.tag]: child.text for child in parsed_ref.xpath("//avee")[0]}
+        refs += [dm_code]
     return refs
 
 def get_brex_ref(xml: str, to_string: bool = False) -> dict:
@@ -199,6 +318,13 @@ def get_brex_ref(xml: str, to_string: bool = False) -> dict:
     Returns:
         dict: BREX reference
     """
+    if isfile(xml):
+        info = extract_s1000d_info(xml)
+        if info["version"] is None:
+            raise Exception(f"Could not find version for {xml}.\nPlease check the file.")
+        if info["brex_ref"] is not None and to_string:
+            return ref_dict_to_str(info["brex_ref"])
+        return info["brex_ref"]
     if get_s1000d_version(xml) is not None:
         for ref in get_s1000d_refs(xml, get_s1000d_version(xml)):
             if ref["infoCode"] == "022":
@@ -239,34 +365,230 @@ def ref_dict_to_str(ref: dict) -> str:
 
     return str_ref
 
-def find_document_by_reference(filename_part: str, directory: str, extension: str = ".xml") -> str:
+def _read_document(path: str) -> dict:
+    """Reads everything the repository needs from a single file in one pass
+
+    Args:
+        path (str): File path
+
+    Returns:
+        dict: index entry of the file
+    """
+    file_ = basename(path)
+    document = {
+        "filename": file_,
+        "mtime": getmtime(path),
+        "from_filename": None,
+        "from_xml": None,
+        "version": None,
+        "brex_ref": None,
+        "refs": [],
+        "delivery_list": []
+    }
+    if not file_.lower().endswith(".xml"):
+        return document
+    try:
+        document["from_filename"] = get_dm_code_from_filename(file_)
+    except IndexError:
+        pass
+    try:
+        info = extract_s1000d_info(path)
+    except Exception:  # not a S1000D document
+        return document
+    if any(code in file_ for code in ("DDN", "PMC", "DMC")):
+        document["from_xml"] = info["code"]
+    document["version"] = info["version"]
+    document["brex_ref"] = info["brex_ref"]
+    document["refs"] = info["refs"]
+    if "DDN" in file_:
+        with open(path, "r", encoding="utf-8") as _:
+            xml = delete_first_line(_.read().replace("\n", " ").replace("> <", "><"))
+        document["delivery_list"] = DELIVERY_LIST_ITEM_PATTERN.findall(xml)
+    return document
+
+
+class S1000DRepository():
+    """Index of all S1000D documents (DM, PM, DDN) of a directory.
+
+    The directory is walked once and every document is indexed by the code part of its filename
+    (e.g. DMC-...-D of DMC-...-D_001-00.XML), together with its code from the filename and from the xml,
+    its S1000D version, brex reference and data module references, all read in a single pass per file.
+    refresh() only re-reads files which are new or whose modification time changed,
+    using a process pool when workers is not 1.
+    If a SQLite database path is given, the index is loaded from and saved to it,
+    so a new session only has to re-read the files that changed in between.
+
+    All resolvers of this module accept a repository instead of a directory.
+    """
+    def __init__(self, directory: str, database: str = None, workers: int = 1):
+        self.directory = directory
+        self.database = database
+        self.workers = workers
+        self._documents = {}
+        self._by_code = {}
+        if database is not None:
+            self._load()
+        self.refresh()
+
+    @staticmethod
+    def code_key(filename: str) -> str:
+        """Returns the code part of a filename or reference string (everything before the issue info)"""
+        return splitext(basename(filename))[0].split("_")[0].upper()
+
+    def _index(self, path: str):
+        key = self.code_key(path)
+        if path not in self._by_code.setdefault(key, []):
+            self._by_code[key].append(path)
+
+    def _unindex(self, path: str):
+        key = self.code_key(path)
+        if path in self._by_code.get(key, []):
+            self._by_code[key].remove(path)
+
+    def refresh(self, workers: int = None) -> int:
+        """Walks the directory and updates the index for all new, changed and deleted files
+
+        Args:
+            workers (int, optional): Number of processes used to read the changed files.
+                Defaults to the workers given to the constructor. 1 reads them in this process.
+
+        Returns:
+            int: number of files that were (re-)indexed or removed
+        """
+        workers = self.workers if workers is None else workers
+        to_read = []
+        found = set()
+        for root, _, files in walk(self.directory):
+            for file_ in files:
+                path = join(root, file_)
+                found.add(path)
+                if path in self._documents and self._documents[path]["mtime"] == getmtime(path):
+                    continue
+                to_read.append(path)
+
+        if workers == 1 or len(to_read) < 2:
+            documents = map(_read_document, to_read)
+            for path, document in zip(to_read, documents):
+                self._documents[path] = document
+                self._index(path)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(to_read) // ((workers or cpu_count() or 1) * 4))
+                for path, document in zip(to_read, executor.map(_read_document, to_read, chunksize=chunksize)):
+                    self._documents[path] = document
+                    self._index(path)
+
+        removed = [path for path in self._documents if path not in found]
+        for path in removed:
+            del self._documents[path]
+            self._unindex(path)
+
+        changed = len(to_read) + len(removed)
+        if changed and self.database is not None:
+            self._save()
+        return changed
+
+    def _load(self):
+        with sqlite3.connect(self.database) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (path TEXT PRIMARY KEY, filename TEXT, mtime REAL, data TEXT)")
+            for path, filename, mtime, data in connection.execute(
+                    "SELECT path, filename, mtime, data FROM documents"):
+                self._documents[path] = {
+                    "filename": filename,
+                    "mtime": mtime
+                } | loads(data)
+                self._index(path)
+
+    def _save(self):
+        with sqlite3.connect(self.database) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS documents (path TEXT PRIMARY KEY, filename TEXT, mtime REAL, data TEXT)")
+            connection.execute("DELETE FROM documents")
+            connection.executemany(
+                "INSERT INTO documents VALUES (?, ?, ?, ?)",
+                [(path, doc["filename"], doc["mtime"], dumps(
+                    {key: value for key, value in doc.items() if key not in ("filename", "mtime")}
+                )) for path, doc in self._documents.items()])
+
+    def get_document(self, path: str) -> dict:
+        """Returns the index entry of a file: filename, mtime, from_filename, from_xml,
+        version, brex_ref, refs and delivery_list (only for DDNs)"""
+        return self._documents[path]
+
+    def paths(self, extension: str = None) -> list:
+        """Returns all indexed file paths, optionally only the ones with the given extension"""
+        if extension is None:
+            return list(self._documents)
+        return [path for path in self._documents if path.lower().endswith(extension.lower())]
+
+    def get_codes(self, path: str) -> dict:
+        """Returns the codes of an indexed document from its filename and from its xml"""
+        document = self._documents[path]
+        return {
+            "from_filename": document["from_filename"],
+            "from_xml": document["from_xml"],
+            "are_identical": document["from_filename"] == document["from_xml"]
+        }
+
+    def find(self, filename_part: str, extension: str = ".xml") -> str:
+        """Finds the full path of a document based on a filename part and the extension,
+        same as find_document_by_reference, but with a dictionary lookup.
+
+        Args:
+            filename_part (str): Filename part
+            extension (str): extension
+
+        Returns:
+            str: Full path to document
+        """
+        key = self.code_key(filename_part)
+        if key.startswith(("DMC-", "PMC-", "DDN-")):
+            candidates = self._by_code.get(key, [])
+        else:
+            candidates = self._documents
+        for path in candidates:
+            file_ = self._documents[path]["filename"]
+            if filename_part in file_ and file_.lower().endswith(extension.lower()):
+                return path
+        return None
+
+
+def find_document_by_reference(filename_part: str, directory: any, extension: str = ".xml") -> str:
     """Finds the full path of a document based on a filename part and the extension
 
     Args:
         filename_part (str): Filename part
-        directory (str): Directory to search in
+        directory (any): Directory to search in or S1000DRepository
         extension (str): extension
 
     Returns:
         str: Full path to document
     """
+    if isinstance(directory, S1000DRepository):
+        return directory.find(filename_part, extension)
     for root, _, files in walk(directory):
         for file_ in files:
             if filename_part in file_ and file_.lower().endswith(extension.lower()):
                 return join(root, file_)
 
-def get_dm_codes_from_dir(directory: str, json_dump: bool = False) -> dict:
+def get_dm_codes_from_dir(directory: any, json_dump: bool = False) -> dict:
     dm_codes = {}
-    for root, _, files in walk(directory):
-        for file_ in files:
-            if file_.lower().endswith(".xml"):
-                from_filename = get_dm_code_from_filename(file_)
-                from_xml = get_dm_code_from_xml(join(root, file_))
-                dm_codes[join(root, file_)] = {
-                    "from_filename": from_filename,
-                    "from_xml": from_xml,
-                    "are_identical": from_filename == from_xml
-                }
+    if isinstance(directory, S1000DRepository):
+        for path in directory.paths(".xml"):
+            dm_codes[path] = directory.get_codes(path)
+        directory = directory.directory
+    else:
+        for root, _, files in walk(directory):
+            for file_ in files:
+                if file_.lower().endswith(".xml"):
+                    from_filename = get_dm_code_from_filename(file_)
+                    from_xml = get_dm_code_from_xml(join(root, file_))
+                    dm_codes[join(root, file_)] = {
+                        "from_filename": from_filename,
+                        "from_xml": from_xml,
+                        "are_identical": from_filename == from_xml
+                    }
 
     if json_dump:
         parent_dir = directory.split(sep)[-1]
@@ -326,55 +648,30 @@ def get_dm_code_from_xml(xml: str) -> dict:
     Returns:
         dict: dmCode as a dictionary
     """
-
-    code = None
     xml_filename = basename(xml)
+    if not any(code in xml_filename for code in ("DDN", "PMC", "DMC")):
+        return None
 
-    s1000d_version = get_s1000d_version(xml)
+    return extract_s1000d_info(xml)["code"]
 
-    with open(xml, "r", encoding="utf-8") as _:
-        xml = delete_first_line(_.read().replace("\n", " ").replace("> <", "><"))
-    if "DDN" in xml_filename:
-        code = dict(
-            etree.fromstring(xml).xpath("//identAndStatusSection/ddnAddress/ddnIdent/ddnCode")[0].attrib
-        ) if s1000d_version >= 4.0 else {
-            OLD_TO_NEW[child.tag]: child.text for child in etree.fromstring(xml).xpath("//idstatus/ddnaddres/ddnc")[0]
-        }
-    elif "PMC" in xml_filename:
-        code = dict(
-            etree.fromstring(xml).xpath("//identAndStatusSection/pmAddress/pmIdent/pmCode")[0].attrib
-        ) if s1000d_version >= 4.0 else {
-            OLD_TO_NEW[child.tag]: child.text for child in etree.fromstring(xml).xpath("//idstatus/pmaddres/pmc")[0]
-        }
-    elif "DMC" in xml_filename:
-        code = dict(
-            etree.fromstring(xml).xpath("//identAndStatusSection/dmAddress/dmIdent/dmCode")[0].attrib
-        ) if s1000d_version >= 4.0 else {
-            OLD_TO_NEW[child.tag]: child.text for child in etree.fromstring(xml).xpath("//idstatus/dmaddres/dmc/avee")[0]
-        }
-
-    return code
-
-def validate_references(directory: str, json_dump: bool = False) -> dict:
-    """Validates the references of all documents in a directory
+def _check_references(references: dict, dm_codes_dict: dict, repository: S1000DRepository) -> dict:
+    """Checks that every reference resolves to a document whose DM code matches its filename
 
-        Args:
-            directory (str): Directory to search in
-            json_dump (bool): Dump the results to a json file
+    Args:
+        references (dict): References of each document
+        dm_codes_dict (dict): DM codes of each document, see get_dm_codes_from_dir
+        repository (S1000DRepository): Repository used to resolve the references
 
-        Returns:
-            dict: Results
+    Returns:
+        dict: Results
     """
-
-    dm_codes_dict = get_dm_codes_from_dir(directory, True)
-    references = get_references(directory, True)
     reference_validation = {}
     for key in references:
         reference_validation[key] = {}
         for ref in references[key]:
             ref_filepath = find_document_by_reference(
                 ref_dict_to_str(ref_dict_to_dm_code_dict(ref)),
-                directory
+                repository
             )
             dm_code_message = "" if ref_filepath is None else \
                 ", but the DM code does not match the filename" if not dm_codes_dict[ref_filepath]["are_identical"] \
@@ -385,6 +682,24 @@ def validate_references(directory: str, json_dump: bool = False) -> dict:
             reference_validation[key][ref_dict_to_str(ref_dict_to_dm_code_dict(ref))] = error
             reference_validation[key][ref_dict_to_str(ref_dict_to_dm_code_dict(ref))] += \
                 "Resolves to a valid document" + dm_code_message if ref_filepath else "Does not resolve to a valid document"
+    return reference_validation
+
+def validate_references(directory: any, json_dump: bool = False) -> dict:
+    """Validates the references of all documents in a directory
+
+        Args:
+            directory (any): Directory to search in or S1000DRepository
+            json_dump (bool): Dump the results to a json file
+
+        Returns:
+            dict: Results
+    """
+    repository = directory if isinstance(directory, S1000DRepository) else S1000DRepository(directory)
+    directory = repository.directory
+
+    dm_codes_dict = get_dm_codes_from_dir(repository, True)
+    references = get_references(directory, True)
+    reference_validation = _check_references(references, dm_codes_dict, repository)
 
     if json_dump:
         parent_dir = directory.split(sep)[-1]
@@ -439,39 +754,62 @@ def ref_dict_to_xml(ref: dict) -> str:
 
     return xml_ref
 
-def get_ddn(directory: str) -> str:
+def get_ddn(directory: any) -> str:
     """Find the DDN in a directory
 
     Args:
-        directory (str): Directory to search in
+        directory (any): Directory to search in or S1000DRepository
 
     Returns:
         str: Full path of the DDN
     """
+    if isinstance(directory, S1000DRepository):
+        for path in directory.paths():
+            if "DDN" in basename(path):
+                return path
+        return None
     for root, _, files in walk(directory):
         for file_ in files:
             if "DDN" in file_:
                 return join(root, file_)
 
-def validate_ddn(directory: str, json_dump: bool = False) -> dict:
+def validate_ddn(directory: any, json_dump: bool = False) -> dict:
     """Validates the DDN of all documents in a directory
 
         Args:
-            directory (str): Directory to search in
+            directory (any): Directory to search in or S1000DRepository
             json_dump (bool): Dump the results to a json file
 
         Returns:
             dict: Results
     """
 
-    results = {}
-
     with open(get_ddn(directory), "r", encoding="utf-8") as _:
         xml = delete_first_line(_.read().replace("\n", " ").replace("> <", "><"))
-    dir_list = listdir(directory)
+    if isinstance(directory, S1000DRepository):
+        directory = directory.directory
+    results = _check_ddn(DELIVERY_LIST_ITEM_PATTERN.findall(xml), listdir(directory))
+
+    if json_dump:
+        with open(join(directory, "ddn_validation.json"), "w", encoding="utf-8") as _:
+            dump(results, _, indent=4)
+
+    return results
+
+def _check_ddn(delivery_list: list, dir_list: list) -> dict:
+    """Cross-checks the delivery list items of a DDN with the files of the directory
+
+    Args:
+        delivery_list (list): Matches of DELIVERY_LIST_ITEM_PATTERN in the DDN
+        dir_list (list): Filenames in the directory
+
+    Returns:
+        dict: Results
+    """
+    results = {}
     dcn_items = []
-    if search(DELIVERY_LIST_ITEM_REGEX, xml):
-        for fname in findall(DELIVERY_LIST_ITEM_REGEX, xml):
+    if delivery_list:
+        for fname in delivery_list:
             results[fname[1]] = []
             dcn_items.append(fname[1])
             if f"{fname[9]}-{fname[7]}" not in fname[1]:  # Issue info is not in the filename
@@ -489,8 +827,87 @@ def validate_ddn(directory: str, json_dump: bool = False) -> dict:
             if file_ not in dcn_items:
                 results["Files not in DDN"].append(file_)
 
+    return results
+
+def validate_repository(
+        directory: any,
+        workers: int = None,
+        json_dump: bool = False,
+        result_store: ResultStore = None,
+        changed_only: bool = False) -> dict:
+    """Validates the dm codes, the references and the DDN of all documents in a directory.
+    Each file is read only once, by a pool of processes, and all checks are done on that single pass.
+
+    With a result store, the references of a document are only checked again if the document
+    or the set of documents they can resolve to changed, and the DDN only if it or the directory listing changed.
+
+        Args:
+            directory (any): Directory to search in or S1000DRepository
+            workers (int, optional): Number of processes. Defaults to None, meaning the number of CPUs.
+            json_dump (bool): Dump the results to a json file
+            result_store (ResultStore, optional): Store of previous results. Defaults to None.
+            changed_only (bool, optional): Leave unchanged documents out of the results. Defaults to False.
+
+        Returns:
+            dict: Results with the keys "dm_codes", "references" and "ddn"
+    """
+    if isinstance(directory, S1000DRepository):
+        repository = directory
+        repository.refresh(workers)
+    else:
+        repository = S1000DRepository(directory, workers=workers)
+    directory = repository.directory
+
+    dm_codes_dict = get_dm_codes_from_dir(repository)
+    references = {}
+    ddn = None
+    for path in repository.paths(".xml"):
+        document = repository.get_document(path)
+        if document["version"] is not None:
+            references[path] = document["refs"]
+        if ddn is None and "DDN" in document["filename"]:
+            ddn = document
+            ddn_path = path
+
+    dir_list = listdir(directory)
+    if result_store is None:
+        results = {
+            "dm_codes": dm_codes_dict,
+            "references": _check_references(references, dm_codes_dict, repository),
+            "ddn": _check_ddn(ddn["delivery_list"], dir_list) if ddn is not None else {}
+        }
+    else:
+        results = {
+            "dm_codes": {},
+            "references": {},
+            "ddn": {}
+        }
+        references_hash = ResultStore.rules_hash(*sorted(
+            (path, codes["are_identical"]) for path, codes in dm_codes_dict.items()
+        ))
+        for path, refs in references.items():
+            stored = result_store.get("s1000d_references", path, references_hash)
+            if stored is None:
+                results["references"][path] = _check_references({path: refs}, dm_codes_dict, repository)[path]
+                results["dm_codes"][path] = dm_codes_dict[path]
+                result_store.put("s1000d_references", path, references_hash, results["references"][path])
+            elif not changed_only:
+                results["references"][path] = stored["result"]
+                results["dm_codes"][path] = dm_codes_dict[path]
+        if not changed_only:
+            results["dm_codes"] = dm_codes_dict
+        if ddn is not None:
+            ddn_hash = ResultStore.rules_hash(*sorted(dir_list))
+            stored = result_store.get("s1000d_ddn", ddn_path, ddn_hash)
+            if stored is None:
+                results["ddn"] = _check_ddn(ddn["delivery_list"], dir_list)
+                result_store.put("s1000d_ddn", ddn_path, ddn_hash, results["ddn"])
+            elif not changed_only:
+                results["ddn"] = stored["result"]
+
     if json_dump:
-        with open(join(directory, "ddn_validation.json"), "w", encoding="utf-8") as _:
+        parent_dir = directory.split(sep)[-1]
+        with open(join(directory, f"{parent_dir}_repository_validation.json"), "w", encoding="utf-8") as _:
             dump(results, _, indent=4)
 
     return results
@@ -9,13 +9,15 @@ from os.path import basename
 
 from shutil import rmtree
 
-from re import findall
-from re import sub
+from re import Match
 
 from traceback import format_exc
 
 from time import sleep
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
 import sys
 
 if sys.version_info >= (3, 12):
@@ -29,7 +31,64 @@ else:
 from .archive import unarchive_file
 from .archive import zip_folder
 from .ataispec2200 import ipl_to_dict
+from .constants import SMG_ACTOR_NAME_PATTERN
+from .ipl import find_ipl_entry
+
+
+
+def _read_smg_xml(smg_dir: str, filename: str) -> tuple:
+    """Returns the path and the content of the product.smgXml of an unarchived smg"""
+    for smg_xml in (join(smg_dir, "product.smgXml"), join(smg_dir, filename, "product.smgxml")):
+        if isfile(smg_xml):
+            with open(smg_xml, "r", encoding="utf-8") as smg_xxml:
+                return smg_xml, smg_xxml.read()
+    raise FileNotFoundError(f"There is no product.smgXml in {smg_dir}")
+
+
+def add_iplnom_to_smg_content(smg_content: str, ipl_dict: dict, debug: bool = False) -> str:
+    """Adds the item number and the nomenclature to all the Actor.Name values of a product.smgXml in one pass
+
+    Args:
+        smg_content (str): content of the product.smgXml
+        ipl_dict (dict): see ataispec2200.ipl_to_dict
+        debug (bool, optional): print debug messages. Defaults to False.
+
+    Returns:
+        str: the new content
+    """
+    def _replace_actor_name(part: Match) -> str:
+        pnr = part.group(2).split(" ")[0].strip()
+        if debug:
+            print(f"pnr: {pnr}")
+        entry = find_ipl_entry(ipl_dict, pnr)
+        if entry is None:
+            return part.group(0)
+        return f'<Actor.Name Value="{pnr + " | " + str(entry["Itemnbr"]) + " " + entry["Nomenclature"]}"'
+
+    return SMG_ACTOR_NAME_PATTERN.sub(_replace_actor_name, smg_content)
+
+
+def _add_iplnom_to_smg_file(smg: str, ipl_dict: dict, debug: bool = False):
+    """Unarchives the smg, adds the iplnom to the product.smgXml and archives it again"""
+    unarchive_file(smg)
 
+    smg_dir = smg.replace(".smg", "")
+    filename = basename(smg).replace(".smg", "")
+
+    smg_xml, smg_content = _read_smg_xml(smg_dir, filename)
+    with open(smg_xml, "w", encoding="utf-8") as smg_xxml:
+        smg_xxml.write(add_iplnom_to_smg_content(smg_content, ipl_dict, debug))
+
+    remove(smg)
+    zip_folder(smg_dir)
+    deleted = False
+    while not deleted:
+        try:
+            rmtree(smg_dir)
+            deleted = True
+        except PermissionError:
+            sleep(0.1)
+    rename(smg_dir + ".zip", smg)
 
 
 def add_iplnom_to_smg(
@@ -49,60 +108,11 @@ def add_iplnom_to_smg(
         debug (bool, optional): print debug messages. Defaults to False.
 
     """
-    unarchive_file(smg)
-
-    smg_dir = smg.replace(".smg", "")
-    filename = basename(smg).replace(".smg", "")
-
     try:
-        try:
-            with open(join(smg_dir, "product.smgXml"), "r", encoding="utf-8") as smg_xxml:
-                smg_content = smg_xxml.read()
-        except FileNotFoundError:
-            try:
-                with open(join(smg_dir, filename, "product.smgxml"), "r", encoding="utf-8") as smg_xxml:
-                    smg_content = smg_xxml.read()
-            except FileNotFoundError:
-                if qt_window is not None:
-                    progress.emit(100)
-                    console.emit(f"Finished with error: {FileNotFoundError}\n{format_exc()}")
-                return 1
-
         ipl_dict = ipl_to_dict(ipl1)
         if ipl2 is not None:
             ipl_dict.update(ipl_to_dict(ipl2))
-        new_sgm_content = smg_content
-        for part in findall(r'(<Actor.Name Value=")(.*?)(")', smg_content):  # <Actor.Name Value="MS21902J4 |  | 81343 | DMU"/>
-            pnr = part[1].split(" ")[0].strip()
-            if debug:
-                print(f"pnr: {pnr}")
-            if pnr in ipl_dict:
-                # new_sgm_content = sub(r"", r"", new_sgm_content)
-                new_sgm_content = new_sgm_content.replace("".join(part), f'<Actor.Name Value="{pnr + " | " + str(ipl_dict[pnr]["Itemnbr"]) + " " + ipl_dict[pnr]["Nomenclature"]}"')
-            elif pnr.replace('-', '') in ipl_dict:
-                new_sgm_content = new_sgm_content.replace("".join(part), f'<Actor.Name Value="{pnr + " | " + str(ipl_dict[pnr.replace("-", "")]["Itemnbr"]) + " " + ipl_dict[pnr.replace("-", "")]["Nomenclature"]}"')
-
-        if isfile(join(smg_dir, "product.smgxml")):
-            with open(join(smg_dir, "product.smgXml"), "w", encoding="utf-8") as smg_xxml:
-                smg_xxml.write(new_sgm_content)
-        elif isfile(join(smg_dir, filename, "product.smgXml")):
-            with open(join(smg_dir, filename, "product.smgXml"), "w", encoding="utf-8") as smg_xxml:
-                smg_xxml.write(new_sgm_content)
-        else:
-            if qt_window is not None:
-                progress.emit(100)
-                console.emit("There was an error while trying to find the product.smgXml file.")
-            return 1
-        remove(smg)
-        zip_folder(smg_dir)
-        deleted = False
-        while not deleted:
-            try:
-                rmtree(smg_dir)
-                deleted = True
-            except PermissionError:
-                sleep(0.1)
-        rename(smg_dir + ".zip", smg)
+        _add_iplnom_to_smg_file(smg, ipl_dict, debug)
     except Exception as err:
         if qt_window is not None:
             progress.emit(100)
@@ -112,6 +122,76 @@ def add_iplnom_to_smg(
         progress.emit(100)
     return 0
 
+
+def add_iplnom_to_smgs(
+        smgs: list,
+        ipl1: str,
+        ipl2: str = None,
+        workers: int = None,
+        debug: bool = False,
+        qt_window: QMainWindow = None,
+        progress: Signal = Signal(0),
+        console: Signal = Signal("")) -> dict:
+    """Add the iplnom to several smg files at once, e.g. for a whole product family.
+    The IPLs are read only once and the smg files are processed in parallel worker processes.
+
+    Args:
+        smgs (list): paths + filenames of the smg files
+        ipl1 (str): path + filename of the ipl1 file
+        ipl2 (str, optional): path + filename of the ipl2 file. Defaults to None.
+        workers (int, optional): number of worker processes, the number of CPUs if None. Defaults to None.
+        debug (bool, optional): print debug messages. Defaults to False.
+
+    Returns:
+        dict: {smg: 0 if successful else 1}
+    """
+    results = {}
+    try:
+        ipl_dict = ipl_to_dict(ipl1)
+        if ipl2 is not None:
+            ipl_dict.update(ipl_to_dict(ipl2))
+    except Exception as err:
+        if qt_window is not None:
+            progress.emit(100)
+            console.emit(f"Finished with error: {err}\n{format_exc()}")
+        return {smg: 1 for smg in smgs}
+
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_iplnom_worker,
+            initargs=(ipl_dict, debug)) as executor:
+        futures = [executor.submit(_add_iplnom_to_smg_worker, smg) for smg in smgs]
+        for ind, future in enumerate(as_completed(futures), start=1):
+            smg, error = future.result()
+            results[smg] = 0 if error is None else 1
+            if qt_window is not None:
+                if error is not None:
+                    console.emit(f"{basename(smg)}: Finished with error: {error}")
+                progress.emit(int(ind / len(futures) * 100))
+            elif debug and error is not None:
+                print(f"{smg}: {error}")
+    return {smg: results[smg] for smg in smgs}
+
+
+_WORKER_IPL_DICT = None
+_WORKER_DEBUG = False
+
+
+def _init_iplnom_worker(ipl_dict: dict, debug: bool):
+    """Keeps the IPL dictionary in the worker process, so it is sent only once and not with every smg"""
+    global _WORKER_IPL_DICT, _WORKER_DEBUG
+    _WORKER_IPL_DICT = ipl_dict
+    _WORKER_DEBUG = debug
+
+
+def _add_iplnom_to_smg_worker(smg: str) -> tuple:
+    """Processes one smg in a worker process, see add_iplnom_to_smgs"""
+    try:
+        _add_iplnom_to_smg_file(smg, _WORKER_IPL_DICT, _WORKER_DEBUG)
+    except Exception as err:
+        return smg, f"{err}\n{format_exc()}"
+    return smg, None
+
 if __name__ == "__main__":
     add_iplnom_to_smg(
         r"D:\Automation\Illu Automation\3D-files\6235A0000-03_rev02.smg",
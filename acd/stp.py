@@ -9,13 +9,15 @@ from os.path import basename
 
 from shutil import rmtree
 
-from re import findall
-from re import sub
+from re import Match
 
 from traceback import format_exc
 
 from time import sleep
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
 import sys
 
 if sys.version_info >= (3, 12):
@@ -29,6 +31,42 @@ else:
 from .archive import unarchive_file
 from .archive import zip_folder
 from .ataispec2200 import ipl_to_dict
+from .constants import STP_PRODUCT_PATTERN
+from .ipl import find_ipl_entry
+
+
+def add_iplnom_to_stp_content(stp_content: str, ipl_dict: dict, debug: bool = False) -> str:
+    """Adds the item number and the nomenclature to all the PRODUCT names of a stp in one pass
+
+    Args:
+        stp_content (str): content of the stp file
+        ipl_dict (dict): see ataispec2200.ipl_to_dict
+        debug (bool, optional): print debug messages. Defaults to False.
+
+    Returns:
+        str: the new content
+    """
+    def _replace_product(part: Match) -> str:
+        pnr = part.group(2).split(" ")[0].strip()
+        if debug:
+            print(f"pnr: {pnr}")
+        entry = find_ipl_entry(ipl_dict, pnr)
+        if entry is None:
+            return part.group(0)
+        return f"PRODUCT('{pnr + ' | ' + str(entry['Itemnbr']) + ' ' + entry['Nomenclature']}'"
+
+    return STP_PRODUCT_PATTERN.sub(_replace_product, stp_content)
+
+
+def _add_iplnom_to_stp_file(stp: str, ipl_dict: dict, debug: bool = False):
+    """Adds the iplnom to the stp file in place"""
+    with open(stp, "r", encoding="utf-8") as stp_file:
+        stp_content = stp_file.read()
+
+    stp_content = add_iplnom_to_stp_content(stp_content, ipl_dict, debug)
+
+    with open(stp, "w", encoding="utf-8") as stp_file:
+        stp_file.write(stp_content)
 
 
 def add_iplnom_to_stp(
@@ -50,23 +88,10 @@ def add_iplnom_to_stp(
     """
 
     try:
-        with open(stp, "r", encoding="utf-8") as stp_file:
-            stp_content = stp_file.read()
-
         ipl_dict = ipl_to_dict(ipl1)
         if ipl2 is not None:
             ipl_dict.update(ipl_to_dict(ipl2))
-        for part in findall(r"(PRODUCT\(')(.*?)(')", stp_content):  # <Actor.Name Value="MS21902J4 |  | 81343 | DMU"/>
-            pnr = part[1].split(" ")[0].strip()
-            if debug:
-                print(f"pnr: {pnr}")
-            if pnr in ipl_dict:
-                stp_content = stp_content.replace("".join(part), f"PRODUCT('{pnr + ' | ' + str(ipl_dict[pnr]['Itemnbr']) + ' ' + ipl_dict[pnr]['Nomenclature']}'")
-            elif pnr.replace("-", "") in ipl_dict:
-                stp_content = stp_content.replace("".join(part), f"PRODUCT('{pnr + ' | ' + str(ipl_dict[pnr.replace('-', '')]['Itemnbr']) + ' ' + ipl_dict[pnr.replace('-', '')]['Nomenclature']}'")
-
-        with open(stp, "w", encoding="utf-8") as stp_file:
-            stp_file.write(stp_content)
+        _add_iplnom_to_stp_file(stp, ipl_dict, debug)
     except Exception as err:
         if debug:
             print(f"Error: {err}\n{format_exc()}")
@@ -79,6 +104,76 @@ def add_iplnom_to_stp(
         progress.emit(100)
     return 0
 
+
+def add_iplnom_to_stps(
+        stps: list,
+        ipl1: str,
+        ipl2: str = None,
+        workers: int = None,
+        debug: bool = False,
+        qt_window: QMainWindow = None,
+        progress: Signal = Signal(0),
+        console: Signal = Signal("")) -> dict:
+    """Add the iplnom to several stp files at once, e.g. for a whole product family.
+    The IPLs are read only once and the stp files are processed in parallel worker processes.
+
+    Args:
+        stps (list): paths + filenames of the stp files
+        ipl1 (str): path + filename of the ipl1 file
+        ipl2 (str, optional): path + filename of the ipl2 file. Defaults to None.
+        workers (int, optional): number of worker processes, the number of CPUs if None. Defaults to None.
+        debug (bool, optional): print debug messages. Defaults to False.
+
+    Returns:
+        dict: {stp: 0 if successful else 1}
+    """
+    results = {}
+    try:
+        ipl_dict = ipl_to_dict(ipl1)
+        if ipl2 is not None:
+            ipl_dict.update(ipl_to_dict(ipl2))
+    except Exception as err:
+        if qt_window is not None:
+            progress.emit(100)
+            console.emit(f"Finished with error: {err}\n{format_exc()}")
+        return {stp: 1 for stp in stps}
+
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_iplnom_worker,
+            initargs=(ipl_dict, debug)) as executor:
+        futures = [executor.submit(_add_iplnom_to_stp_worker, stp) for stp in stps]
+        for ind, future in enumerate(as_completed(futures), start=1):
+            stp, error = future.result()
+            results[stp] = 0 if error is None else 1
+            if qt_window is not None:
+                if error is not None:
+                    console.emit(f"{basename(stp)}: Finished with error: {error}")
+                progress.emit(int(ind / len(futures) * 100))
+            elif debug and error is not None:
+                print(f"{stp}: {error}")
+    return {stp: results[stp] for stp in stps}
+
+
+_WORKER_IPL_DICT = None
+_WORKER_DEBUG = False
+
+
+def _init_iplnom_worker(ipl_dict: dict, debug: bool):
+    """Keeps the IPL dictionary in the worker process, so it is sent only once and not with every stp"""
+    global _WORKER_IPL_DICT, _WORKER_DEBUG
+    _WORKER_IPL_DICT = ipl_dict
+    _WORKER_DEBUG = debug
+
+
+def _add_iplnom_to_stp_worker(stp: str) -> tuple:
+    """Processes one stp in a worker process, see add_iplnom_to_stps"""
+    try:
+        _add_iplnom_to_stp_file(stp, _WORKER_IPL_DICT, _WORKER_DEBUG)
+    except Exception as err:
+        return stp, f"{err}\n{format_exc()}"
+    return stp, None
+
 if __name__ == "__main__":
     add_iplnom_to_stp(
         r"D:\CMM Automation\REWORK\ILLU\3D file and list for EFW\D252R1258-004-00_A-APPROVED.stp",
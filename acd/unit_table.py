@@ -31,6 +31,8 @@ from openpyxl.styles import PatternFill
 from openpyxl.styles import Font
 from openpyxl.styles import Alignment
 
+from .cmm_document import CmmDocument
+from .cmm_document import inject_entities
 from .xml_processing import delete_first_line
 from .xml_processing import replace_special_characters
 from .xml_processing import linearize_xml
@@ -46,6 +48,7 @@ class UnrecognizedUnit(Exception):
 class UnitTable():
     def __init__(self, main_window: QMainWindow = None, progress: Signal = None, console: Signal = None) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
         self.conversion_factors = None
         self.extracted_numbers = None
@@ -59,6 +62,17 @@ class UnitTable():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -74,6 +88,8 @@ class UnitTable():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.normalized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             # xml_content = linearize_xml(xml_content)
@@ -92,6 +108,8 @@ class UnitTable():
             str: xml content with mentioned modifications.
         """
         xml_content = self.prepare_xml()
+        if self.document is not None:
+            return inject_entities(xml_content)
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
         xml_content = sub(r"(]>(.|\n)*?<cmm)", entities + r'\1', xml_content)
@@ -1,4 +1,3 @@
-from re import findall
 from re import sub
 from re import search
 
@@ -35,6 +34,9 @@ import subprocess
 
 import requests
 
+from .cmm_document import CmmDocument
+from .patterns import get_regex
+from .patterns import search_group
 from .xml_processing import delete_first_line
 from .xml_processing import replace_special_characters
 from .xml_processing import linearize_xml
@@ -134,6 +136,7 @@ def update_chrome_driver(
 class VendorList():
     def __init__(self) -> None:
         self.xml_path = None
+        self.document = None
         self.export_path = expanduser("~/Desktop")
 
     def set_xml(self, xml_path: str):
@@ -143,6 +146,17 @@ class VendorList():
             xml_path (str): xml file path.
         """
         self.xml_path = xml_path
+        self.document = None
+
+    def set_document(self, document: CmmDocument):
+        """Function with which the user can set an already loaded CmmDocument to be checked.
+        The document is shared with other checkers, so the xml is read and parsed only once.
+
+        Args:
+            document (CmmDocument): loaded document, see CmmDocument.load.
+        """
+        self.document = document
+        self.xml_path = document.xml_path
 
     def set_export_path(self, export_path: str):
         """Function to specify a path different to the default path (desktop),
@@ -158,6 +172,8 @@ class VendorList():
         Returns:
             str: It returns the resulting XML content as a string.
         """
+        if self.document is not None:
+            return self.document.linearized
         with open(self.xml_path, "r", encoding="utf-8") as _:
             xml_content = _.read()
             xml_content = delete_first_line(xml_content)
@@ -172,6 +188,8 @@ class VendorList():
         Returns:
             str: xml content with mentioned modifications.
         """
+        if self.document is not None:
+            return self.document.resolved
         xml_content = self.prepare_xml()
         with open(join(FILEPATH, "inmedISOEntities.ent"), "r", encoding="utf-8") as _:
             entities = _.read()
@@ -187,23 +205,14 @@ class VendorList():
         xml_content = self.replace_entities()
         if "<title>Vendor List</title>" not in xml_content and "<title>VENDOR LIST</title>" not in xml_content:
             return xml_content, []
-        vendlist = search(
-            r"(\<vendlist.*?\>)(.*?)(\</vendlist\>)", xml_content).group(2)
-        vendlist = [match for match in findall(
-            r"(?:\<vendata.*?\>)(.*?)(?:\</vendata\>)", vendlist)]
+        vendlist = get_regex(r"(\<vendlist.*?\>)(.*?)(\</vendlist\>)").search(xml_content).group(2)
+        vendlist = get_regex(r"(?:\<vendata.*?\>)(.*?)(?:\</vendata\>)").findall(vendlist)
 
         # Capture vendor code and vendor info in tuples
         vendor_info = []
         for elem in vendlist:
-            temp = ()
-            if search(r"(\<mfr\>)(.*?)(\</mfr\>)", elem):
-                mfr = search(r"(\<mfr\>)(.*?)(\</mfr\>)", elem).group(2)
-            else:
-                mfr = ""
-            if search(r"(\<mad\>)(.*?)(\</mad\>)", elem):
-                mad = search(r"(\<mad\>)(.*?)(\</mad\>)", elem).group(2)
-            else:
-                mad = ""
+            mfr = search_group(r"(\<mfr\>)(.*?)(\</mfr\>)", elem, 2, "")
+            mad = search_group(r"(\<mad\>)(.*?)(\</mad\>)", elem, 2, "")
             temp = (mfr, mad)
             if mfr not in VENDOR_EXCEPTIONS:
                 vendor_info.append(temp)
@@ -218,7 +227,7 @@ class VendorList():
 
         # Get all itemdata elements
         itemdata = []
-        for match in findall(r"(?:\<itemdata.*?\>)(.*?)(?:\</itemdata\>)", xml_content):
+        for match in get_regex(r"(?:\<itemdata.*?\>)(.*?)(?:\</itemdata\>)").findall(xml_content):
             itemdata.append(match)
 
         mfr_list = []
@@ -229,8 +238,8 @@ class VendorList():
         #             mfr_list.append(
         #                 search(r"(\<mfr\>)(.*?)(\</mfr\>)", elem).group(2))
         for elem in itemdata:
-            matches = findall(
-                r"(\<mfr\>)(.*?)(\</mfr\>)|(\<optmfr\>.*?\<mfr\>)(.*?)(\</mfr\>)", elem)
+            matches = get_regex(
+                r"(\<mfr\>)(.*?)(\</mfr\>)|(\<optmfr\>.*?\<mfr\>)(.*?)(\</mfr\>)").findall(elem)
             for groups in matches:
                 if groups[1] and groups[1] not in VENDOR_EXCEPTIONS:
                     mfr_list.append(groups[1])
@@ -0,0 +1,400 @@
+"""Word to PDF converter backends used by docx_.word2pdf.
+
+MsWordConverter uses Microsoft Word through win32com and only runs on Windows.
+LibreOfficeConverter uses LibreOffice in headless mode and runs everywhere LibreOffice is installed.
+convert_word_files() runs a pool of converters of one backend over a queue of files.
+"""
+from platform import system
+
+from abc import ABC
+from abc import abstractmethod
+
+from os import remove
+from os.path import join
+from os.path import isfile
+from os.path import abspath
+from os.path import basename
+from os.path import splitext
+
+from pathlib import Path
+
+from queue import Queue
+from queue import Empty
+
+from shutil import move
+from shutil import which
+from shutil import rmtree
+
+from tempfile import mkdtemp
+
+from threading import Thread
+from threading import Timer
+
+from subprocess import run
+from subprocess import Popen
+from subprocess import DEVNULL
+from subprocess import TimeoutExpired
+
+from time import sleep
+from time import perf_counter
+
+from traceback import format_exc
+
+if system() == "Windows":
+    from win32com.client import Dispatch
+    from pythoncom import CoInitialize
+    from pythoncom import CoUninitialize
+    from subprocess import CREATE_NEW_PROCESS_GROUP
+    # the soffice launcher starts soffice.bin, both are in a new process group so they can be killed together
+    PROCESS_GROUP_OPTIONS = {"creationflags": CREATE_NEW_PROCESS_GROUP}
+else:
+    from os import killpg
+    from signal import SIGKILL
+    PROCESS_GROUP_OPTIONS = {"start_new_session": True}
+
+try:  # Python-UNO bridge, shipped with LibreOffice (e.g. python3-uno). Without it, soffice is started per file.
+    import uno
+    from com.sun.star.beans import PropertyValue
+except ImportError:
+    uno = None
+
+SOFFICE_PATHS = [
+    "soffice",
+    "libreoffice",
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+    "/Applications/LibreOffice.app/Contents/MacOS/soffice",
+]
+CONVERSION_TIMEOUT = 300
+STARTUP_TIMEOUT = 60
+
+
+class ConversionError(Exception):
+    pass
+
+
+class ConversionTimeout(ConversionError):
+    pass
+
+
+def find_soffice() -> str:
+    """Returns the path of the LibreOffice executable
+
+    Raises:
+        ConversionError: if LibreOffice is not installed
+
+    Returns:
+        str: path of soffice
+    """
+    for soffice in SOFFICE_PATHS:
+        found = which(soffice) or (soffice if isfile(soffice) else None)
+        if found is not None:
+            return found
+    raise ConversionError("LibreOffice could not be found. Install it or pass the path of soffice.")
+
+
+def _kill_process_group(process: Popen):
+    """Kills a process started with PROCESS_GROUP_OPTIONS together with the processes it started"""
+    if system() == "Windows":
+        run(["taskkill", "/F", "/T", "/PID", str(process.pid)], stdout=DEVNULL, stderr=DEVNULL, check=False)
+    else:
+        try:
+            killpg(process.pid, SIGKILL)
+        except ProcessLookupError:  # the whole group already exited
+            pass
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
+
+class WordConverter(ABC):
+    """Base class of the converters. A converter is used by one thread only,
+    so it can keep its application open between files.
+    """
+    @abstractmethod
+    def convert(self, word_file: str, pdf_file: str, bookmarks: int = 0):
+        """Converts a Word file to PDF
+
+        Args:
+            word_file (str): path + filename of the Word file
+            pdf_file (str): path + filename of the PDF file
+            bookmarks (int, optional): 0 - no bookmarks, 1 - heading bookmarks, 2 - Word bookmarks. Defaults to 0.
+        """
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> "WordConverter":
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class MsWordConverter(WordConverter):
+    """Microsoft Word through win32com (Windows only).
+    """
+    def __init__(self):
+        CoInitialize()
+        self._word = Dispatch("Word.Application")
+
+    def convert(self, word_file: str, pdf_file: str, bookmarks: int = 0):
+        doc = self._word.Documents.Open(word_file)
+        try:
+            # Save as PDF - Advanced Option, with choices
+            doc.ExportAsFixedFormat(pdf_file,
+                                    17,  # ExportFormat # 17 - wdExportFormatPDF, 18 - wdExportFormatXPS
+                                    False,  # OpenAfterExport # Boolean value
+                                    0,  # OptimizeFor # 0 - wdExportOptimizeForPrint, 1 - wdExportOptimizeForOnScreen
+                                    0,  # Range # 0 - wdExportAllDocument,
+                                        # 1 - wdExportSelection,
+                                        # 2 - wdExportCurrentPage,
+                                        # 3 - wdExportFromTo
+                                    1,  # From # keep 1 as default if Range is 0
+                                    1,  # To # keep 1 as default if Range is 0
+                                    7,  # Item # 0 - wdExportDocumentContent, 7 - wdExportDocumentWithMarkup
+                                    False,  # IncludeDocProps # Boolean value
+                                    False,  # KeepIRM # Boolean value
+                                    bookmarks,  # CreateBookmarks
+                                                # 0 - wdExportCreateNoBookmarks,
+                                                # 1 - wdExportCreateHeadingBookmarks,
+                                                # 2 - wdExportCreateWordBookmarks
+                                    True,  # DocStructureTags # Boolean value
+                                    True,  # BitmapMissingFonts # Boolean value
+                                    False,  # UseISO19005_1 # Boolean value
+                                    )
+        finally:
+            doc.Close()
+
+    def close(self):
+        # Word is not quit, the user might have other documents open in the same instance
+        self._word = None
+        CoUninitialize()
+
+
+class LibreOfficeConverter(WordConverter):
+    """LibreOffice in headless mode.
+
+    Every converter has its own LibreOffice user profile, so several converters can run at the same time.
+    If the Python-UNO bridge is available, one soffice process is started and kept open for all the files.
+    Otherwise soffice --convert-to is started for every file (the profile is still reused).
+    A conversion which takes longer than timeout seconds is killed and raises ConversionTimeout.
+    """
+    def __init__(self, soffice: str = None, timeout: int = CONVERSION_TIMEOUT):
+        self.soffice = soffice if soffice is not None else find_soffice()
+        self.timeout = timeout
+        self._profile_dir = mkdtemp(prefix="acd_lo_profile_")
+        self._out_dir = mkdtemp(prefix="acd_lo_out_")
+        self._process = None
+        self._desktop = None
+
+    def _profile_url(self) -> str:
+        return Path(self._profile_dir).as_uri()
+
+    @staticmethod
+    def _filter_data(bookmarks: int) -> dict:
+        """PDF export options for the Word bookmarks modes of MsWordConverter"""
+        return {
+            "ExportBookmarks": bookmarks > 0,
+            "ExportBookmarksToPDFDestination": bookmarks == 2,
+        }
+
+    def convert(self, word_file: str, pdf_file: str, bookmarks: int = 0):
+        if uno is not None:
+            self._convert_uno(abspath(word_file), abspath(pdf_file), bookmarks)
+        else:
+            self._convert_cli(abspath(word_file), abspath(pdf_file), bookmarks)
+
+    def _convert_cli(self, word_file: str, pdf_file: str, bookmarks: int):
+        filter_options = ",".join(
+            f'"{name}":{{"type":"boolean","value":"{str(value).lower()}"}}'
+            for name, value in self._filter_data(bookmarks).items())
+        process = Popen(
+            [
+                self.soffice,
+                f"-env:UserInstallation={self._profile_url()}",
+                "--headless", "--invisible", "--nologo", "--norestore", "--nolockcheck",
+                "--convert-to", f"pdf:writer_pdf_Export:{{{filter_options}}}",
+                "--outdir", self._out_dir,
+                word_file
+            ],
+            stdout=DEVNULL, stderr=DEVNULL, **PROCESS_GROUP_OPTIONS)
+        try:
+            returncode = process.wait(timeout=self.timeout)
+        except TimeoutExpired as err:
+            # killing only the launcher could leave soffice.bin running with the profile locked
+            _kill_process_group(process)
+            raise ConversionTimeout(f"Conversion took longer than {self.timeout} seconds: {word_file}") from err
+        out_file = join(self._out_dir, splitext(basename(word_file))[0] + ".pdf")
+        if returncode != 0 or not isfile(out_file):
+            raise ConversionError(f"LibreOffice could not convert {word_file} (exit code {returncode})")
+        move(out_file, pdf_file)
+
+    def _start(self):
+        """Starts the soffice process of this converter and connects to it"""
+        pipe_name = f"acd_{basename(self._profile_dir)}"
+        self._process = Popen(
+            [
+                self.soffice,
+                f"-env:UserInstallation={self._profile_url()}",
+                "--headless", "--invisible", "--nologo", "--norestore", "--nolockcheck", "--nodefault",
+                f"--accept=pipe,name={pipe_name};urp;StarOffice.ComponentContext"
+            ],
+            stdout=DEVNULL, stderr=DEVNULL, **PROCESS_GROUP_OPTIONS)
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context)
+        start = perf_counter()
+        while True:
+            try:
+                context = resolver.resolve(f"uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext")
+                break
+            except Exception:  # com.sun.star.connection.NoConnectException until soffice listens
+                if self._process.poll() is not None or perf_counter() - start > STARTUP_TIMEOUT:
+                    self._stop()
+                    raise ConversionError("LibreOffice could not be started")
+                sleep(0.2)
+        self._desktop = context.ServiceManager.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+
+    def _stop(self):
+        if self._process is not None:
+            _kill_process_group(self._process)
+        self._process = None
+        self._desktop = None
+
+    @staticmethod
+    def _properties(**properties: any) -> tuple:
+        return tuple(PropertyValue(Name=name, Value=value) for name, value in properties.items())
+
+    def _convert_uno(self, word_file: str, pdf_file: str, bookmarks: int):
+        if self._process is None or self._process.poll() is not None:
+            self._stop()
+            self._start()
+        # UNO calls can not be interrupted, so soffice is killed if the conversion hangs
+        watchdog = Timer(self.timeout, _kill_process_group, (self._process,))
+        watchdog.start()
+        try:
+            document = self._desktop.loadComponentFromURL(
+                Path(word_file).as_uri(), "_blank", 0, self._properties(Hidden=True, ReadOnly=True))
+            if document is None:
+                raise ConversionError(f"LibreOffice could not open {word_file}")
+            try:
+                filter_data = uno.Any(
+                    "[]com.sun.star.beans.PropertyValue", self._properties(**self._filter_data(bookmarks)))
+                document.storeToURL(
+                    Path(pdf_file).as_uri(), self._properties(FilterName="writer_pdf_Export", FilterData=filter_data))
+            finally:
+                document.close(True)
+        except ConversionError:
+            raise
+        except Exception as err:
+            if not watchdog.is_alive():
+                self._stop()
+                raise ConversionTimeout(f"Conversion took longer than {self.timeout} seconds: {word_file}") from err
+            self._stop()  # the process might be in a bad state, a new one is started for the next file
+            raise ConversionError(f"LibreOffice could not convert {word_file}: {err}") from err
+        finally:
+            watchdog.cancel()
+
+    def close(self):
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+                self._process.wait(timeout=10)
+            except Exception:
+                pass
+        self._stop()
+        rmtree(self._profile_dir, ignore_errors=True)
+        rmtree(self._out_dir, ignore_errors=True)
+
+
+WORD_CONVERTERS = {
+    "word": MsWordConverter,
+    "libreoffice": LibreOfficeConverter,
+}
+
+
+def default_backend() -> str:
+    return "word" if system() == "Windows" else "libreoffice"
+
+
+def convert_word_files(
+        jobs: list,
+        backend: str = None,
+        workers: int = 1,
+        bookmarks: int = 0,
+        timeout: int = CONVERSION_TIMEOUT,
+        retries: int = 1,
+        callback: callable = None,
+        **converter_options: any) -> dict:
+    """Converts Word files to PDF with a pool of converters.
+
+    Every worker thread owns one long-lived converter and takes the next file from a shared queue.
+    A file which fails is retried, with a fresh converter, up to retries times.
+
+    Args:
+        jobs (list): (word_file, pdf_file) tuples
+        backend (str, optional): "word" or "libreoffice". Defaults to Word on Windows, LibreOffice elsewhere.
+        workers (int, optional): number of converters. Microsoft Word always uses 1. Defaults to 1.
+        bookmarks (int, optional): see WordConverter.convert. Defaults to 0.
+        timeout (int, optional): seconds per file, LibreOffice only. Defaults to CONVERSION_TIMEOUT.
+        retries (int, optional): number of retries of a failed file. Defaults to 1.
+        callback (callable, optional): called with (word_file, error) after each file, error is None on success.
+            It is called from the worker threads. Defaults to None.
+        converter_options (any): passed to the converter, e.g. soffice for LibreOffice.
+
+    Returns:
+        dict: {word_file: None if converted, else the error message}
+    """
+    backend = default_backend() if backend is None else backend
+    if backend not in WORD_CONVERTERS:
+        raise ConversionError(f"Unknown converter backend: {backend}. Use one of {', '.join(WORD_CONVERTERS)}")
+    if backend == "word":
+        workers = 1  # Word automation runs in one Word instance anyway
+    else:
+        converter_options["timeout"] = timeout
+
+    queue = Queue()
+    for job in jobs:
+        queue.put(job)
+    results = {}
+
+    def _worker():
+        converter = None
+        try:
+            while True:
+                try:
+                    word_file, pdf_file = queue.get_nowait()
+                except Empty:
+                    break
+                error = None
+                for _ in range(retries + 1):
+                    try:
+                        if converter is None:
+                            converter = WORD_CONVERTERS[backend](**converter_options)
+                        converter.convert(word_file, pdf_file, bookmarks)
+                        error = None
+                        break
+                    except Exception as err:
+                        error = f"{type(err).__name__}: {err}\n{format_exc()}"
+                        if isfile(pdf_file):
+                            remove(pdf_file)
+                        if converter is not None:
+                            converter.close()
+                            converter = None
+                results[word_file] = error
+                if callback is not None:
+                    try:
+                        callback(word_file, error)
+                    except Exception:  # e.g. the progress bar, it should not stop the conversion
+                        print(format_exc())
+        finally:
+            if converter is not None:
+                converter.close()
+
+    threads = [Thread(target=_worker, daemon=True) for _ in range(max(1, min(workers, len(jobs))))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {word_file: results[word_file] for word_file, _ in jobs}
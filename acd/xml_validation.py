@@ -1,4 +1,7 @@
 from os import remove
+from os import makedirs
+from os import listdir
+from os import cpu_count
 from os.path import isfile
 from os.path import basename
 from os.path import join
@@ -10,11 +13,16 @@ from re import sub
 from re import search
 from re import findall
 
-from traceback import format_exc
 
 from urllib import request
+from urllib.parse import urljoin
+from urllib.parse import urlparse
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from json import dump
 from io import StringIO
 from io import BytesIO
+from hashlib import sha256
 from sys import exit as done
 
 from lxml import etree
@@ -29,9 +37,109 @@ from openpyxl.styles import PatternFill
 
 
 from .xml_processing import linearize_xml
-from .xml_processing import delete_first_line
 from .unit_list import unit_list
 from .python_func import check_brackets
+from .result_store import ResultStore
+
+SCHEMA_CACHE_DIR = join(expanduser("~"), ".acd", "schemas")
+SCHEMA_CACHE_SIZE = 8
+
+_COMPILED_SCHEMAS = OrderedDict()
+
+
+def get_local_schema(schema_url: str, cache_dir: str = SCHEMA_CACHE_DIR) -> str:
+    """Returns the path of the local copy of a schema (or of one of its includes).
+    The schema is downloaded into the catalog only the first time,
+    afterwards it is always read from disk, so validation also works offline.
+
+    Args:
+        schema_url (str): url of the schema
+        cache_dir (str, optional): catalog directory. Defaults to SCHEMA_CACHE_DIR.
+
+    Returns:
+        str: local file path
+    """
+    parsed_url = urlparse(schema_url)
+    if parsed_url.scheme not in ("http", "https"):
+        return parsed_url.path if parsed_url.scheme == "file" else schema_url
+    # host:port, ":" is not allowed in Windows paths
+    local_path = join(cache_dir, parsed_url.netloc.replace(":", "_"), *parsed_url.path.strip("/").split("/"))
+    if not isfile(local_path):
+        with request.urlopen(schema_url) as _:
+            content = _.read()
+        makedirs(dirname(local_path), exist_ok=True)
+        with open(local_path, "wb") as _:
+            _.write(content)
+    return local_path
+
+
+def get_schema_hash(schema_url: str, cache_dir: str = SCHEMA_CACHE_DIR) -> str:
+    """Returns the sha256 of the local copy of a schema and of all the schemas it includes, imports or redefines,
+    so results validated against an older version of the schema can be told apart.
+
+    Args:
+        schema_url (str): url of the schema
+        cache_dir (str, optional): catalog directory. Defaults to SCHEMA_CACHE_DIR.
+
+    Returns:
+        str: sha256
+    """
+    schema_hash = sha256()
+    seen = set()
+    to_read = [schema_url]
+    while to_read:
+        url = to_read.pop()
+        if url in seen:
+            continue
+        seen.add(url)
+        with open(get_local_schema(url, cache_dir), "rb") as _:
+            content = _.read()
+        schema_hash.update(url.encode("utf-8") + b"\0" + sha256(content).digest())
+        for location in etree.fromstring(content).xpath(
+                "//xs:include/@schemaLocation | //xs:import/@schemaLocation | //xs:redefine/@schemaLocation",
+                namespaces={"xs": "http://www.w3.org/2001/XMLSchema"}):
+            to_read.append(urljoin(url, location))
+    return schema_hash.hexdigest()
+
+
+class SchemaCatalogResolver(etree.Resolver):
+    """lxml resolver that loads schemas and their includes from the local catalog, see get_local_schema.
+    The documents keep their original url as base url, so relative includes are resolved through the catalog as well.
+    """
+    def __init__(self, cache_dir: str = SCHEMA_CACHE_DIR):
+        super().__init__()
+        self.cache_dir = cache_dir
+
+    def resolve(self, system_url, public_id, context):
+        if urlparse(system_url).scheme not in ("http", "https"):
+            return None
+        with open(get_local_schema(system_url, self.cache_dir), "rb") as _:
+            return self.resolve_string(_.read(), context, base_url=system_url)
+
+
+def get_compiled_schema(schema_url: str, cache_dir: str = SCHEMA_CACHE_DIR) -> etree.XMLSchema:
+    """Returns the compiled schema of a schema url.
+    The last SCHEMA_CACHE_SIZE compiled schemas are kept in memory,
+    so each schema is only compiled once per process.
+
+    Args:
+        schema_url (str): url of the schema
+        cache_dir (str, optional): catalog directory. Defaults to SCHEMA_CACHE_DIR.
+
+    Returns:
+        etree.XMLSchema: compiled schema
+    """
+    if schema_url in _COMPILED_SCHEMAS:
+        _COMPILED_SCHEMAS.move_to_end(schema_url)
+        return _COMPILED_SCHEMAS[schema_url]
+    parser = etree.XMLParser()
+    parser.resolvers.add(SchemaCatalogResolver(cache_dir))
+    with open(get_local_schema(schema_url, cache_dir), "rb") as _:
+        schema_doc = etree.parse(BytesIO(_.read()), parser, base_url=schema_url)
+    _COMPILED_SCHEMAS[schema_url] = etree.XMLSchema(schema_doc)
+    while len(_COMPILED_SCHEMAS) > SCHEMA_CACHE_SIZE:
+        _COMPILED_SCHEMAS.popitem(last=False)
+    return _COMPILED_SCHEMAS[schema_url]
 
 
 class XmlSchemaValidator():
@@ -42,26 +150,35 @@ class XmlSchemaValidator():
 
     def __init__(self, debug: bool = False):
         self.debug = debug
+        self.export_path = expanduser("~/Desktop")
+        self._result_store = None
+        self._schema_cache_dir = SCHEMA_CACHE_DIR
 
-    def _add_root_path_to_schema_location(
-            self,
-            xml_content: str,
-            root_path: str) -> str:
+    def set_export_path(self, export_path: str):
+        """Function to specify a path different to the default path (desktop),
+        where to export the files the script produces.
+        Args:
+            export_path (str): path to where the generated files should be exported.
         """
-        Searches for all instances that match the regular expression and
-        adds the root to the schema names
+        self.export_path = export_path
+
+    def set_schema_cache_dir(self, cache_dir: str):
+        """Function with which the user can set the directory of the local schema catalog.
+        Copy the schemas there (keeping the host/path structure of their urls) to validate offline.
 
         Args:
-            xml_content (str): Content of the schema (after the first line was deleted)
-            root_path (str): String that contains the root that will be added to the schema names
+            cache_dir (str): catalog directory
+        """
+        self._schema_cache_dir = cache_dir
 
-        Returns:
-            str: String containing the content of the schema,
-            but with the changes mentioned in the description
+    def set_result_store(self, result_store: ResultStore):
+        """Function with which the user can set a ResultStore, so that xml files which did not change
+        since they were last validated against the same schema content are not validated again.
 
+        Args:
+            result_store (ResultStore): result store, None to disable it
         """
-
-        return sub(r'(schemaLocation=")(.*?)("/>)', r'\1' + root_path + r'\2\3', xml_content)
+        self._result_store = result_store
 
     def _get_schema_url_and_root(self, linearized_file: str) -> tuple:
         """
@@ -88,9 +205,8 @@ class XmlSchemaValidator():
 
     def _new_urlopen(self, schema_url: str) -> str:
         """
-        Works like the urlopen from the request library.
-        However, urlopen saves the content as a binarystring which we don't want to.
-        Thus we call the function decode to receive a regular string.
+        Returns the content of a schema as a regular string.
+        The schema is read from the local catalog and only downloaded if it is not there yet.
 
         Args:
             schema_url (str): The url of the schema, included in the xml
@@ -100,17 +216,17 @@ class XmlSchemaValidator():
 
         """
 
-        with request.urlopen(schema_url) as _:
-            return _.read().decode('utf-8')
+        with open(get_local_schema(schema_url, self._schema_cache_dir), "r", encoding="utf-8") as _:
+            return _.read()
 
-    def _lxml_parser(self, schema: str, xml_file: str) -> tuple:
+    def _lxml_parser(self, schema: any, xml_file: str) -> tuple:
         """
         Validate xml document against schema with lxml.
         If there are errors display the first error and in which line it appears.
         If there are no errors display that there are no errors.
 
         Args:
-            schema (str): String containing the content of the schema to parse
+            schema (any): String containing the content of the schema to parse or the compiled schema
             xml_file (str): The path to the xml file to be validated
 
         Returns:
@@ -118,9 +234,8 @@ class XmlSchemaValidator():
 
         """
 
-        schema = StringIO(schema)
-        schema = etree.parse(schema)
-        schema = etree.XMLSchema(schema)
+        if isinstance(schema, str):
+            schema = etree.XMLSchema(etree.parse(StringIO(schema)))
 
         with open(xml_file, "r", encoding="utf-8") as _:
             xml_content = _.read()
@@ -133,7 +248,7 @@ class XmlSchemaValidator():
             print("Validation error(s):")
         return schema.error_log[0].line, schema.error_log[0].message
 
-    def _lxml_parser_all_errors(self, schema: str, xml_file: str) -> tuple:
+    def _lxml_parser_all_errors(self, schema: any, xml_file: str) -> tuple:
         """
         Validate xml document against schema with lxml.
         If there are multiple errors, try to fix them and display the error(s) and
@@ -142,7 +257,7 @@ class XmlSchemaValidator():
         If there are no errors display that there are no errors.
 
         Args:
-            schema (str): String containing the content of the schema to parse
+            schema (any): String containing the content of the schema to parse or the compiled schema
             xml_file (str): The path to the xml file to be validated
 
         Returns:
@@ -150,9 +265,8 @@ class XmlSchemaValidator():
 
         """
 
-        schema = StringIO(schema)
-        schema = etree.parse(schema)
-        schema = etree.XMLSchema(schema)
+        if isinstance(schema, str):
+            schema = etree.XMLSchema(etree.parse(StringIO(schema)))
 
         with open(xml_file, "r", encoding="utf-8") as _:
             xml_content = _.read()
@@ -246,11 +360,127 @@ class XmlSchemaValidator():
 
         return "edited_xml.xml"
 
+    def _fix_error_in_memory(
+            self,
+            xml_lines: list,
+            line_error: int,
+            error_message: str,
+            schema_content: str) -> list:
+        """
+        Same fixes as test_delete_error, but done on the lines of the xml in memory:
+        elements which are not expected and not listed in the schema are removed,
+        missing mandatory elements are added.
+        Removed lines are left empty, so the line numbers of the following errors
+        still match the original file.
+
+        Args:
+            xml_lines (list): lines of the xml
+            line_error (int): line number where the error occured
+            error_message (str): error message that is produced by lxml
+            schema_content (str): content of the schema
+
+        Returns:
+            list: fixed lines or None if the error can't be fixed
+
+        """
+
+        if search(r"(Element ')(.*?)(')", error_message) is None:
+            return None
+        content_error = search(r"(Element ')(.*?)(')", error_message).group(2)
+        fix_error = f"</{content_error}>"
+
+        my_xml_list = list(xml_lines)
+        if "This element is not expected" in error_message and search(content_error, schema_content) is None:
+            # Element causing the error is not listed in the schema: remove it with all its children
+            line = line_error - 1
+            if fix_error in my_xml_list[line] or ("/>" in my_xml_list[line] and "<" not in my_xml_list[line]) or \
+                    search(f"<{content_error}[^>]*/>", my_xml_list[line]):
+                my_xml_list[line] = ""
+            else:
+                my_xml_list[line] = ""
+                line += 1
+                while line < len(my_xml_list) and fix_error not in my_xml_list[line]:
+                    my_xml_list[line] = ""
+                    line += 1
+                if line < len(my_xml_list):
+                    my_xml_list[line] = ""
+        elif "Expected is one of" in error_message:
+            return None  # Element causing the error is listed in the schema
+        elif "Expected is (" in error_message:
+            expected_element = search(
+                r'(Expected is \(\ )(.*?)( \)\.)', error_message).group(2)
+            my_xml_list[line_error - 1] = sub(
+                r'( *)(\<)', r'\1' +
+                f'<{expected_element}></{expected_element}>' + r'\2',
+                my_xml_list[line_error - 1],
+                count=1
+            )
+
+        if my_xml_list == xml_lines:
+            return None
+        return my_xml_list
+
+    def validate_all_errors(self, xml_file: str, debug: bool = False) -> list:
+        """
+        Returns all schema errors of a xml file in one call.
+        All errors reported by lxml in a validation pass are collected from the error log.
+        Because lxml stops checking the content of an element after some errors,
+        the first error that can be fixed is then fixed in memory (see _fix_error_in_memory)
+        and the xml is validated again, until no new errors are found or an error can't be fixed.
+        The file itself is never modified and the schema is compiled only once.
+
+        Args:
+            xml_file (str): path to the xml file to validate
+            debug (bool, optional): If True, the errors of each pass are printed. Defaults to False.
+
+        Returns:
+            list: (line, message) of every error, in the order in which they were found
+
+        """
+
+        with open(xml_file, "r", encoding="utf-8") as _:
+            xml_content = _.read()
+
+        schema, _ = self._get_schema_url_and_root(linearize_xml(xml_content))
+        compiled_schema = get_compiled_schema(schema, self._schema_cache_dir)
+        schema_content = None
+
+        errors = []
+        xml_lines = xml_content.split("\n")
+        while True:
+            try:
+                xml_tree = etree.fromstring("\n".join(xml_lines).encode("utf-8"))
+            except etree.XMLSyntaxError as error:
+                errors.append((error.lineno, error.msg))
+                break
+            if compiled_schema.validate(xml_tree):
+                break
+            pass_errors = []
+            for error in compiled_schema.error_log:
+                if (error.line, error.message) not in pass_errors:
+                    pass_errors.append((error.line, error.message))
+            new_errors = [error for error in pass_errors if error not in errors]
+            if debug:
+                print(f"new errors: {new_errors}")
+            if not new_errors:
+                break
+            errors += new_errors
+            if schema_content is None:
+                schema_content = self._new_urlopen(schema)
+            for line, message in pass_errors:  # fix the first error that can be fixed
+                fixed_lines = self._fix_error_in_memory(xml_lines, line, message, schema_content)
+                if fixed_lines is not None:
+                    break
+            if fixed_lines is None:
+                break
+            xml_lines = fixed_lines
+        return errors
+
     def validate_xml(
             self,
             xml_file: str,
             mode: bool = False,
-            debug: bool = False) -> str:
+            debug: bool = False) -> tuple:
         """
         Main file of the script. It calls all function in the right order to validate
         a XML document against a schema:
@@ -258,12 +488,9 @@ class XmlSchemaValidator():
         2. Linearize the XML document with the linearize_xml() function
         3. Obtain a list containing two strings ( [schema, root_part] ) with
         the _get_schema_url_and_root() fct. and safe them respectively into variables
-        4. Open and save the content of the schema with the _new_urlopen() function
-        5. Modify schema content with the functions:
-        - linearize_xml(),
-        - delete_first_line(),
-        - _add_root_path_to_schema_location()
-        6. Validate the schema with the _lxml_parser_all_errors() function
+        4. Get the compiled schema with get_compiled_schema(), which reads the schema
+        and its includes from the local catalog and compiles it only once per process
+        5. Validate the schema with the _lxml_parser_all_errors() function
 
         Args:
             xml_file (str): path to the xml file to validate
@@ -275,7 +502,7 @@ class XmlSchemaValidator():
             Defaults to False.
 
         Returns:
-            str: Result of the validation
+            tuple: (line, message) of the first error, None if the xml is valid or if mode is True
 
         """
 
@@ -289,44 +516,208 @@ class XmlSchemaValidator():
 
         schema, root_part = self._get_schema_url_and_root(xml_content)
 
-        schema_content = self._new_urlopen(schema)
-        schema_content = delete_first_line(schema_content)
-        schema_content = linearize_xml(schema_content)
-        schema_content = self._add_root_path_to_schema_location(
-            schema_content, root_part)
+        if self._result_store is not None and mode is False:
+            schema_hash = ResultStore.rules_hash(get_schema_hash(schema, self._schema_cache_dir))
+            stored = self._result_store.get("xml_schema", xml_file, schema_hash)
+            if stored is not None:
+                if stored["result"] is not None:
+                    print("Validation error(s):")
+                if debug:
+                    print(f"error: {stored['result']}")
+                return stored["result"]
+
+        compiled_schema = get_compiled_schema(schema, self._schema_cache_dir)
 
         # lxml part for each error
         if mode is True:
-            error = self._lxml_parser_all_errors(schema_content, xml_file)
-            original_error = error
-            run_num = 1
-            while True:
-                if debug:
-                    print(f"run_num: {run_num}")
-                error = self._lxml_parser_all_errors(schema_content, xml_file)
-                if error == original_error:
-                    if error is None and original_error is None and str(format_exc()).strip() == 'NoneType: None':
-                        print("2 No error found")
-                    else:
-                        print(f"2 Critical error found -> Can't resolve!\nerror: {error}\noriginal_error: {original_error}\nformat_exc: {format_exc()}")
-                    break
-                if debug:
-                    print(f"error: {error}")
-                if error is None:
-                    break
-                xml_file = self.test_delete_error(
-                    xml_file, error[0], error[1], schema)
-                run_num += 1
-                
+            errors = self.validate_all_errors(xml_file, debug=debug)
+            if errors:
+                print("Validation error(s):")
+                for ind, (line, message) in enumerate(errors):
+                    print(f"{ind}  Line {line}: {message}")
+            else:
+                print("No error found")
         else:
-            error = self._lxml_parser(schema_content, xml_file)
+            error = self._lxml_parser(compiled_schema, xml_file)
+            if self._result_store is not None:
+                self._result_store.put("xml_schema", xml_file, schema_hash, error)
             if debug:
                 print(f"error: {error}")
-            return 0
+            return error
 
         if isfile("edited_xml.xml"):
             remove("edited_xml.xml")
 
+    def get_schema_url(self, xml_file: str) -> str:
+        """Returns the xsi:noNamespaceSchemaLocation of a xml file,
+        reading only the beginning of the file when the root element is there (as it usually is).
+
+        Args:
+            xml_file (str): path to the xml file
+
+        Returns:
+            str: schema url or None
+        """
+        with open(xml_file, "r", encoding="utf-8") as _:
+            head = _.read(65536)
+            if search(r'noNamespaceSchemaLocation="', head) is None:
+                head += _.read()
+        schema, _ = self._get_schema_url_and_root(head)
+        return schema
+
+    def get_errors(self, xml_file: str, all_errors: bool = False) -> list:
+        """Returns the schema errors of a xml file without printing anything.
+
+        Args:
+            xml_file (str): path to the xml file
+            all_errors (bool, optional): If True, use validate_all_errors, otherwise only the errors
+                found by a single validation pass are returned. Defaults to False.
+
+        Returns:
+            list: (line, message) of every error
+        """
+        if all_errors:
+            return self.validate_all_errors(xml_file)
+        compiled_schema = get_compiled_schema(self.get_schema_url(xml_file), self._schema_cache_dir)
+        try:
+            xml_tree = etree.parse(xml_file)
+        except etree.XMLSyntaxError as error:
+            return [(error.lineno, error.msg)]
+        if compiled_schema.validate(xml_tree):
+            return []
+        errors = []
+        for error in compiled_schema.error_log:
+            if (error.line, error.message) not in errors:
+                errors.append((error.line, error.message))
+        return errors
+
+    def validate_directory(
+            self,
+            dir_path: str,
+            workers: int = None,
+            all_errors: bool = False,
+            export: str = None,
+            changed_only: bool = False) -> dict:
+        """
+        Validates all xml files of a directory against their schemas with a pool of processes.
+        The files are grouped by their xsi:noNamespaceSchemaLocation and sent to the workers in that order,
+        so that every worker compiles each schema only once and keeps it for all the following files.
+        If a result store is set (see set_result_store), unchanged files are not validated again.
+
+        Args:
+            dir_path (str): directory containing the xml files
+            workers (int, optional): Number of processes. Defaults to the number of CPUs.
+            all_errors (bool, optional): Find all errors of each file with validate_all_errors. Defaults to False.
+            export (str, optional): "json" or "excel" to export the results to the export path. Defaults to None.
+            changed_only (bool, optional): Leave unchanged files out of the results. Defaults to False.
+
+        Returns:
+            dict: {filename: {"schema": url, "valid": bool, "errors": [{"line": int, "message": str}]}}
+        """
+        results = {}
+        groups = {}
+        for xml_file in sorted(listdir(dir_path)):
+            if not xml_file.lower().endswith(".xml") or not isfile(join(dir_path, xml_file)):
+                continue
+            schema = self.get_schema_url(join(dir_path, xml_file))
+            if schema is None:
+                results[xml_file] = {
+                    "schema": None,
+                    "valid": False,
+                    "errors": [{"line": None, "message": "No xsi:noNamespaceSchemaLocation found"}]
+                }
+                continue
+            groups.setdefault(schema, []).append(join(dir_path, xml_file))
+
+        to_validate = []
+        schema_hashes = {}
+        for schema, xml_files in groups.items():
+            if self._result_store is not None:
+                schema_hashes[schema] = ResultStore.rules_hash(get_schema_hash(schema, self._schema_cache_dir), all_errors)
+            for xml_file in xml_files:
+                stored = None
+                if self._result_store is not None:
+                    stored = self._result_store.get("xml_schema_errors", xml_file, schema_hashes[schema])
+                if stored is None:
+                    to_validate.append((xml_file, schema))
+                elif not changed_only:
+                    results[basename(xml_file)] = stored["result"]
+
+        if to_validate:
+            chunksize = max(1, len(to_validate) // ((workers or cpu_count() or 1) * 4))
+            with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_schema_worker,
+                    initargs=(self._schema_cache_dir,)) as executor:
+                for xml_file, schema, errors in executor.map(
+                        _validate_schema_worker,
+                        [xml_file for xml_file, _ in to_validate],
+                        [schema for _, schema in to_validate],
+                        [all_errors] * len(to_validate),
+                        chunksize=chunksize):
+                    results[basename(xml_file)] = {
+                        "schema": schema,
+                        "valid": len(errors) == 0,
+                        "errors": [{"line": line, "message": message} for line, message in errors]
+                    }
+                    if self._result_store is not None:
+                        self._result_store.put("xml_schema_errors", xml_file, schema_hashes[schema], results[basename(xml_file)])
+
+        if export == "json":
+            with open(join(self.export_path, f"schema_validation_{basename(normpath(dir_path))}.json"), "w", encoding="utf-8") as _:
+                dump(results, _, indent=4)
+        elif export == "excel":
+            self._export_directory_results(results, join(self.export_path, f"schema_validation_{basename(normpath(dir_path))}.xlsx"))
+        return results
+
+    def _export_directory_results(self, results: dict, excel_path: str):
+        """Writes the results of validate_directory to an Excel file, one row per error.
+
+        Args:
+            results (dict): results of validate_directory
+            excel_path (str): path of the Excel file
+        """
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "Schema Validation"
+        for column, header in enumerate(("File", "Schema", "Line", "Message"), start=1):
+            sheet.cell(row=1, column=column).value = header
+            sheet.cell(row=1, column=column).font = Font(bold=True)
+            sheet.cell(row=1, column=column).alignment = Alignment(horizontal='center')
+        row = 2
+        for xml_file, result in results.items():
+            for error in result["errors"] or [{"line": None, "message": "Valid"}]:
+                sheet.cell(row=row, column=1).value = xml_file
+                sheet.cell(row=row, column=2).value = result["schema"]
+                sheet.cell(row=row, column=3).value = error["line"]
+                sheet.cell(row=row, column=4).value = error["message"]
+                if not result["valid"]:
+                    sheet.cell(row=row, column=4).fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+                row += 1
+        workbook.save(excel_path)
+
+
+_WORKER_VALIDATOR = None
+
+
+def _init_schema_worker(cache_dir: str):
+    """Creates the XmlSchemaValidator of a worker process, see XmlSchemaValidator.validate_directory.
+    The compiled schemas stay in the process for all the files the worker validates.
+    """
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = XmlSchemaValidator()
+    _WORKER_VALIDATOR.set_schema_cache_dir(cache_dir)
+
+
+def _validate_schema_worker(xml_file: str, schema: str, all_errors: bool) -> tuple:
+    """Validates one xml in a worker process, see XmlSchemaValidator.validate_directory.
+    """
+    try:
+        errors = _WORKER_VALIDATOR.get_errors(xml_file, all_errors)
+    except Exception as error:  # e.g. the schema could not be downloaded or compiled
+        errors = [(None, f"{type(error).__name__}: {error}")]
+    return xml_file, schema, errors
+
 
 class Punctuation():
     def __init__(self) -> None:
@@ -0,0 +1,89 @@
+"""Micro-benchmark of the row line matching of the STE dictionary (acd.extract_rows.locate_rows).
+
+Generates a synthetic dictionary page with a blue and solid black line rules and compares
+pyautogui.locateAll, used before, with locate_rows.
+
+    python benchmarks/locate_rows.py --pages 20
+"""
+from os import remove
+from os.path import join
+from os.path import dirname
+from os.path import abspath
+
+from time import perf_counter
+from argparse import ArgumentParser
+from tempfile import gettempdir
+
+import sys
+
+from numpy import full
+from numpy import zeros
+from numpy import uint8
+from PIL import Image
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from pyautogui import locateAll  # noqa: E402
+
+from acd.extract_rows import locate_rows  # noqa: E402
+
+BLUE_ROWS = (50, 700)
+BLACK_ROWS = (120, 260, 400, 1300)
+NEAR_MISS_ROW = 1100  # a black rule with one pixel off, must not be found
+
+
+def make_templates() -> tuple:
+    blue = zeros((3, 600, 3), uint8)
+    blue[..., 2] = 255
+    black = zeros((2, 600, 3), uint8)  # zero norm, never matches with a normalized difference
+    templates = []
+    for name, template in (("blue", blue), ("black", black)):
+        templates.append(join(gettempdir(), f"acd_locate_rows_{name}.png"))
+        Image.fromarray(template).save(templates[-1])
+    return tuple(templates)
+
+
+def make_page() -> Image.Image:
+    page = full((1500, 800, 3), 255, uint8)
+    page[::7, ::3] = 128  # text like noise
+    for row in BLUE_ROWS:
+        page[row:row + 3, 100:700, :2] = 0
+        page[row:row + 3, 100:700, 2] = 255
+    for row in BLACK_ROWS:
+        page[row:row + 2, 100:700] = 0
+    page[NEAR_MISS_ROW:NEAR_MISS_ROW + 2, 100:700] = 0
+    page[NEAR_MISS_ROW, 105] = 1
+    return Image.fromarray(page)
+
+
+def locate_all(page: Image.Image, templates: tuple) -> list:
+    """The previous implementation, kept here as the baseline"""
+    return sorted({box.top for template in templates for box in locateAll(template, page)})
+
+
+def timed(function: callable, *args: any) -> tuple:
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--pages", type=int, default=20)
+    args = parser.parse_args()
+
+    templates = make_templates()
+    page = make_page()
+    try:
+        expected = sorted(BLUE_ROWS + BLACK_ROWS)
+        if locate_rows(page, templates) != expected:
+            raise AssertionError(f"locate_rows found {locate_rows(page, templates)}, expected {expected}")
+        baseline = sum(timed(locate_all, page, templates)[1] for _ in range(args.pages))
+        current = sum(timed(locate_rows, page, templates)[1] for _ in range(args.pages))
+        print(f"pages:       {args.pages}")
+        print(f"locateAll:   {baseline:.2f} s")
+        print(f"locate_rows: {current:.2f} s")
+        print(f"speedup:     {baseline / current:.2f}x")
+    finally:
+        for template in templates:
+            remove(template)
@@ -0,0 +1,112 @@
+"""Micro-benchmark of the compiled pattern registry (acd.patterns / acd.constants *_PATTERN).
+
+Generates a synthetic CMM with an IPL of the given size and compares the previous ipl_to_dict
+implementation (pattern strings, every search done twice) with the current one.
+
+    python benchmarks/regex_patterns.py --size-mb 50
+"""
+from regex import search  # as imported by ataispec2200
+from re import findall
+
+from os import remove
+from os.path import join
+from os.path import dirname
+from os.path import abspath
+
+from time import perf_counter
+from argparse import ArgumentParser
+from tempfile import gettempdir
+
+import sys
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from acd.ataispec2200 import ipl_to_dict  # noqa: E402
+from acd.constants import ITEMDATA_REGEX  # noqa: E402
+from acd.constants import ITEMNBR_REGEX  # noqa: E402
+from acd.constants import PNR_REGEX  # noqa: E402
+from acd.constants import KWD_REGEX  # noqa: E402
+from acd.constants import ADT_REGEX  # noqa: E402
+from acd.constants import MFR_REGEX  # noqa: E402
+from acd.constants import IPLNOM_REGEX  # noqa: E402
+
+ITEMDATA = """<itemdata itemnbr="{item:04d}" itemvar="A">
+<pnr>PN-{item:06d}</pnr><mfr>V{mfr:05d}</mfr>
+<iplnom><kwd>BOLT</kwd><adt>{adt}</adt></iplnom><upa>4</upa>
+</itemdata>
+"""
+
+# pnr and mfr outside of the itemdata must not end up in the items
+VENDLIST = """<vendlist><vendata><mfr>V0AAA1</mfr><pnr>PN-VENDOR</pnr><iplnom><kwd>NUT</kwd></iplnom></vendata></vendlist>
+"""
+
+
+def ipl_to_dict_strings(xml: str) -> dict:
+    """ipl_to_dict before the compiled patterns, kept here as the baseline"""
+    ipl_dict = {}
+    with open(xml, "r", encoding="utf-8") as xml_in:
+        content = xml_in.read().replace("\n", "")
+    if search(ITEMDATA_REGEX, content):
+        for itemdata in findall(ITEMDATA_REGEX, content):
+            itemdata = "".join(itemdata)
+            itemnbr = ""
+            if search(ITEMNBR_REGEX, itemdata):
+                itemnbr = search(ITEMNBR_REGEX, itemdata).group(1)
+            if search(PNR_REGEX, itemdata):
+                ipl_dict[search(PNR_REGEX, itemdata).group(1)] = {"Nomenclature": "", "MFR": ""}
+                pnr = search(PNR_REGEX, itemdata).group(1)
+                if search(IPLNOM_REGEX, itemdata):
+                    if search(ADT_REGEX, itemdata):
+                        if "ASS" in search(ADT_REGEX, itemdata).group(1):
+                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(KWD_REGEX, itemdata).group(1) + " "
+                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(ADT_REGEX, itemdata).group(1)
+                        else:
+                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(ADT_REGEX, itemdata).group(1) + " "
+                            ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(KWD_REGEX, itemdata).group(1)
+                        ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"].strip()
+                    else:
+                        ipl_dict[pnr]["Nomenclature"] = ipl_dict[pnr]["Nomenclature"] + search(KWD_REGEX, itemdata).group(1)
+                    if search(MFR_REGEX, itemdata):
+                        ipl_dict[pnr]["MFR"] = ipl_dict[pnr]["MFR"] + search(MFR_REGEX, itemdata).group(1)
+                ipl_dict[pnr]["Itemnbr"] = itemnbr
+    return ipl_dict
+
+
+def make_cmm(path: str, size_mb: int):
+    with open(path, "w", encoding="utf-8") as _:
+        _.write('<?xml version="1.0" encoding="UTF-8"?>\n<cmm>' + VENDLIST + '<pgblk pgblknbr="10000"><ipl>\n')
+        size = 0
+        item = 0
+        while size < size_mb * 1024 * 1024:
+            chunk = ITEMDATA.format(item=item, mfr=item % 997, adt="ASSY" if item % 3 == 0 else "HEX HEAD")
+            _.write(chunk)
+            size += len(chunk)
+            item += 1
+        _.write("</ipl></pgblk>" + VENDLIST + "</cmm>\n")
+
+
+def timed(function: callable, *args: any) -> tuple:
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cmm = join(gettempdir(), f"acd_regex_benchmark_{args.size_mb}mb.xml")
+    make_cmm(cmm, args.size_mb)
+    try:
+        baseline = min(timed(ipl_to_dict_strings, cmm)[1] for _ in range(args.repeat))
+        current = min(timed(ipl_to_dict, cmm)[1] for _ in range(args.repeat))
+        if ipl_to_dict_strings(cmm) != ipl_to_dict(cmm):
+            raise AssertionError("ipl_to_dict results differ")
+        print(f"CMM: {args.size_mb} MB")
+        print(f"pattern strings:   {baseline:.2f} s")
+        print(f"compiled patterns: {current:.2f} s")
+        print(f"speedup:           {baseline / current:.2f}x")
+    finally:
+        remove(cmm)